@@ -0,0 +1,46 @@
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+BASELINE_FILE_PATH = Path(__file__).parent.parent / "baseline.json"
+
+
+@dataclass(slots=True, frozen=True)
+class BenchmarkResult:
+    """Throughput and peak memory of a benchmark.
+
+    Attributes:
+        entries_per_second (float): Best throughput of the repeated runs.
+        peak_memory (int): Peak memory in bytes allocated during a single run.
+    """
+
+    entries_per_second: float
+    peak_memory: int
+
+
+def load_baseline(path: Path, configuration: dict[str, Any]) -> dict[str, BenchmarkResult]:
+    """Load the stored baseline results by benchmark name. Returns no results if there is no baseline, or if it was stored with a different configuration, as the results cannot be compared then."""
+
+    if not path.exists():
+        return {}
+    baseline = json.loads(path.read_text())
+    if baseline["configuration"] != configuration:
+        print(f"Ignoring the baseline in {path}, as it was stored with another configuration.")
+        return {}
+    return {name: BenchmarkResult(**result) for name, result in baseline["results"].items()}
+
+
+def save_baseline(path: Path, configuration: dict[str, Any], results: dict[str, BenchmarkResult]) -> None:
+    """Store the results as the baseline for later runs with the same configuration."""
+
+    baseline = {"configuration": configuration, "results": {name: asdict(result) for name, result in results.items()}}
+    path.write_text(json.dumps(baseline, indent=4) + "\n")
+
+
+def is_regression(result: BenchmarkResult, baseline: BenchmarkResult, tolerance: float) -> bool:
+    """Check whether the throughput has dropped or the peak memory has grown by more than the tolerance compared to the baseline, e.g. `0.2` for 20%."""
+
+    is_slower = result.entries_per_second < baseline.entries_per_second * (1 - tolerance)
+    uses_more_memory = result.peak_memory > baseline.peak_memory * (1 + tolerance)
+    return is_slower or uses_more_memory
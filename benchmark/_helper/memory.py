@@ -0,0 +1,15 @@
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+
+def measure_peak_memory(function: Callable[[], Any]) -> int:
+    """Run the function once and return the peak memory in bytes that was allocated while it ran. This is measured in a separate run from the throughput, as tracing the allocations slows down the function."""
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_memory
@@ -0,0 +1,114 @@
+import random
+from dataclasses import dataclass
+
+from index_now.sitemap.parse import SitemapUrl
+
+CHANGE_FREQUENCIES = ["always", "hourly", "daily", "weekly", "monthly", "yearly", "never"]
+
+
+def generate_url_entry(number: int, randomizer: random.Random, field_density: float = 1.0) -> str:
+    """Generate a synthetic `<url>` element, where each optional attribute is included with the probability of the field density."""
+
+    return (
+        "<url>"
+        f"<loc>https://example.com/page{number}</loc>"
+        + (
+            f"<lastmod>2025-{randomizer.randint(1, 12):02d}-{randomizer.randint(1, 28):02d}</lastmod>"
+            if randomizer.random() < field_density
+            else ""
+        )
+        + (
+            f"<changefreq>{randomizer.choice(CHANGE_FREQUENCIES)}</changefreq>"
+            if randomizer.random() < field_density
+            else ""
+        )
+        + (f"<priority>{randomizer.randint(0, 10) / 10}</priority>" if randomizer.random() < field_density else "")
+        + "</url>"
+    )
+
+
+def generate_sitemap_content(
+    number_of_urls: int, seed: int = 0, field_density: float = 1.0, first_number: int = 0
+) -> bytes:
+    """Generate a synthetic XML sitemap. By default, every `<url>` element has all optional attributes."""
+
+    randomizer = random.Random(seed)
+    url_entries = "".join(
+        generate_url_entry(number, randomizer, field_density)
+        for number in range(first_number, first_number + number_of_urls)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{url_entries}</urlset>'
+    ).encode()
+
+
+def generate_sitemap_index_content(sitemap_locations: list[str]) -> bytes:
+    """Generate a synthetic XML sitemap index that links to nested sitemaps."""
+
+    sitemap_entries = "".join(f"<sitemap><loc>{location}</loc></sitemap>" for location in sitemap_locations)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{sitemap_entries}</sitemapindex>'
+    ).encode()
+
+
+@dataclass(slots=True, frozen=True)
+class SitemapShape:
+    """Shape of a synthetic website with a tree of nested sitemaps.
+
+    Attributes:
+        number_of_urls (int): Total number of URLs across all sitemaps.
+        urls_per_sitemap (int): Number of URLs per sitemap, where the protocol allows up to 50,000.
+        fan_out (int): Maximum number of nested sitemaps per sitemap index, which determines the depth of the tree.
+        field_density (float): Probability that each optional attribute of a `<url>` element is included.
+    """
+
+    number_of_urls: int = 1_000_000
+    urls_per_sitemap: int = 50_000
+    fan_out: int = 10
+    field_density: float = 1.0
+
+
+def generate_sitemap_files(base_url: str, shape: SitemapShape, seed: int = 0) -> tuple[dict[str, bytes], int]:
+    """Generate the files of a synthetic website, where the root sitemap index is served at `/sitemap_index.xml`.
+
+    Returns:
+        tuple[dict[str, bytes], int]: The content of each sitemap by path, and the number of levels of sitemaps.
+    """
+
+    files: dict[str, bytes] = {}
+    paths: list[str] = []
+    for index, first_number in enumerate(range(0, shape.number_of_urls, shape.urls_per_sitemap)):
+        path = f"/sitemap{index}.xml"
+        number_of_urls = min(shape.urls_per_sitemap, shape.number_of_urls - first_number)
+        files[path] = generate_sitemap_content(number_of_urls, seed + index, shape.field_density, first_number)
+        paths.append(path)
+
+    depth = 1
+    while True:
+        depth += 1
+        groups = [paths[start : start + shape.fan_out] for start in range(0, len(paths), shape.fan_out)]
+        if len(groups) == 1:
+            files["/sitemap_index.xml"] = generate_sitemap_index_content([f"{base_url}{path}" for path in groups[0]])
+            return files, depth
+        paths = []
+        for index, group in enumerate(groups):
+            path = f"/index{depth}_{index}.xml"
+            files[path] = generate_sitemap_index_content([f"{base_url}{path}" for path in group])
+            paths.append(path)
+
+
+def generate_sitemap_urls(number_of_urls: int, seed: int = 0) -> list[SitemapUrl]:
+    """Generate synthetic sitemap URLs with all optional attributes, without the overhead of parsing XML."""
+
+    randomizer = random.Random(seed)
+    return [
+        SitemapUrl(
+            loc=f"https://example.com/section{number % 10}/page{number}",
+            lastmod=f"2025-{randomizer.randint(1, 12):02d}-{randomizer.randint(1, 28):02d}T12:00:00+00:00",
+            changefreq=randomizer.choice(CHANGE_FREQUENCIES),
+            priority=randomizer.randint(0, 10) / 10,
+        )
+        for number in range(number_of_urls)
+    ]
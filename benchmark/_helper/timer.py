@@ -0,0 +1,14 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+def measure_entries_per_second(function: Callable[[], Any], number_of_entries: int, repeat: int = 5) -> float:
+    """Run the function a number of times and return the best throughput in entries per second."""
+
+    best_duration = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best_duration = min(best_duration, time.perf_counter() - start)
+    return number_of_entries / best_duration
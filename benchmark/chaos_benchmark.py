@@ -0,0 +1,63 @@
+import argparse
+import time
+
+from colorist import Color
+
+from index_now import IndexNowAuthentication, IndexNowClient, configure_logging, submit_urls_to_index_now
+from index_now.testing import IndexNowStandInServer
+
+AUTHENTICATION = IndexNowAuthentication(
+    host="example.com", api_key="a1b2c3d4", api_key_location="https://example.com/a1b2c3d4.txt"
+)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure throughput and retries of the client against a local IndexNow server that injects failures."
+    )
+    parser.add_argument("--urls", type=int, default=200_000, help="Number of URLs to submit.")
+    parser.add_argument("--batch-size", type=int, default=1_000, help="Number of URLs per request.")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds the server waits before each response.")
+    parser.add_argument("--max-retries", type=int, default=5, help="Maximum number of retries of the client.")
+    parser.add_argument("--backoff-factor", type=float, default=0.05, help="Backoff factor of the client in seconds.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the injected failures.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    arguments = parse_arguments()
+    configure_logging(quiet=True)
+    urls = [f"https://example.com/page{number}" for number in range(arguments.urls)]
+    scenarios: dict[str, dict[str, object]] = {
+        "No failures": {},
+        "10% server errors": {"failure_rate": 0.1, "failure_status_codes": [500, 502, 503]},
+        "25% server errors": {"failure_rate": 0.25, "failure_status_codes": [500, 502, 503]},
+        "10% throttling with Retry-After": {"failure_rate": 0.1, "failure_status_codes": [429], "retry_after": 1},
+    }
+    print(
+        f"Submitting {arguments.urls:,} URLs in batches of {arguments.batch_size:,} with a latency of {arguments.latency}s:"
+    )
+    for name, failures in scenarios.items():
+        with (
+            IndexNowStandInServer(
+                latency=arguments.latency,
+                seed=arguments.seed,
+                record_requests=False,
+                **failures,  # type: ignore[arg-type]
+            ) as server,
+            IndexNowClient(max_retries=arguments.max_retries, backoff_factor=arguments.backoff_factor) as client,
+        ):
+            start = time.perf_counter()
+            result = submit_urls_to_index_now(AUTHENTICATION, urls, server.endpoint, client, arguments.batch_size)
+            duration = time.perf_counter() - start
+            statistics = server.statistics
+        retries = statistics.submission_count - len(result.batches)
+        print(
+            f"  {name:<32} {Color.GREEN}{statistics.accepted_url_count / duration:>10,.0f}{Color.OFF} URLs/second "
+            f"{Color.GREEN}{retries:>5}{Color.OFF} retries, status code {result.status_code}, "
+            f"responses {statistics.status_code_counts}"
+        )
+
+
+if __name__ == "__main__":
+    main()
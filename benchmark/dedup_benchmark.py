@@ -0,0 +1,80 @@
+import random
+import tracemalloc
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+
+from _helper.timer import measure_entries_per_second
+from colorist import Color
+
+from index_now.url.dedup import UrlDeduplicator
+
+NUMBER_OF_URLS = 1_000_000
+
+DUPLICATE_FRACTION = 0.25
+
+
+def generate_urls_with_duplicates(number_of_urls: int, seed: int = 0) -> Iterator[str]:
+    """Lazily generate unique URLs mixed with duplicates of earlier URLs, as when merging overlapping sitemaps. Each URL is a new string, as if it had just been parsed."""
+
+    randomizer = random.Random(seed)
+    for number in range(number_of_urls):
+        yield f"https://example.com/section{number % 10}/page{number}"
+        if number and randomizer.random() < DUPLICATE_FRACTION:
+            yield f"https://example.com/section{(duplicate := randomizer.randrange(number)) % 10}/page{duplicate}"
+
+
+def deduplicate_with_set(urls: Iterable[str]) -> Iterator[str]:
+    """Reference implementation that keeps a copy of every URL seen so far."""
+
+    seen_urls: set[str] = set()
+    for url in urls:
+        if url not in seen_urls:
+            seen_urls.add(url)
+            yield url
+
+
+def measure_peak_memory_of_stream(deduplicate: Callable[[Iterable[str]], Iterator[str]]) -> int:
+    """Measure the peak memory in bytes of deduplicating a stream of URLs, where the unique URLs are consumed and discarded, as when they are submitted in batches."""
+
+    urls = generate_urls_with_duplicates(NUMBER_OF_URLS)
+    tracemalloc.start()
+    deque(deduplicate(urls), maxlen=0)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_memory
+
+
+def main() -> None:
+    urls = list(generate_urls_with_duplicates(NUMBER_OF_URLS))
+    expected_urls = list(dict.fromkeys(urls))
+    assert len(expected_urls) == NUMBER_OF_URLS
+
+    print(f"Deduplicating {len(urls):,} URLs, of which {NUMBER_OF_URLS:,} are unique:")
+    engines = {
+        "dict.fromkeys (reference)": lambda: list(dict.fromkeys(urls)),
+        "set[str]": lambda: list(deduplicate_with_set(urls)),
+        "UrlDeduplicator": lambda: list(UrlDeduplicator().filter(urls)),
+        "UrlDeduplicator, presized": lambda: list(UrlDeduplicator(len(urls)).filter(urls)),
+    }
+    reference_entries_per_second = None
+    for name, engine in engines.items():
+        assert engine() == expected_urls, f"{name} does not produce the same URLs as the reference"
+        entries_per_second = measure_entries_per_second(engine, len(urls), repeat=3)
+        reference_entries_per_second = reference_entries_per_second or entries_per_second
+        print(
+            f"  {name:<30} {Color.GREEN}{entries_per_second:>14,.0f}{Color.OFF} entries/second "
+            f"({entries_per_second / reference_entries_per_second:.2f}x)"
+        )
+
+    print(f"Peak memory per {NUMBER_OF_URLS:,} unique URLs when deduplicating a stream:")
+    streaming_engines: dict[str, Callable[[Iterable[str]], Iterator[str]]] = {
+        "set[str] (reference)": deduplicate_with_set,
+        "UrlDeduplicator": UrlDeduplicator().filter,
+    }
+    for name, deduplicate in streaming_engines.items():
+        peak_memory = measure_peak_memory_of_stream(deduplicate)
+        print(f"  {name:<30} {Color.GREEN}{peak_memory / 1024 / 1024:>14,.1f}{Color.OFF} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import re
+import tracemalloc
+from datetime import datetime
+
+from _helper.sitemap import generate_sitemap_urls
+from _helper.timer import measure_entries_per_second
+from colorist import Color
+
+from index_now import ChangeFrequency, DateRange, Day, SitemapFilter, configure_logging
+from index_now.sitemap.filter.sitemap import filter_sitemap_urls
+from index_now.sitemap.parse import SitemapUrl
+from index_now.sitemap.table import SitemapUrlTable
+
+NUMBER_OF_URLS = 1_000_000
+
+FILTERS = {
+    "All criteria": SitemapFilter(
+        change_frequency=ChangeFrequency.DAILY,
+        date_range=DateRange(start=datetime(2025, 3, 1), end=datetime(2025, 9, 30)),
+        contains=r"section[1-5]",
+        excludes=r"page\d*7$",
+    ),
+    "Date range only": SitemapFilter(date_range=DateRange(start=datetime(2025, 3, 1), end=datetime(2025, 9, 30))),
+    "Single day": SitemapFilter(date_range=Day(datetime(2025, 6, 15))),
+    "Contains and take 100": SitemapFilter(contains="section3", take=100),
+}
+
+
+def filter_sitemap_urls_in_multiple_passes(urls: list[SitemapUrl], filter: SitemapFilter) -> list[str]:
+    """Reference implementation that builds a new list per criterion and parses every `<lastmod>` value."""
+
+    if filter.change_frequency is not None:
+        change_frequency = str(filter.change_frequency).lower()
+        urls = [url for url in urls if not url.changefreq or url.changefreq.lower() == change_frequency]
+    if filter.date_range is not None:
+        date_range = filter.date_range
+        urls = [
+            url for url in urls if not url.lastmod or date_range.is_within_range(datetime.fromisoformat(url.lastmod))
+        ]
+    if filter.contains is not None:
+        urls = [url for url in urls if re.compile(filter.contains).search(url.loc)]
+    if filter.excludes is not None:
+        urls = [url for url in urls if not re.compile(filter.excludes).search(url.loc)]
+    if filter.skip is not None:
+        urls = urls[filter.skip :]
+    if filter.take is not None:
+        urls = urls[: filter.take]
+    return [url.loc for url in urls]
+
+
+def main() -> None:
+    configure_logging(quiet=True)
+    tracemalloc.start()
+    urls = generate_sitemap_urls(NUMBER_OF_URLS)
+    list_size = tracemalloc.get_traced_memory()[0]
+    table = SitemapUrlTable(urls)
+    table_size = tracemalloc.get_traced_memory()[0] - list_size
+    tracemalloc.stop()
+    indexed_table = SitemapUrlTable()
+    indexed_table.extend(table)
+    indexed_table.create_lastmod_index()
+    print(f"Memory of {NUMBER_OF_URLS:,} sitemap URLs:")
+    print(f"  {'list[SitemapUrl]':<30} {Color.GREEN}{list_size / 1024 / 1024:>14,.1f}{Color.OFF} MB")
+    print(f"  {'SitemapUrlTable':<30} {Color.GREEN}{table_size / 1024 / 1024:>14,.1f}{Color.OFF} MB")
+
+    print(f"Filtering {NUMBER_OF_URLS:,} sitemap URLs:")
+    for filter_name, filter in FILTERS.items():
+        compiled_filter = filter.compile()
+        expected_urls = filter_sitemap_urls_in_multiple_passes(urls, filter)
+        engines = {
+            "Multiple passes (reference)": lambda: filter_sitemap_urls_in_multiple_passes(urls, filter),
+            "Single pass": lambda: filter_sitemap_urls(urls, filter),
+            "Single pass, precompiled": lambda: compiled_filter.filter(urls),
+            "Columnar table": lambda: compiled_filter.filter_table_with_report(table).urls,
+            "Columnar table, lastmod index": lambda: compiled_filter.filter_table_with_report(indexed_table).urls,
+        }
+
+        print(f"{filter_name} ({len(expected_urls):,} URLs left):")
+        reference_entries_per_second = None
+        for name, engine in engines.items():
+            assert engine() == expected_urls, f"{name} does not produce the same URLs as the reference"
+            entries_per_second = measure_entries_per_second(engine, NUMBER_OF_URLS, repeat=3)
+            reference_entries_per_second = reference_entries_per_second or entries_per_second
+            print(
+                f"  {name:<30} {Color.GREEN}{entries_per_second:>14,.0f}{Color.OFF} entries/second "
+                f"({entries_per_second / reference_entries_per_second:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import lxml.etree
+from _helper.sitemap import generate_sitemap_content
+from _helper.timer import measure_entries_per_second
+from colorist import Color
+
+from index_now.sitemap.parse import (
+    SITEMAP_SCHEMA_NAMESPACE,
+    SitemapEntryType,
+    SitemapUrl,
+    iterparse_sitemap_xml_and_get_urls_as_elements,
+    parse_sitemap_xml_and_get_urls_as_elements,
+    parse_sitemap_xml_and_get_xpath_objects,
+)
+
+NUMBER_OF_URLS = 45_000
+
+
+def parse_sitemap_xml_and_get_urls_as_elements_with_xpath_per_attribute(sitemap_content: bytes) -> list[SitemapUrl]:
+    """Reference implementation that evaluates one XPath expression per attribute of each `<url>` element."""
+
+    urls: list[SitemapUrl] = []
+    for sitemap_element in parse_sitemap_xml_and_get_xpath_objects(
+        sitemap_content, SitemapEntryType.URL, loc_only=False
+    ):
+        loc = sitemap_element.xpath("ns:loc/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)[0].strip()
+        lastmod = next(iter(sitemap_element.xpath("ns:lastmod/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)), None)
+        changefreq = next(
+            iter(sitemap_element.xpath("ns:changefreq/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)), None
+        )
+        priority = next(iter(sitemap_element.xpath("ns:priority/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)), None)
+        urls.append(
+            SitemapUrl(
+                loc=str(loc),
+                lastmod=str(lastmod) if lastmod else None,
+                changefreq=str(changefreq) if changefreq else None,
+                priority=float(priority) if priority is not None else None,
+            )
+        )
+    return urls
+
+
+def parse_sitemap_xml_and_get_urls_as_elements_with_precompiled_xpath(sitemap_content: bytes) -> list[SitemapUrl]:
+    """Alternative implementation with precompiled XPath objects for each attribute."""
+
+    loc_xpath = lxml.etree.XPath("ns:loc/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)
+    lastmod_xpath = lxml.etree.XPath("ns:lastmod/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)
+    changefreq_xpath = lxml.etree.XPath("ns:changefreq/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)
+    priority_xpath = lxml.etree.XPath("ns:priority/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)
+    urls: list[SitemapUrl] = []
+    for sitemap_element in parse_sitemap_xml_and_get_xpath_objects(
+        sitemap_content, SitemapEntryType.URL, loc_only=False
+    ):
+        lastmod = next(iter(lastmod_xpath(sitemap_element)), None)
+        changefreq = next(iter(changefreq_xpath(sitemap_element)), None)
+        priority = next(iter(priority_xpath(sitemap_element)), None)
+        urls.append(
+            SitemapUrl(
+                loc=str(loc_xpath(sitemap_element)[0]).strip(),
+                lastmod=str(lastmod) if lastmod else None,
+                changefreq=str(changefreq) if changefreq else None,
+                priority=float(priority) if priority is not None else None,
+            )
+        )
+    return urls
+
+
+def main() -> None:
+    sitemap_content = generate_sitemap_content(NUMBER_OF_URLS)
+    expected_urls = parse_sitemap_xml_and_get_urls_as_elements_with_xpath_per_attribute(sitemap_content)
+    engines = {
+        "XPath per attribute (reference)": lambda: parse_sitemap_xml_and_get_urls_as_elements_with_xpath_per_attribute(
+            sitemap_content
+        ),
+        "Precompiled XPath": lambda: parse_sitemap_xml_and_get_urls_as_elements_with_precompiled_xpath(sitemap_content),
+        "Single-pass child walk": lambda: parse_sitemap_xml_and_get_urls_as_elements(sitemap_content),
+        "Streaming pull parser": lambda: list(iterparse_sitemap_xml_and_get_urls_as_elements([sitemap_content])),
+    }
+
+    print(f"Parsing a sitemap with {NUMBER_OF_URLS:,} URLs ({len(sitemap_content) / 1024 / 1024:.1f} MB):")
+    reference_entries_per_second = None
+    for name, engine in engines.items():
+        assert list(engine()) == expected_urls, f"{name} does not produce the same URLs as the reference"
+        entries_per_second = measure_entries_per_second(engine, NUMBER_OF_URLS)
+        reference_entries_per_second = reference_entries_per_second or entries_per_second
+        print(
+            f"{name:<32} {Color.GREEN}{entries_per_second:>12,.0f}{Color.OFF} entries/second "
+            f"({entries_per_second / reference_entries_per_second:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
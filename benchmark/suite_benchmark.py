@@ -0,0 +1,180 @@
+import argparse
+import multiprocessing
+import socket
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from _helper.baseline import BASELINE_FILE_PATH, BenchmarkResult, is_regression, load_baseline, save_baseline
+from _helper.memory import measure_peak_memory
+from _helper.sitemap import SitemapShape, generate_sitemap_files
+from _helper.timer import measure_entries_per_second
+from colorist import Color
+
+from index_now import (
+    DateRange,
+    IndexNowAuthentication,
+    IndexNowClient,
+    SitemapFilter,
+    configure_logging,
+    stream_sitemap_to_index_now,
+    submit_sitemap_to_index_now,
+    submit_urls_to_index_now,
+)
+from index_now.sitemap.filter.sitemap import filter_sitemap_urls
+from index_now.sitemap.parse import parse_sitemap_xml_and_get_urls, parse_sitemap_xml_and_get_urls_as_elements
+from index_now.testing import IndexNowStandInServer
+
+AUTHENTICATION = IndexNowAuthentication(
+    host="example.com", api_key="a1b2c3d4", api_key_location="https://example.com/a1b2c3d4.txt"
+)
+
+FILTER = SitemapFilter(
+    date_range=DateRange(start=datetime(2025, 3, 1), end=datetime(2025, 9, 30)), excludes=r"page\d*7$"
+)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure throughput and peak memory of parsing, filtering and submitting synthetic sitemaps."
+    )
+    parser.add_argument("--urls", type=int, default=1_000_000, help="Total number of URLs across all sitemaps.")
+    parser.add_argument("--urls-per-sitemap", type=int, default=50_000, help="Number of URLs per sitemap.")
+    parser.add_argument("--fan-out", type=int, default=10, help="Maximum number of nested sitemaps per index.")
+    parser.add_argument("--field-density", type=float, default=1.0, help="Share of optional attributes included.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs, of which the fastest is reported.")
+    parser.add_argument("--only", default="", help="Only run the benchmarks whose name contains this text.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE_PATH, help="Path of the baseline file.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed change before a regression, e.g. 0.2.")
+    return parser.parse_args()
+
+
+def find_free_port() -> int:
+    """Find a free local port, so the locations of the sitemaps can be generated before the server is started."""
+
+    with socket.socket() as free_socket:
+        free_socket.bind(("127.0.0.1", 0))
+        port: int = free_socket.getsockname()[1]
+    return port
+
+
+def serve_until_terminated(files: dict[str, bytes], port: int, is_ready: Any) -> None:
+    with IndexNowStandInServer(files, port=port, record_requests=False):
+        is_ready.set()
+        threading.Event().wait()
+
+
+@contextmanager
+def run_stand_in_server_in_process(files: dict[str, bytes], port: int) -> Iterator[str]:
+    """Run the stand-in server in a separate process, so its allocations are not included when the peak memory of the benchmarks is measured.
+
+    Yields:
+        str: The base URL of the server.
+    """
+
+    is_ready = multiprocessing.Event()
+    process = multiprocessing.Process(target=serve_until_terminated, args=(files, port, is_ready), daemon=True)
+    process.start()
+    try:
+        is_ready.wait()
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.join()
+
+
+def assert_submitted(result: Any) -> None:
+    assert result.status_code == 200 and result.batches, f"Submission failed with status code {result.status_code}"
+
+
+def main() -> None:
+    arguments = parse_arguments()
+    configure_logging(quiet=True)
+    shape = SitemapShape(arguments.urls, arguments.urls_per_sitemap, arguments.fan_out, arguments.field_density)
+    port = find_free_port()
+    files, depth = generate_sitemap_files(f"http://127.0.0.1:{port}", shape)
+    sitemap_content = files["/sitemap0.xml"]
+    urls_of_one_sitemap = min(shape.urls_per_sitemap, shape.number_of_urls)
+    url_elements = [
+        url_element
+        for path, content in files.items()
+        if path.startswith("/sitemap") and path != "/sitemap_index.xml"
+        for url_element in parse_sitemap_xml_and_get_urls_as_elements(content)
+    ]
+    urls = [url_element.loc for url_element in url_elements]
+    print(
+        f"Synthetic website with {shape.number_of_urls:,} URLs in {len(files):,} sitemaps across {depth} levels "
+        f"({sum(map(len, files.values())) / 1024 / 1024:,.1f} MB):"
+    )
+
+    with run_stand_in_server_in_process(files, port) as server_url, IndexNowClient(max_retries=0) as client:
+        sitemap_location = f"{server_url}/sitemap_index.xml"
+        endpoint = f"{server_url}/indexnow"
+        benchmarks: dict[str, tuple[Callable[[], Any], int]] = {
+            "parse_sitemap_xml_and_get_urls": (
+                lambda: parse_sitemap_xml_and_get_urls(sitemap_content),
+                urls_of_one_sitemap,
+            ),
+            "parse_sitemap_xml_and_get_urls_as_elements": (
+                lambda: parse_sitemap_xml_and_get_urls_as_elements(sitemap_content),
+                urls_of_one_sitemap,
+            ),
+            "filter_sitemap_urls": (lambda: filter_sitemap_urls(url_elements, FILTER), len(url_elements)),
+            "submit_urls_to_index_now": (
+                lambda: assert_submitted(submit_urls_to_index_now(AUTHENTICATION, urls, endpoint, client)),
+                len(urls),
+            ),
+            "submit_sitemap_to_index_now": (
+                lambda: assert_submitted(
+                    submit_sitemap_to_index_now(AUTHENTICATION, sitemap_location, endpoint=endpoint, client=client)
+                ),
+                shape.number_of_urls,
+            ),
+            "stream_sitemap_to_index_now": (
+                lambda: assert_submitted(
+                    stream_sitemap_to_index_now(AUTHENTICATION, sitemap_location, endpoint=endpoint, client=client)
+                ),
+                shape.number_of_urls,
+            ),
+        }
+
+        configuration = {**asdict(shape), "python": sys.version.split()[0]}
+        baseline = load_baseline(arguments.baseline, configuration)
+        results: dict[str, BenchmarkResult] = {}
+        has_regression = False
+        for name, (function, number_of_entries) in benchmarks.items():
+            if arguments.only not in name:
+                continue
+            result = BenchmarkResult(
+                entries_per_second=measure_entries_per_second(function, number_of_entries, arguments.repeat),
+                peak_memory=measure_peak_memory(function),
+            )
+            results[name] = result
+            comparison = ""
+            if name in baseline:
+                speedup = result.entries_per_second / baseline[name].entries_per_second
+                memory_ratio = result.peak_memory / baseline[name].peak_memory
+                comparison = f"({speedup:.2f}x throughput, {memory_ratio:.2f}x memory vs. baseline)"
+                if is_regression(result, baseline[name], arguments.tolerance):
+                    has_regression = True
+                    comparison += f" {Color.RED}REGRESSION{Color.OFF}"
+            print(
+                f"  {name:<44} {Color.GREEN}{result.entries_per_second:>12,.0f}{Color.OFF} entries/second "
+                f"{Color.GREEN}{result.peak_memory / 1024 / 1024:>9,.1f}{Color.OFF} MB peak {comparison}"
+            )
+
+    if arguments.save_baseline:
+        save_baseline(arguments.baseline, configuration, {**baseline, **results})
+        print(f"Stored the results as the baseline in {arguments.baseline}")
+    if has_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
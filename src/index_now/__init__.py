@@ -1,11 +1,25 @@
 __all__ = [
     "IndexNowAuthentication",
+    "AuthenticationRegistry",
+    "IndexNowClient",
     "SearchEngineEndpoint",
     "submit_url_to_index_now",
     "submit_urls_to_index_now",
+    "submit_urls_to_multiple_endpoints",
+    "submit_urls_to_multiple_hosts",
+    "submit_url_stream_to_index_now",
+    "BufferedSubmitter",
     "submit_sitemap_to_index_now",
     "submit_sitemaps_to_index_now",
+    "stream_sitemap_to_index_now",
+    "SubmissionResult",
+    "BatchResult",
+    "SitemapOutcome",
     "SitemapFilter",
+    "FilterReport",
+    "SitemapUrlTable",
+    "UrlDeduplicator",
+    "SitemapCrawler",
     "ChangeFrequency",
     "DateRange",
     "Between",
@@ -18,11 +32,28 @@ __all__ = [
     "LaterThanAndIncluding",
     "EarlierThanAndIncluding",
     "generate_api_key",
+    "ExecutorStrategy",
+    "ParseExecutor",
+    "SitemapCache",
+    "SubmissionLedger",
+    "RateLimiter",
+    "SubmissionQueue",
+    "SubmissionWorker",
+    "configure_logging",
 ]
 
 from .api_key import generate_api_key
-from .authentication import IndexNowAuthentication
+from .authentication import AuthenticationRegistry, IndexNowAuthentication
+from .client import IndexNowClient
 from .endpoint import SearchEngineEndpoint
+from .executor import ExecutorStrategy, ParseExecutor
+from .ledger import SubmissionLedger
+from .log import configure_logging
+from .queue import SubmissionQueue, SubmissionWorker
+from .rate_limit import RateLimiter
+from .result import BatchResult, SitemapOutcome, SubmissionResult
+from .sitemap.cache import SitemapCache
+from .sitemap.crawl import SitemapCrawler
 from .sitemap.filter.change_frequency import ChangeFrequency
 from .sitemap.filter.date_range import (
     Between,
@@ -36,7 +67,16 @@ from .sitemap.filter.date_range import (
     Today,
     Yesterday,
 )
-from .sitemap.filter.sitemap import SitemapFilter
-from .sitemap.submit import submit_sitemap_to_index_now, submit_sitemaps_to_index_now
-from .url.submit import submit_url_to_index_now, submit_urls_to_index_now
+from .sitemap.filter.sitemap import FilterReport, SitemapFilter
+from .sitemap.submit import stream_sitemap_to_index_now, submit_sitemap_to_index_now, submit_sitemaps_to_index_now
+from .sitemap.table import SitemapUrlTable
+from .url.buffer import BufferedSubmitter
+from .url.dedup import UrlDeduplicator
+from .url.submit import (
+    submit_url_stream_to_index_now,
+    submit_url_to_index_now,
+    submit_urls_to_index_now,
+    submit_urls_to_multiple_endpoints,
+    submit_urls_to_multiple_hosts,
+)
 from .version import __version__  # noqa
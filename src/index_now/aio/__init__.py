@@ -0,0 +1,23 @@
+"""Asynchronous API for submitting URLs and sitemaps to IndexNow on an event loop, e.g. from aiohttp or FastAPI request handlers. Requires the optional `httpx` dependency: `pip install "index-now-for-python[async]"`"""
+
+__all__ = [
+    "AsyncIndexNowClient",
+    "async_submit_url_to_index_now",
+    "async_submit_urls_to_index_now",
+    "async_submit_url_stream_to_index_now",
+    "async_submit_sitemap_to_index_now",
+    "async_submit_sitemaps_to_index_now",
+    "async_get_sitemap_xml",
+    "async_get_multiple_sitemap_xml",
+    "async_controller_parse_sitemap_xml_and_get_urls",
+]
+
+from .client import AsyncIndexNowClient
+from .sitemap.get import async_get_multiple_sitemap_xml, async_get_sitemap_xml
+from .sitemap.parse import async_controller_parse_sitemap_xml_and_get_urls
+from .sitemap.submit import async_submit_sitemap_to_index_now, async_submit_sitemaps_to_index_now
+from .url.submit import (
+    async_submit_url_stream_to_index_now,
+    async_submit_url_to_index_now,
+    async_submit_urls_to_index_now,
+)
@@ -0,0 +1,143 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import Any
+
+try:
+    import httpx
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        'The asynchronous API requires httpx. Install it with: pip install "index-now-for-python[async]"'
+    ) from error
+
+from ..constant import (
+    DEFAULT_ASYNC_MAX_CONCURRENCY,
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_MAXSIZE,
+    RETRY_STATUS_CODES,
+    THROTTLE_STATUS_CODES,
+)
+from ..rate_limit import RateLimiter, compute_retry_delay
+
+
+class AsyncIndexNowClient:
+    """Asynchronous HTTP client with a keep-alive connection pool, which bounds the number of requests in flight, so thousands of submissions can be awaited on a single event loop.
+
+    Args:
+        max_concurrency (int, optional): Maximum number of requests in flight at the same time across all hosts.
+        max_keepalive_connections (int, optional): Maximum number of idle connections to keep alive in the pool.
+        max_retries (int, optional): Number of retries on connection errors and transient status codes such as `429` and `503`. Set to `0` to disable retries.
+        backoff_factor (float, optional): Factor for the exponential backoff with jitter between retries in seconds. A `Retry-After` header from the server takes precedence.
+        timeout (float | None, optional): Default timeout in seconds for each request. No timeout if set to `None`.
+        rate_limiter (RateLimiter | None, optional): Rate limiter with a token bucket per endpoint. If set to `None`, requests are not limited, but all requests to a host are still paused when it responds with `429` or `503`.
+
+    Example:
+        Create one client and share it across all calls, e.g. for the lifetime of a web application:
+
+        ```python linenums="1" hl_lines="12-13"
+        import asyncio
+        from index_now import IndexNowAuthentication
+        from index_now.aio import AsyncIndexNowClient, async_submit_url_to_index_now
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        async def main() -> None:
+            async with AsyncIndexNowClient(max_concurrency=50) as client:
+                await async_submit_url_to_index_now(authentication, "https://example.com/page1", client=client)
+
+        asyncio.run(main())
+        ```
+    """
+
+    __slots__ = ["http_client", "semaphore", "max_retries", "backoff_factor", "rate_limiter"]
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_ASYNC_MAX_CONCURRENCY,
+        max_keepalive_connections: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        timeout: float | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        if max_concurrency < 1 or max_keepalive_connections < 1:
+            raise ValueError("Max concurrency and max keep-alive connections must be at least 1.")
+        if max_retries < 0:
+            raise ValueError("Max retries cannot be negative.")
+
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_keepalive_connections)
+        self.http_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(limits=limits, retries=max_retries),
+            timeout=timeout,
+            follow_redirects=True,
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+    def __repr__(self) -> str:
+        return f"AsyncIndexNowClient(max_retries={self.max_retries}, rate_limiter={self.rate_limiter})"
+
+    async def __aenter__(self) -> "AsyncIndexNowClient":
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        await self.close()
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the connection pool. Transient status codes are retried with exponential backoff, and if the server throttles, all requests to the same host are paused until the `Retry-After` time has passed."""
+
+        bucket = self.rate_limiter.get_bucket(url)
+        attempt = 0
+        while True:
+            if wait := bucket.reserve():
+                await asyncio.sleep(wait)
+            async with self.semaphore:
+                response = await self.http_client.request(method, url, **kwargs)
+            if response.status_code not in RETRY_STATUS_CODES:
+                if 200 <= response.status_code < 300:
+                    bucket.speed_up()
+                return response
+            delay = compute_retry_delay(attempt, self.backoff_factor, response.headers.get("Retry-After"))
+            if attempt >= self.max_retries or delay is None:
+                return response
+            if response.status_code in THROTTLE_STATUS_CODES:
+                bucket.slow_down(delay)
+            else:
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request through the connection pool."""
+
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a POST request through the connection pool."""
+
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+
+        await self.http_client.aclose()
+
+
+@asynccontextmanager
+async def open_client(client: AsyncIndexNowClient | None) -> AsyncIterator[AsyncIndexNowClient]:
+    """Use the given client, or open a temporary client that is closed again when leaving the context."""
+
+    if client is not None:
+        yield client
+        return
+    async with AsyncIndexNowClient() as temporary_client:
+        yield temporary_client
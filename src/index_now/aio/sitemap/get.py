@@ -0,0 +1,47 @@
+import asyncio
+from typing import Any
+
+from ..client import AsyncIndexNowClient, open_client
+
+
+async def async_get_sitemap_xml(sitemap_location: str, client: AsyncIndexNowClient | None = None) -> str | bytes | Any:
+    """Get the contents of an XML sitemap file without blocking the event loop.
+
+    Args:
+        sitemap_location (str): The location of the sitemap to get the URLs from.
+        client (AsyncIndexNowClient | None, optional): Client with a connection pool to reuse across calls. A temporary client is used if set to `None`.
+
+    Returns:
+        str | bytes | Any: The contents of the XML sitemap file or an empty string if the sitemap could not be retrieved.
+    """
+
+    if not sitemap_location:
+        return ""
+
+    try:
+        async with open_client(client) as client:
+            response = await client.get(sitemap_location, timeout=10)
+        response.raise_for_status()
+        return response.content
+    except Exception:
+        return ""
+
+
+async def async_get_multiple_sitemap_xml(
+    sitemap_locations: list[str], client: AsyncIndexNowClient | None = None
+) -> list[str | bytes | Any]:
+    """Get the contents of multiple XML sitemaps concurrently on the event loop.
+
+    Args:
+        sitemap_locations (list[str]): List of sitemap locations to get the URLs from.
+        client (AsyncIndexNowClient | None, optional): Client with a connection pool to reuse across calls. A temporary client is used if set to `None`.
+
+    Returns:
+        list[str | bytes | Any]: List of the contents of the XML sitemap files in the same order as the locations.
+    """
+
+    if not sitemap_locations:
+        return []
+
+    async with open_client(client) as client:
+        return list(await asyncio.gather(*(async_get_sitemap_xml(location, client) for location in sitemap_locations)))
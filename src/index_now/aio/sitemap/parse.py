@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any
+
+from ...constant import DEFAULT_MAX_SITEMAP_DEPTH
+from ...sitemap.crawl import log_max_sitemap_depth_reached
+from ...sitemap.parse import ParsedSitemap, SitemapUrl, deduplicate_sitemap_urls, parse_sitemap_xml
+from ..client import AsyncIndexNowClient
+from .get import async_get_multiple_sitemap_xml
+
+
+async def async_controller_parse_sitemap_xml_and_get_urls(
+    sitemap_content: str | bytes | Any,
+    as_elements: bool,
+    client: AsyncIndexNowClient | None = None,
+    max_depth: int = DEFAULT_MAX_SITEMAP_DEPTH,
+) -> list[Any]:
+    """Parse the contents of an XML sitemap file and get the URLs from it, including any nested XML sitemaps at any depth that are downloaded concurrently one level at a time. Each sitemap is downloaded and parsed only once in a worker thread, so large sitemaps do not block the event loop and links back to an ancestor sitemap do not cause an endless loop.
+
+    Args:
+        sitemap_content (str | bytes | Any): The content of the XML sitemap file.
+        as_elements (bool): If `True`, return the URLs as `SitemapUrl` elements instead of strings. If `False`, return the URLs as strings.
+        client (AsyncIndexNowClient | None, optional): Client with a connection pool used to download nested sitemaps. A temporary client is used if set to `None`.
+        max_depth (int, optional): Maximum number of levels of nested sitemaps, where the given sitemap is level 1. Deeper sitemaps are skipped with a warning.
+
+    Returns:
+        list[str] | list[SitemapUrl]: List of the unique URLs or URL elements found in the XML sitemap file and its nested sitemaps. If no URLs are found, the list will be empty.
+    """
+
+    parsed_sitemap = await asyncio.to_thread(parse_sitemap_xml, sitemap_content)
+    all_urls: list[SitemapUrl] = list(parsed_sitemap.urls)
+
+    visited_locations: set[str] = set()
+    nested_sitemap_links = parsed_sitemap.nested_sitemap_links
+    depth = 1
+    while nested_sitemap_links := [
+        link for link in dict.fromkeys(nested_sitemap_links) if link not in visited_locations
+    ]:
+        if depth == max_depth:
+            log_max_sitemap_depth_reached(len(nested_sitemap_links), max_depth)
+            break
+        depth += 1
+        visited_locations.update(nested_sitemap_links)
+        multiple_nested_sitemap_contents = await async_get_multiple_sitemap_xml(nested_sitemap_links, client)
+        multiple_nested_sitemaps: list[ParsedSitemap] = await asyncio.gather(
+            *(
+                asyncio.to_thread(parse_sitemap_xml, nested_sitemap_content)
+                for nested_sitemap_content in multiple_nested_sitemap_contents
+            )
+        )
+        nested_sitemap_links = []
+        for nested_sitemap in multiple_nested_sitemaps:
+            all_urls.extend(nested_sitemap.urls)
+            nested_sitemap_links.extend(nested_sitemap.nested_sitemap_links)
+
+    all_urls = deduplicate_sitemap_urls(all_urls)
+    if as_elements:
+        return all_urls
+    return [url.loc for url in all_urls]
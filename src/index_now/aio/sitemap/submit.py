@@ -0,0 +1,160 @@
+import asyncio
+import dataclasses
+from http import HTTPStatus
+
+from ...authentication import IndexNowAuthentication
+from ...endpoint import SearchEngineEndpoint
+from ...log import logger
+from ...result import SitemapOutcome, SubmissionResult
+from ...sitemap.filter.sitemap import SitemapFilter, filter_sitemap_urls
+from ...sitemap.parse import SitemapUrl
+from ...sitemap.submit import (
+    get_sitemap_outcome,
+    get_status_code_of_failed_sitemaps,
+    log_no_urls_found,
+    log_no_urls_left_after_filtering,
+    log_sitemap_failure,
+    log_skipped_sitemaps,
+    merge_sitemap_urls,
+)
+from ..client import AsyncIndexNowClient, open_client
+from ..url.submit import async_submit_urls_to_index_now
+from .parse import async_controller_parse_sitemap_xml_and_get_urls
+
+
+async def async_submit_sitemap_to_index_now(
+    authentication: IndexNowAuthentication,
+    sitemap_location: str,
+    filter: SitemapFilter | None = None,
+    endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
+    client: AsyncIndexNowClient | None = None,
+) -> SubmissionResult:
+    """Submit a sitemap to the IndexNow API of a search engine without blocking the event loop. Note that nested sitemaps of the index sitemap will be included up to level 5 by default.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        sitemap_location (str): The URL of the sitemap to submit, e.g. `https://example.com/sitemap.xml`.
+        filter (SitemapFilter | None): Optional filter for URLs. Ignored by default or if set to `None`.
+        endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (AsyncIndexNowClient | None, optional): Client with a connection pool that is reused for downloading the sitemaps and submitting the URLs. A temporary client is used if set to `None`.
+
+    Returns:
+        SubmissionResult: Status code of the response, e.g. `200` or `202` for, respectively, success or accepted, or `400` for bad request, etc., and the result of each batch.
+
+    Example:
+        ```python linenums="1" hl_lines="12"
+        import asyncio
+        from index_now import IndexNowAuthentication, SitemapFilter
+        from index_now.aio import async_submit_sitemap_to_index_now
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        sitemap_location = "https://example.com/sitemap.xml"
+
+        asyncio.run(async_submit_sitemap_to_index_now(authentication, sitemap_location, SitemapFilter(take=100)))
+        ```
+    """
+
+    async with open_client(client) as client:
+        response = await client.get(sitemap_location)
+        if response.status_code != HTTPStatus.OK:
+            log_sitemap_failure(sitemap_location, response.status_code, response.text)
+            return SubmissionResult(str(endpoint), response.status_code)
+
+        urls = await async_get_filtered_urls(response.content, filter, client)
+        if urls is None:
+            log_no_urls_found(sitemap_location)
+            return SubmissionResult(str(endpoint), HTTPStatus.UNPROCESSABLE_ENTITY)
+        if not urls:
+            log_no_urls_left_after_filtering()
+            return SubmissionResult(str(endpoint), HTTPStatus.NO_CONTENT)
+
+        logger.info("Found %d URL(s) in total from this sitemap: %s", len(urls), sitemap_location)
+        result = await async_submit_urls_to_index_now(authentication, urls, endpoint, client)
+    return result
+
+
+async def async_submit_sitemaps_to_index_now(
+    authentication: IndexNowAuthentication,
+    sitemap_locations: list[str],
+    filter: SitemapFilter | None = None,
+    endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
+    client: AsyncIndexNowClient | None = None,
+) -> SubmissionResult:
+    """Submit multiple sitemaps to the IndexNow API of a search engine without blocking the event loop. The sitemaps are downloaded concurrently. Note that nested sitemaps of the index sitemaps will be included up to level 5 by default.
+
+    A sitemap that cannot be downloaded or contains no URLs is skipped with a warning, while the URLs of the healthy sitemaps are still merged in the given order and submitted. A URL that is listed in more than one sitemap is only submitted once. The outcome of each sitemap is reported in `SubmissionResult.sitemap_outcomes`.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        sitemap_locations (list[str]): List of sitemap locations to submit, e.g. `["https://example.com/sitemap1.xml", "https://example.com/sitemap2.xml, "https://example.com/sitemap3.xml"]`.
+        filter (SitemapFilter | None): Optional filter for URLs. Ignored by default or if set to `None`.
+        endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (AsyncIndexNowClient | None, optional): Client with a connection pool that is reused for downloading the sitemaps and submitting the URLs. A temporary client is used if set to `None`.
+
+    Returns:
+        SubmissionResult: Status code of the response, e.g. `200` or `202` for, respectively, success or accepted, or `400` for bad request, etc., the result of each batch, and the outcome of each sitemap. If none of the sitemaps could be used, the status code is the one of the first sitemap that failed, e.g. `404`, or `422` if the sitemaps contain no URLs.
+    """
+
+    async with open_client(client) as client:
+        outcomes_and_url_elements = await asyncio.gather(
+            *(async_get_sitemap_urls_with_outcome(sitemap_location, client) for sitemap_location in sitemap_locations)
+        )
+        sitemap_outcomes = [outcome for outcome, _ in outcomes_and_url_elements]
+        merged_url_elements = merge_sitemap_urls([url_elements for _, url_elements in outcomes_and_url_elements])
+        if not merged_url_elements:
+            status_code = get_status_code_of_failed_sitemaps(sitemap_outcomes)
+            return SubmissionResult(str(endpoint), status_code, [], sitemap_outcomes)
+        log_skipped_sitemaps(sitemap_outcomes)
+
+        merged_urls = (
+            filter_sitemap_urls(merged_url_elements, filter)
+            if filter
+            else [url_element.loc for url_element in merged_url_elements]
+        )
+        if not merged_urls:
+            log_no_urls_left_after_filtering()
+            return SubmissionResult(str(endpoint), HTTPStatus.NO_CONTENT, [], sitemap_outcomes)
+
+        healthy_locations = [outcome.location for outcome in sitemap_outcomes if outcome.is_success]
+        logger.info("Found %d URL(s) in total from these sitemaps: %s", len(merged_urls), ", ".join(healthy_locations))
+        result = await async_submit_urls_to_index_now(authentication, merged_urls, endpoint, client)
+    return dataclasses.replace(result, sitemap_outcomes=sitemap_outcomes)
+
+
+async def async_get_sitemap_urls_with_outcome(
+    sitemap_location: str, client: AsyncIndexNowClient
+) -> tuple[SitemapOutcome, list[SitemapUrl]]:
+    """Download and parse a sitemap and its nested sitemaps. Errors are caught and reported in the outcome with a warning, so a sitemap that fails does not affect the others that are submitted together with it."""
+
+    try:
+        response = await client.get(sitemap_location)
+        if response.status_code != HTTPStatus.OK:
+            log_sitemap_failure(sitemap_location, response.status_code, response.text)
+            return SitemapOutcome(sitemap_location, response.status_code, error=response.text), []
+        url_elements = await async_controller_parse_sitemap_xml_and_get_urls(
+            response.content, as_elements=True, client=client
+        )
+    except Exception as error:
+        logger.warning("Failure. Please check the sitemap location: %s (error: %s)", sitemap_location, error)
+        return SitemapOutcome(sitemap_location, None, error=str(error) or type(error).__name__), []
+    return get_sitemap_outcome(sitemap_location, response.status_code, url_elements), url_elements
+
+
+async def async_get_filtered_urls(
+    sitemap_content: bytes, filter: SitemapFilter | None, client: AsyncIndexNowClient
+) -> list[str] | None:
+    """Get the URLs of a sitemap, including nested sitemaps, and apply the optional filter. Returns `None` if the sitemap contains no URLs at all."""
+
+    url_elements = await async_controller_parse_sitemap_xml_and_get_urls(
+        sitemap_content, as_elements=True, client=client
+    )
+    if not url_elements:
+        return None
+    if not filter:
+        return [url_element.loc for url_element in url_elements]
+    return filter_sitemap_urls(url_elements, filter)
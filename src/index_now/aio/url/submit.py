@@ -0,0 +1,206 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from http import HTTPStatus
+
+from ...authentication import IndexNowAuthentication
+from ...constant import DEFAULT_MAX_CONCURRENT_BATCHES, JSON_HEADERS, MAX_URLS_PER_BATCH
+from ...endpoint import SearchEngineEndpoint
+from ...result import BatchResult, SubmissionResult
+from ...url.submit import (
+    create_payload,
+    create_query_parameters,
+    iterate_batches,
+    log_url_submission,
+    log_urls_submission,
+    split_urls_into_batches,
+    validate_batch_arguments,
+)
+from ..client import AsyncIndexNowClient, open_client
+
+
+async def async_submit_url_to_index_now(
+    authentication: IndexNowAuthentication,
+    url: str,
+    endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
+    client: AsyncIndexNowClient | None = None,
+) -> SubmissionResult:
+    """Submit a single URL to the IndexNow API of a search engine without blocking the event loop.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        url (str): URL to submit, e.g. `"https://example.com/page1"`.
+        endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (AsyncIndexNowClient | None, optional): Client with a connection pool to reuse across calls. A temporary client is used if set to `None`.
+
+    Returns:
+        SubmissionResult: The status code of the response, e.g. `200` for success, `202` for accepted, `400` for bad request, etc., and the response text.
+
+    Example:
+        Submit a URL from inside a request handler of a web application, e.g. FastAPI:
+
+        ```python linenums="1" hl_lines="10"
+        from index_now import IndexNowAuthentication
+        from index_now.aio import async_submit_url_to_index_now
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        async def on_publish(url: str) -> None:
+            await async_submit_url_to_index_now(authentication, url)
+        ```
+    """
+
+    async with open_client(client) as client:
+        response = await client.get(str(endpoint), params=create_query_parameters(authentication, url))
+    batch_result = BatchResult(url_count=1, status_code=response.status_code, response_text=response.text)
+    result = SubmissionResult.from_batches(str(endpoint), [batch_result])
+    log_url_submission(result)
+    return result
+
+
+async def async_submit_batch_to_index_now(
+    authentication: IndexNowAuthentication,
+    urls: list[str],
+    endpoint: SearchEngineEndpoint | str,
+    client: AsyncIndexNowClient,
+    semaphore: asyncio.Semaphore,
+) -> BatchResult:
+    """Submit a single batch of URLs in one request to the IndexNow API of a search engine without blocking the event loop."""
+
+    async with semaphore:
+        response = await client.post(str(endpoint), json=create_payload(authentication, urls), headers=JSON_HEADERS)
+    return BatchResult(url_count=len(urls), status_code=response.status_code, response_text=response.text)
+
+
+async def async_submit_urls_to_index_now(
+    authentication: IndexNowAuthentication,
+    urls: list[str],
+    endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
+    client: AsyncIndexNowClient | None = None,
+    batch_size: int = MAX_URLS_PER_BATCH,
+    max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+) -> SubmissionResult:
+    """Submit a list of URLs to the IndexNow API of a search engine without blocking the event loop. Long lists are automatically split into batches of up to 10,000 URLs.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        urls (list[str]): List of URLs to submit. For example: `["https://example.com/page1", "https://example.com/page2", "https://example.com/page3"]`
+        endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (AsyncIndexNowClient | None, optional): Client with a connection pool to reuse across calls. A temporary client is used if set to `None`.
+        batch_size (int, optional): Maximum number of URLs per request. Should be between 1 and 10,000.
+        max_concurrent_batches (int, optional): Maximum number of batches that are submitted at the same time.
+
+    Returns:
+        SubmissionResult: The overall status code, e.g. `200` for success, `202` for accepted, `400` for bad request, etc., and the result of each batch.
+
+    Example:
+        ```python linenums="1" hl_lines="12"
+        import asyncio
+        from index_now import IndexNowAuthentication
+        from index_now.aio import async_submit_urls_to_index_now
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        urls = ["https://example.com/page1", "https://example.com/page2", "https://example.com/page3"]
+
+        asyncio.run(async_submit_urls_to_index_now(authentication, urls))
+        ```
+    """
+
+    validate_batch_arguments(batch_size, max_concurrent_batches)
+    semaphore = asyncio.Semaphore(max_concurrent_batches)
+    async with open_client(client) as client:
+        batch_results = await asyncio.gather(
+            *(
+                async_submit_batch_to_index_now(authentication, batch, endpoint, client, semaphore)
+                for batch in split_urls_into_batches(urls, batch_size)
+            )
+        )
+    result = SubmissionResult.from_batches(str(endpoint), list(batch_results))
+    log_urls_submission(result)
+    return result
+
+
+async def async_iterate_batches(urls: AsyncIterable[str] | Iterable[str], batch_size: int) -> AsyncIterator[list[str]]:
+    """Lazily split an asynchronous or regular iterable of URLs into batches of a given maximum size."""
+
+    if not isinstance(urls, AsyncIterable):
+        for full_batch in iterate_batches(urls, batch_size):
+            yield full_batch
+        return
+
+    batch: list[str] = []
+    async for url in urls:
+        batch.append(url)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def async_submit_url_stream_to_index_now(
+    authentication: IndexNowAuthentication,
+    urls: AsyncIterable[str] | Iterable[str],
+    endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
+    client: AsyncIndexNowClient | None = None,
+    batch_size: int = MAX_URLS_PER_BATCH,
+    max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+) -> SubmissionResult:
+    """Submit a stream of URLs, e.g. from an asynchronous generator, to the IndexNow API of a search engine without blocking the event loop. Each batch is submitted as soon as it is full, and the stream is paused while `max_concurrent_batches` batches are being submitted, so the memory usage is bounded by the batch size.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        urls (AsyncIterable[str] | Iterable[str]): URLs to submit, which are consumed lazily.
+        endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (AsyncIndexNowClient | None, optional): Client with a connection pool to reuse across calls. A temporary client is used if set to `None`.
+        batch_size (int, optional): Maximum number of URLs per request. Should be between 1 and 10,000.
+        max_concurrent_batches (int, optional): Maximum number of batches that are submitted at the same time.
+
+    Returns:
+        SubmissionResult: The overall status code and the result of each batch in the order of the stream. If the stream is empty, nothing is submitted and the status code is `204` without any batches.
+
+    Example:
+        ```python linenums="1" hl_lines="11-13 15"
+        import asyncio
+        from index_now import IndexNowAuthentication
+        from index_now.aio import async_submit_url_stream_to_index_now
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        async def get_changed_urls():
+            async for row in database.fetch_changed_pages():
+                yield row.url
+
+        asyncio.run(async_submit_url_stream_to_index_now(authentication, get_changed_urls()))
+        ```
+    """
+
+    validate_batch_arguments(batch_size, max_concurrent_batches)
+    semaphore = asyncio.Semaphore(max_concurrent_batches)
+    tasks: list[asyncio.Task[BatchResult]] = []
+    async with open_client(client) as client:
+        async for batch in async_iterate_batches(urls, batch_size):
+            # Pause the stream until a batch has been submitted, so no more batches than this are held in memory:
+            if len(pending := [task for task in tasks if not task.done()]) >= max_concurrent_batches:
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            tasks.append(
+                asyncio.create_task(async_submit_batch_to_index_now(authentication, batch, endpoint, client, semaphore))
+            )
+        batch_results = await asyncio.gather(*tasks)
+    if not batch_results:
+        return SubmissionResult(str(endpoint), HTTPStatus.NO_CONTENT)
+    result = SubmissionResult.from_batches(str(endpoint), list(batch_results))
+    log_urls_submission(result)
+    return result
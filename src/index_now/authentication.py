@@ -1,4 +1,6 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
+from urllib.parse import urlsplit
 
 
 @dataclass(slots=True, frozen=True)
@@ -29,3 +31,84 @@ class IndexNowAuthentication:
     host: str
     api_key: str
     api_key_location: str
+
+
+def get_url_host(url: str) -> str:
+    """Get the host of a URL in lowercase and without the port, e.g. `example.com` for `https://Example.com:443/page1`. Returns an empty string if the URL has no host."""
+
+    return urlsplit(url).hostname or ""
+
+
+class AuthenticationRegistry:
+    """Registry of authentication credentials for several hosts, so URLs of many websites can be submitted together. The IndexNow protocol rejects URLs of other hosts than the one of the credentials, so mixed URLs are partitioned by host and each partition is submitted with the credentials of its host. Hosts are matched exactly and case-insensitively, so `www.example.com` and `example.com` are different hosts.
+
+    Args:
+        authentications (Iterable[IndexNowAuthentication], optional): Credentials to register, one per host. If a host is registered more than once, the last credentials are used.
+
+    Example:
+        Register the credentials of each website, and look up the credentials of a host or split mixed URLs by host:
+
+        ```python linenums="1" hl_lines="3-6 8 10"
+        from index_now import AuthenticationRegistry, IndexNowAuthentication
+
+        registry = AuthenticationRegistry([
+            IndexNowAuthentication("example.com", "a1b2c3d4", "https://example.com/a1b2c3d4.txt"),
+            IndexNowAuthentication("example.org", "e5f6g7h8", "https://example.org/e5f6g7h8.txt"),
+        ])
+
+        authentication = registry.get("example.org")
+
+        urls_by_host, unregistered_urls = registry.partition(urls)
+        ```
+
+        Use [`submit_urls_to_multiple_hosts()`](../methods/submit-to-multiple-hosts.md) to submit the URLs of all hosts at once.
+    """
+
+    __slots__ = ["authentications"]
+
+    def __init__(self, authentications: Iterable[IndexNowAuthentication] = ()) -> None:
+        self.authentications: dict[str, IndexNowAuthentication] = {}
+        for authentication in authentications:
+            self.register(authentication)
+
+    def __repr__(self) -> str:
+        return f"AuthenticationRegistry(hosts={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.authentications)
+
+    def __contains__(self, host: object) -> bool:
+        return isinstance(host, str) and host.lower() in self.authentications
+
+    def register(self, authentication: IndexNowAuthentication) -> None:
+        """Add the credentials of a host, or replace the existing credentials of the host."""
+
+        self.authentications[authentication.host.lower()] = authentication
+
+    def get(self, host: str) -> IndexNowAuthentication | None:
+        """Get the credentials of a host, or `None` if the host is not registered."""
+
+        return self.authentications.get(host.lower())
+
+    def partition(self, urls: Iterable[str]) -> tuple[dict[str, list[str]], list[str]]:
+        """Partition URLs by host in one pass while keeping their order within each host.
+
+        Args:
+            urls (Iterable[str]): URLs of any of the registered hosts, which are consumed lazily.
+
+        Returns:
+            tuple[dict[str, list[str]], list[str]]: The URLs of each registered host by host in the order the hosts are first seen, and the URLs of hosts that are not registered.
+        """
+
+        urls_by_host: dict[str, list[str]] = {}
+        unregistered_urls: list[str] = []
+        registered_hosts = self.authentications
+        for url in urls:
+            host = get_url_host(url)
+            if host in registered_hosts:
+                if (host_urls := urls_by_host.get(host)) is None:
+                    host_urls = urls_by_host[host] = []
+                host_urls.append(url)
+            else:
+                unregistered_urls.append(url)
+        return urls_by_host, unregistered_urls
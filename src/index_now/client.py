@@ -0,0 +1,162 @@
+import os
+import time
+from types import TracebackType
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .constant import (
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    RETRY_STATUS_CODES,
+    THROTTLE_STATUS_CODES,
+)
+from .rate_limit import RateLimiter, compute_retry_delay
+
+
+class IndexNowClient:
+    """HTTP client that owns a keep-alive connection pool per host, so repeated submissions and sitemap downloads can reuse connections instead of doing a new TCP connection and TLS handshake for each request.
+
+    Args:
+        pool_connections (int, optional): Number of hosts, e.g. search engine endpoints and sitemap origins, to keep a connection pool for.
+        pool_maxsize (int, optional): Maximum number of keep-alive connections per host. Should be at least the number of threads that share the client.
+        max_retries (int, optional): Number of retries on connection errors and transient status codes such as `429` and `503`. Set to `0` to disable retries.
+        backoff_factor (float, optional): Factor for the exponential backoff with jitter between retries in seconds. A `Retry-After` header from the server takes precedence.
+        timeout (float | None, optional): Default timeout in seconds for each request. No timeout if set to `None`.
+        rate_limiter (RateLimiter | None, optional): Rate limiter with a token bucket per endpoint. If set to `None`, requests are not limited, but all requests to a host are still paused when it responds with `429` or `503`.
+
+    Example:
+        Create one client and share it across all calls, so the connections are reused:
+
+        ```python linenums="1" hl_lines="9 13-14"
+        from index_now import submit_url_to_index_now, submit_sitemap_to_index_now, IndexNowAuthentication, IndexNowClient
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        with IndexNowClient(pool_maxsize=20, max_retries=3) as client:
+            for url in ["https://example.com/page1", "https://example.com/page2"]:
+                submit_url_to_index_now(authentication, url, client=client)
+
+            submit_sitemap_to_index_now(authentication, "https://example.com/sitemap.xml",
+                client=client)
+        ```
+
+        If no client is given, all functions share a default client with a connection pool.
+    """
+
+    __slots__ = ["session", "timeout", "max_retries", "backoff_factor", "rate_limiter"]
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        timeout: float | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("Pool connections and pool size must be at least 1.")
+        if max_retries < 0:
+            raise ValueError("Max retries cannot be negative.")
+
+        # Connection errors are retried by the adapter, while status codes are retried by the rate-aware scheduler:
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_factor,
+            allowed_methods=None,
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+    def __repr__(self) -> str:
+        return (
+            f"IndexNowClient(timeout={self.timeout}, max_retries={self.max_retries}, rate_limiter={self.rate_limiter})"
+        )
+
+    def __enter__(self) -> "IndexNowClient":
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the connection pool. Transient status codes are retried with exponential backoff, and if the server throttles, all requests to the same host are paused until the `Retry-After` time has passed."""
+
+        kwargs.setdefault("timeout", self.timeout)
+        bucket = self.rate_limiter.get_bucket(url)
+        attempt = 0
+        while True:
+            if wait := bucket.reserve():
+                time.sleep(wait)
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code not in RETRY_STATUS_CODES:
+                if 200 <= response.status_code < 300:
+                    bucket.speed_up()
+                return response
+            delay = compute_retry_delay(attempt, self.backoff_factor, response.headers.get("Retry-After"))
+            if attempt >= self.max_retries or delay is None:
+                return response
+            response.close()
+            if response.status_code in THROTTLE_STATUS_CODES:
+                bucket.slow_down(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request through the connection pool."""
+
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request through the connection pool."""
+
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+
+        self.session.close()
+
+
+_default_client: IndexNowClient | None = None
+
+
+def get_default_client() -> IndexNowClient:
+    """Get the default client that is shared by all functions when no client is given. It is created on first use."""
+
+    global _default_client
+    if _default_client is None:
+        _default_client = IndexNowClient()
+    return _default_client
+
+
+def reset_default_client() -> None:
+    """Discard the default client, e.g. in a forked child process that must not share sockets with its parent."""
+
+    global _default_client
+    _default_client = None
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows, which does not fork processes.
+    os.register_at_fork(after_in_child=reset_default_client)
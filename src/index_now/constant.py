@@ -1,3 +1,67 @@
 import os
+from http import HTTPStatus
+from pathlib import Path
 
 NUMBER_OF_CPU_CORES = os.cpu_count() or 1
+
+# Downloads are I/O-bound, so the number of threads is not limited by the number of CPU cores:
+DEFAULT_MAX_IO_WORKERS = 16
+
+# Leave one core for the main process, but always have at least one worker, also on single-core machines:
+DEFAULT_MAX_CPU_WORKERS = max(1, NUMBER_OF_CPU_CORES - 1)
+
+# Levels of nested sitemaps to crawl, where the index sitemap is level 1. Deeper sitemaps are most likely a mistake:
+DEFAULT_MAX_SITEMAP_DEPTH = 5
+
+# Crawled sitemaps are handed over in parts of this many URLs, so large sitemaps are never held in memory as a whole:
+SITEMAP_PART_SIZE = 1_000
+
+DEFAULT_POOL_CONNECTIONS = 10
+
+DEFAULT_POOL_MAXSIZE = DEFAULT_MAX_IO_WORKERS
+
+DEFAULT_MAX_RETRIES = 3
+
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+# Give up rather than wait if a server asks to retry later than this many seconds:
+DEFAULT_MAX_RETRY_AFTER = 120.0
+
+# Status codes that signal that the server is overloaded, so all requests to that host are paused:
+THROTTLE_STATUS_CODES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+
+RETRY_STATUS_CODES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+MAX_URLS_PER_BATCH = 10_000
+
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
+
+JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+DEFAULT_ASYNC_MAX_CONCURRENCY = 100
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+
+DEFAULT_CACHE_DIRECTORY = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "index-now"
+
+DEFAULT_SITEMAP_CACHE_MAX_SIZE = 100 * 1024 * 1024
+
+DEFAULT_DATA_DIRECTORY = Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share") / "index-now"
+
+DEFAULT_QUEUE_POLL_INTERVAL = 1.0
+
+DEFAULT_QUEUE_RETRY_INTERVAL = 60.0
+
+DEFAULT_BUFFER_MAX_SIZE = 1_000
+
+DEFAULT_BUFFER_MAX_DELAY = 10.0
@@ -0,0 +1,90 @@
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum, unique
+from typing import Any
+
+from .constant import DEFAULT_MAX_CPU_WORKERS, DEFAULT_MAX_IO_WORKERS, DEFAULT_MAX_SITEMAP_DEPTH
+
+
+@unique
+class ParseExecutor(Enum):
+    """Where downloaded sitemaps are parsed.
+
+    Attributes:
+        ParseExecutor.THREAD (Enum): Parse each sitemap in the same worker thread that downloaded it. Best for most sitemaps, as there is no overhead of starting processes and copying data between them.
+        ParseExecutor.PROCESS (Enum): Download in threads and hereafter parse in a pool of processes. Only worth it for CPU-heavy parsing of many large sitemaps on a machine with several CPU cores.
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutorStrategy:
+    """Strategy for downloading and parsing multiple sitemaps in parallel. Downloads are I/O-bound and always run in threads, so the number of workers is sized for waiting on the network rather than by the number of CPU cores.
+
+    Attributes:
+        max_fetch_workers (int): Maximum number of threads that download sitemaps at the same time.
+        parse_executor (ParseExecutor): Parse in the download threads or in a pool of processes.
+        max_parse_workers (int): Maximum number of processes for parsing. Only used if `parse_executor` is `ParseExecutor.PROCESS`.
+        max_sitemap_depth (int): Maximum number of levels of nested sitemaps, where the index sitemap is level 1 and its nested sitemaps are level 2. Deeper sitemaps are skipped with a warning.
+        max_sitemap_urls (int | None): Maximum number of URLs to collect from a sitemap and its nested sitemaps, after which no more sitemaps are downloaded. Unlimited if set to `None`.
+
+    Example:
+        Download up to 32 nested sitemaps at the same time:
+
+        ```python linenums="1" hl_lines="3 5-6"
+        from index_now import submit_sitemap_to_index_now, ExecutorStrategy, IndexNowAuthentication, ParseExecutor
+
+        strategy = ExecutorStrategy(max_fetch_workers=32)
+
+        submit_sitemap_to_index_now(IndexNowAuthentication(...), "https://example.com/sitemap.xml",
+            executor_strategy=strategy)
+        ```
+
+        Crawl a sitemap index of index sitemaps up to level 3 and stop after one million URLs:
+
+        ```python linenums="3" hl_lines="1" title=""
+        strategy = ExecutorStrategy(max_sitemap_depth=3, max_sitemap_urls=1_000_000)
+        ```
+
+        Parse very large sitemaps in separate processes:
+
+        ```python linenums="3" hl_lines="1" title=""
+        strategy = ExecutorStrategy(parse_executor=ParseExecutor.PROCESS, max_parse_workers=4)
+        ```
+
+        For an asyncio application, use the awaitable functions in `index_now.aio` instead.
+    """
+
+    max_fetch_workers: int = DEFAULT_MAX_IO_WORKERS
+    parse_executor: ParseExecutor = ParseExecutor.THREAD
+    max_parse_workers: int = DEFAULT_MAX_CPU_WORKERS
+    max_sitemap_depth: int = DEFAULT_MAX_SITEMAP_DEPTH
+    max_sitemap_urls: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_fetch_workers < 1 or self.max_parse_workers < 1:
+            raise ValueError("Max fetch workers and max parse workers must be at least 1.")
+        if self.max_sitemap_depth < 1:
+            raise ValueError("Max sitemap depth must be at least 1.")
+        if self.max_sitemap_urls is not None and self.max_sitemap_urls < 0:
+            raise ValueError("Max sitemap URLs cannot be negative.")
+
+
+DEFAULT_EXECUTOR_STRATEGY = ExecutorStrategy()
+
+
+def map_in_threads(function: Callable[..., Any], *iterables: Iterable[Any], max_workers: int) -> list[Any]:
+    """Apply a function to the items of one or more iterables in a pool of threads and return the results in order."""
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(function, *iterables))
+
+
+def map_in_processes(function: Callable[..., Any], *iterables: Iterable[Any], max_workers: int) -> list[Any]:
+    """Apply a function to the items of one or more iterables in a pool of processes and return the results in order. The function and items must be picklable."""
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(function, *iterables))
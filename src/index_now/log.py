@@ -0,0 +1,76 @@
+import logging
+import sys
+from typing import TextIO
+
+from colorist import Color
+
+QUIET = logging.CRITICAL + 1
+
+logger = logging.getLogger("index_now")
+logger.addHandler(logging.NullHandler())  # Leave the output to the logging configuration of the application.
+
+
+class ColorFormatter(logging.Formatter):
+    """Format messages in yellow for warnings and red for errors, as they are printed to the terminal."""
+
+    LEVEL_COLORS = {logging.WARNING: Color.YELLOW, logging.ERROR: Color.RED, logging.CRITICAL: Color.RED}
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        color = self.LEVEL_COLORS.get(record.levelno)
+        return f"{color}{message}{Color.OFF}" if color else message
+
+
+class PrintHandler(logging.StreamHandler[TextIO]):
+    """Write messages to the current `sys.stdout`, like `print()` does, so redirected output is respected."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.stream = sys.stdout
+        super().emit(record)
+
+
+print_handler = PrintHandler()
+print_handler.setFormatter(ColorFormatter("%(message)s"))
+
+
+def configure_logging(quiet: bool = False, print_to_stdout: bool = True) -> None:
+    """Configure how the package reports progress and failures. All messages are sent to the `index_now` logger and formatted lazily, so in quiet mode no message is formatted at all. Without a call to this function, the package prints nothing itself and leaves its messages to the logging configuration of your application, like other libraries.
+
+    Args:
+        quiet (bool, optional): If `True`, no messages are emitted, not even failures. Use the returned results to check the outcome instead.
+        print_to_stdout (bool, optional): If `True`, messages are printed to the terminal, which is the default. If `False`, messages are only passed on to the handlers of your own logging configuration.
+
+    Example:
+        Print progress and failures to the terminal, e.g. in a script:
+
+        ```python linenums="1" hl_lines="3"
+        from index_now import configure_logging
+
+        configure_logging()
+        ```
+
+        Silence all output, e.g. when submitting many sitemaps in a loop:
+
+        ```python linenums="1" hl_lines="3"
+        from index_now import configure_logging
+
+        configure_logging(quiet=True)
+        ```
+
+        Or stop printing and only route the messages through the logging configuration of your application:
+
+        ```python linenums="1" hl_lines="5"
+        import logging
+        from index_now import configure_logging
+
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+        configure_logging(print_to_stdout=False)
+        ```
+    """
+
+    if print_to_stdout:
+        logger.addHandler(print_handler)
+        logger.setLevel(QUIET if quiet else logging.INFO)
+    else:
+        logger.removeHandler(print_handler)
+        logger.setLevel(QUIET if quiet else logging.NOTSET)
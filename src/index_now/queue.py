@@ -0,0 +1,322 @@
+import sqlite3
+import threading
+import time
+from http import HTTPStatus
+from pathlib import Path
+from types import TracebackType
+
+from .authentication import IndexNowAuthentication
+from .client import IndexNowClient, get_default_client
+from .constant import (
+    DEFAULT_DATA_DIRECTORY,
+    DEFAULT_QUEUE_POLL_INTERVAL,
+    DEFAULT_QUEUE_RETRY_INTERVAL,
+    MAX_URLS_PER_BATCH,
+)
+from .endpoint import SearchEngineEndpoint
+from .log import logger
+from .result import SubmissionResult
+from .url.submit import submit_urls_to_index_now
+
+
+def is_permanent_failure(status_code: int) -> bool:
+    """Check whether a submission was rejected for good, e.g. `400 Bad Request`, `403 Forbidden` or `422 Unprocessable Entity`, so submitting the same batch again would fail again. `429 Too Many Requests` is transient."""
+
+    return (
+        HTTPStatus.BAD_REQUEST <= status_code < HTTPStatus.INTERNAL_SERVER_ERROR
+        and status_code != HTTPStatus.TOO_MANY_REQUESTS
+    )
+
+
+class SubmissionQueue:
+    """Durable SQLite queue of URLs waiting to be submitted, so submissions survive if the process stops. Enqueueing is a single local transaction, which keeps e.g. the publish path of a CMS independent of the response time of the IndexNow API. Duplicate URLs for the same endpoint are coalesced while they wait in the queue. URLs that are rejected for good, e.g. with `403 Forbidden`, are moved to a dead-letter table, so they do not block the rest of the queue.
+
+    Args:
+        path (Path | str, optional): Location of the SQLite database file. Defaults to `index-now/queue.sqlite3` in the user's data directory. Several processes can share the same file.
+
+    Example:
+        Enqueue URLs when pages are published, and let a [`SubmissionWorker`](#index_now.queue.SubmissionWorker) submit them in the background:
+
+        ```python linenums="1" hl_lines="9-10"
+        from index_now import IndexNowAuthentication, SubmissionQueue
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        queue = SubmissionQueue()
+        queue.enqueue(["https://example.com/page1", "https://example.com/page2"])
+        ```
+    """
+
+    __slots__ = ["path", "connection", "lock"]
+
+    def __init__(self, path: Path | str = DEFAULT_DATA_DIRECTORY / "queue.sqlite3") -> None:
+        self.path = path
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # The connection is shared by the worker thread and the threads that enqueue, so access is serialized by a lock:
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS queue ("
+                "endpoint TEXT NOT NULL, url TEXT NOT NULL, version INTEGER NOT NULL, "
+                "PRIMARY KEY (endpoint, url))"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS queue_by_version ON queue (version)")
+            # Versions come from a counter row instead of the clock, so they never collide or go backwards:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS queue_sequence (id INTEGER PRIMARY KEY CHECK (id = 0), value INTEGER NOT NULL)"
+            )
+            self.connection.execute(
+                "INSERT OR IGNORE INTO queue_sequence (id, value) SELECT 0, COALESCE(MAX(version), 0) FROM queue"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS dead_letter ("
+                "endpoint TEXT NOT NULL, url TEXT NOT NULL, status_code INTEGER NOT NULL, failed_at REAL NOT NULL, "
+                "PRIMARY KEY (endpoint, url))"
+            )
+
+    def __repr__(self) -> str:
+        return f"SubmissionQueue(path={self.path})"
+
+    def __enter__(self) -> "SubmissionQueue":
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return int(self.connection.execute("SELECT COUNT(*) FROM queue").fetchone()[0])
+
+    def enqueue(self, urls: list[str], endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW) -> None:
+        """Add URLs to the queue. A URL that is already waiting for the same endpoint is not added again, but it is marked as changed, so it is submitted again even if a submission of it is already in progress."""
+
+        with self.lock, self.connection:
+            version = self.connection.execute(
+                "UPDATE queue_sequence SET value = value + 1 WHERE id = 0 RETURNING value"
+            ).fetchone()[0]
+            self.connection.executemany(
+                "INSERT INTO queue (endpoint, url, version) VALUES (?, ?, ?) "
+                "ON CONFLICT (endpoint, url) DO UPDATE SET version = excluded.version",
+                ((str(endpoint), url, version) for url in urls),
+            )
+
+    def peek_batch(self, batch_size: int = MAX_URLS_PER_BATCH) -> tuple[str, list[tuple[str, int]]] | None:
+        """Get the oldest batch of URLs for a single endpoint without removing them from the queue.
+
+        Returns:
+            tuple[str, list[tuple[str, int]]] | None: The endpoint and the URLs with their versions, or `None` if the queue is empty.
+        """
+
+        with self.lock:
+            oldest = self.connection.execute("SELECT endpoint FROM queue ORDER BY version, rowid LIMIT 1").fetchone()
+            if oldest is None:
+                return None
+            endpoint = str(oldest[0])
+            rows = self.connection.execute(
+                "SELECT url, version FROM queue WHERE endpoint = ? ORDER BY version, rowid LIMIT ?",
+                (endpoint, batch_size),
+            ).fetchall()
+        return endpoint, [(str(url), int(version)) for url, version in rows]
+
+    def acknowledge(self, endpoint: str, urls: list[tuple[str, int]]) -> None:
+        """Remove submitted URLs from the queue, unless they have been enqueued again since the batch was taken."""
+
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM queue WHERE endpoint = ? AND url = ? AND version = ?",
+                ((endpoint, url, version) for url, version in urls),
+            )
+
+    def move_to_dead_letter(self, endpoint: str, urls: list[tuple[str, int]], status_code: int) -> None:
+        """Move URLs that were rejected for good from the queue to the dead-letter table, unless they have been enqueued again since the batch was taken."""
+
+        failed_at = time.time()
+        with self.lock, self.connection:
+            for url, version in urls:
+                is_deleted = self.connection.execute(
+                    "DELETE FROM queue WHERE endpoint = ? AND url = ? AND version = ?", (endpoint, url, version)
+                ).rowcount
+                if is_deleted:
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO dead_letter (endpoint, url, status_code, failed_at) VALUES (?, ?, ?, ?)",
+                        (endpoint, url, status_code, failed_at),
+                    )
+
+    def get_dead_letters(self) -> list[tuple[str, str, int]]:
+        """Get the URLs that were rejected for good, e.g. to fix the credentials and enqueue them again.
+
+        Returns:
+            list[tuple[str, str, int]]: The endpoint, the URL and the status code of the rejection, oldest first.
+        """
+
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT endpoint, url, status_code FROM dead_letter ORDER BY failed_at, rowid"
+            ).fetchall()
+        return [(str(endpoint), str(url), int(status_code)) for endpoint, url, status_code in rows]
+
+    def clear_dead_letters(self) -> None:
+        """Remove all URLs from the dead-letter table."""
+
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM dead_letter")
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+
+        with self.lock:
+            self.connection.close()
+
+
+class SubmissionWorker:
+    """Background worker that drains a [`SubmissionQueue`](#index_now.queue.SubmissionQueue) in batches of up to 10,000 URLs. URLs are only removed from the queue after they have been submitted successfully, so a batch that fails temporarily, e.g. with `429` or `503`, or that is in flight when the process stops, is submitted again later. A batch that is rejected for good with any other `4xx` status code is moved to the dead-letter table of the queue instead.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        queue (SubmissionQueue): The queue to drain.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across submissions. Uses a shared default client if set to `None`.
+        batch_size (int, optional): Maximum number of URLs per request. Cannot exceed 10,000 URLs.
+        poll_interval (float, optional): Seconds to wait before checking an empty queue again.
+        retry_interval (float, optional): Seconds to wait before retrying after a failed submission.
+
+    Example:
+        Start the worker once when the application starts, and stop it when the application shuts down:
+
+        ```python linenums="1" hl_lines="9-10 12"
+        from index_now import IndexNowAuthentication, SubmissionQueue, SubmissionWorker
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        queue = SubmissionQueue()
+        with SubmissionWorker(authentication, queue):
+            ...  # Enqueue URLs whenever pages are published.
+            queue.enqueue(["https://example.com/page1"])
+        ```
+
+        When leaving the context, the worker submits what is left in the queue before it stops.
+    """
+
+    __slots__ = [
+        "authentication",
+        "queue",
+        "client",
+        "batch_size",
+        "poll_interval",
+        "retry_interval",
+        "stop_event",
+        "thread",
+    ]
+
+    def __init__(
+        self,
+        authentication: IndexNowAuthentication,
+        queue: SubmissionQueue,
+        client: IndexNowClient | None = None,
+        batch_size: int = MAX_URLS_PER_BATCH,
+        poll_interval: float = DEFAULT_QUEUE_POLL_INTERVAL,
+        retry_interval: float = DEFAULT_QUEUE_RETRY_INTERVAL,
+    ) -> None:
+        if not 1 <= batch_size <= MAX_URLS_PER_BATCH:
+            raise ValueError(f"Batch size must be between 1 and {MAX_URLS_PER_BATCH:,}.")
+        self.authentication = authentication
+        self.queue = queue
+        self.client = client or get_default_client()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retry_interval = retry_interval
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return f"SubmissionWorker(queue={self.queue}, batch_size={self.batch_size})"
+
+    def __enter__(self) -> "SubmissionWorker":
+        self.start()
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.stop(drain=exc_type is None)
+
+    def start(self) -> None:
+        """Start draining the queue in a background thread."""
+
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="index-now-submission-worker", daemon=True)
+        self.thread.start()
+
+    def stop(self, drain: bool = True) -> None:
+        """Stop the background thread after the batch in progress, and optionally submit what is left in the queue."""
+
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if drain:
+            self.drain()
+
+    def run(self) -> None:
+        while not self.stop_event.is_set():
+            try:
+                result = self.submit_next_batch()
+            except Exception:  # E.g. a network error. The batch is still in the queue, so retry later.
+                logger.exception(
+                    "Failed to submit the next batch of the queue. Retrying in %g seconds.", self.retry_interval
+                )
+                self.stop_event.wait(self.retry_interval)
+                continue
+            if result is None:
+                self.stop_event.wait(self.poll_interval)
+            elif not result.is_success and not is_permanent_failure(result.status_code):
+                self.stop_event.wait(self.retry_interval)
+
+    def drain(self) -> None:
+        """Submit batches in the current thread until the queue is empty or a submission fails temporarily."""
+
+        while (result := self.submit_next_batch()) is not None:
+            # A batch that was rejected for good is already moved to the dead-letter table, so the next one can follow:
+            if not result.is_success and not is_permanent_failure(result.status_code):
+                logger.warning(
+                    "Stopped draining the queue, as a batch failed with status code %d. It stays in the queue.",
+                    result.status_code,
+                )
+                return
+
+    def submit_next_batch(self) -> SubmissionResult | None:
+        """Submit the oldest batch in the queue and remove it from the queue if it was submitted successfully, or move it to the dead-letter table if it was rejected for good. Returns `None` if the queue is empty."""
+
+        batch = self.queue.peek_batch(self.batch_size)
+        if batch is None:
+            return None
+        endpoint, urls = batch
+        result = submit_urls_to_index_now(
+            self.authentication, [url for url, _ in urls], endpoint, self.client, batch_size=self.batch_size
+        )
+        if result.is_success:
+            self.queue.acknowledge(endpoint, urls)
+        elif is_permanent_failure(result.status_code):
+            self.queue.move_to_dead_letter(endpoint, urls, result.status_code)
+            logger.warning(
+                "Moved %d URL(s) to the dead-letter table, as %s rejected them (status code: %d).",
+                len(urls),
+                endpoint,
+                result.status_code,
+            )
+        return result
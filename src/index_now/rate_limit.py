@@ -0,0 +1,147 @@
+import random
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+from .constant import DEFAULT_MAX_RETRY_AFTER
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse the value of a `Retry-After` header, which is either a number of seconds or an HTTP date, into seconds from now. Returns `None` if the value is missing or invalid."""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=UTC)
+    return max(0.0, (date - datetime.now(UTC)).total_seconds())
+
+
+def compute_retry_delay(
+    attempt: int, backoff_factor: float, retry_after: str | None, max_retry_after: float = DEFAULT_MAX_RETRY_AFTER
+) -> float | None:
+    """Compute how long to wait before the next attempt. A `Retry-After` header from the server takes precedence over the exponential backoff, which has jitter so that concurrent requests do not retry in lockstep.
+
+    Args:
+        attempt (int): Number of the attempt that failed, starting from `0`.
+        backoff_factor (float): Factor for the exponential backoff in seconds.
+        retry_after (str | None): Value of the `Retry-After` header of the response, if any.
+        max_retry_after (float, optional): Maximum number of seconds to wait if the server asks to retry later.
+
+    Returns:
+        float | None: Seconds to wait, or `None` if the server asks to wait longer than `max_retry_after`, so the request should not be retried.
+    """
+
+    retry_after_seconds = parse_retry_after(retry_after)
+    if retry_after_seconds is not None:
+        return retry_after_seconds if retry_after_seconds <= max_retry_after else None
+    backoff: float = backoff_factor * 2.0**attempt
+    return backoff / 2 + random.uniform(0, backoff / 2)
+
+
+class TokenBucket:
+    """Token bucket that limits the rate of requests to a single host. The rate adapts to the server: it is halved each time the server throttles requests and slowly recovers with each successful request (additive increase, multiplicative decrease).
+
+    Args:
+        rate (float | None): Maximum number of requests per second. No steady limit if set to `None`, but requests are still paused when the server throttles.
+        capacity (float): Maximum number of requests that can be sent in a burst.
+    """
+
+    __slots__ = ["rate", "max_rate", "capacity", "tokens", "updated_at", "resume_at", "lock"]
+
+    def __init__(self, rate: float | None, capacity: float) -> None:
+        self.rate = rate
+        self.max_rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.resume_at = 0.0
+        self.lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, capacity={self.capacity})"
+
+    def reserve(self) -> float:
+        """Reserve a token for the next request and get the number of seconds to wait before sending it."""
+
+        with self.lock:
+            now = time.monotonic()
+            wait = max(0.0, self.resume_at - now)
+            if self.rate is None:
+                return wait
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.rate)
+            return wait
+
+    def slow_down(self, delay: float) -> None:
+        """Pause all requests to the host for a number of seconds and halve the rate, because the server throttled a request."""
+
+        with self.lock:
+            self.resume_at = max(self.resume_at, time.monotonic() + delay)
+            if self.rate is not None and self.max_rate is not None:
+                self.rate = max(self.max_rate / 16, self.rate / 2)
+
+    def speed_up(self) -> None:
+        """Gradually recover the rate after a successful request."""
+
+        with self.lock:
+            if self.rate is not None and self.max_rate is not None:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class RateLimiter:
+    """Rate limiter with a token bucket per host, e.g. per search engine endpoint, so each endpoint is throttled according to its own limits. If a server responds with `429 Too Many Requests` or `503 Service Unavailable`, all requests to that host are paused, honouring any `Retry-After` header.
+
+    Args:
+        requests_per_second (float | None, optional): Maximum number of requests per second to each host. No steady limit if set to `None`, so requests are only paused when a server throttles.
+        burst (int, optional): Maximum number of requests that can be sent to each host in a burst.
+
+    Example:
+        Limit the rate of submissions to each endpoint:
+
+        ```python linenums="1" hl_lines="3"
+        from index_now import IndexNowClient, RateLimiter
+
+        client = IndexNowClient(rate_limiter=RateLimiter(requests_per_second=2, burst=4))
+        ```
+    """
+
+    __slots__ = ["requests_per_second", "burst", "buckets", "lock"]
+
+    def __init__(self, requests_per_second: float | None = None, burst: int = 1) -> None:
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("Requests per second must be positive.")
+        if burst < 1:
+            raise ValueError("Burst must be at least 1.")
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.buckets: dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(requests_per_second={self.requests_per_second}, burst={self.burst})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Locks cannot be pickled, e.g. for worker processes, so start over with empty buckets:
+        return (RateLimiter, (self.requests_per_second, self.burst))
+
+    def get_bucket(self, url: str) -> TokenBucket:
+        """Get the token bucket of the host of a URL."""
+
+        host = urlsplit(url).netloc
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+            return self.buckets[host]
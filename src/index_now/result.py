@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field
+
+from .status_code import SUCCESS_STATUS_CODES_COLLECTION
+
+
+@dataclass(slots=True, frozen=True)
+class BatchResult:
+    """Outcome of a single batch of URLs that was submitted in one request to the IndexNow API.
+
+    Attributes:
+        url_count (int): Number of URLs in the batch.
+        status_code (int): Status code of the response, e.g. `200` for success, `202` for accepted, `400` for bad request, etc.
+        response_text (str): Body of the response, which typically explains the reason for a failure.
+    """
+
+    url_count: int
+    status_code: int
+    response_text: str = ""
+
+    @property
+    def is_success(self) -> bool:
+        return self.status_code in SUCCESS_STATUS_CODES_COLLECTION
+
+
+@dataclass(slots=True, frozen=True)
+class SitemapOutcome:
+    """Outcome of downloading and parsing one of several sitemaps that are submitted together. A sitemap that fails is skipped, while the URLs of the other sitemaps are still submitted.
+
+    Attributes:
+        location (str): The location of the sitemap.
+        status_code (int | None): Status code of the response when downloading the sitemap, e.g. `200`, or `304` if the sitemap was reused from the cache, or `None` if no response was received, e.g. due to a connection error.
+        url_count (int): Number of URLs found in the sitemap and its nested sitemaps before filtering.
+        error (str): Reason why the sitemap was skipped, e.g. the response text or the error message. Empty if the sitemap was used.
+    """
+
+    location: str
+    status_code: int | None
+    url_count: int = 0
+    error: str = ""
+
+    @property
+    def is_success(self) -> bool:
+        return self.url_count > 0
+
+
+@dataclass(slots=True, frozen=True)
+class SubmissionResult:
+    """Outcome of a submission to the IndexNow API, including the result of each batch of URLs.
+
+    Attributes:
+        endpoint (str): The endpoint that the URLs were submitted to.
+        status_code (int): Overall status code. This is the status code of the first failed batch, if any, or otherwise the status code of the first batch.
+        batches (list[BatchResult]): Result of each batch in the order they were submitted.
+        sitemap_outcomes (list[SitemapOutcome]): Outcome of each sitemap in the given order when several sitemaps are submitted together. Empty otherwise.
+
+    Example:
+        Check whether all batches were submitted successfully:
+
+        ```python linenums="1" hl_lines="11-15"
+        from index_now import submit_urls_to_index_now, IndexNowAuthentication
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        urls = ["https://example.com/page1", "https://example.com/page2", "https://example.com/page3"]
+
+        result = submit_urls_to_index_now(authentication, urls)
+
+        if not result.is_success:
+            for batch in result.batches:
+                print(batch.url_count, batch.status_code, batch.response_text)
+        ```
+    """
+
+    endpoint: str
+    status_code: int
+    batches: list[BatchResult] = field(default_factory=list)
+    sitemap_outcomes: list[SitemapOutcome] = field(default_factory=list)
+
+    @classmethod
+    def from_batches(cls, endpoint: str, batches: list[BatchResult]) -> "SubmissionResult":
+        """Create a result with the overall status code derived from the batches."""
+
+        failed_batch = next((batch for batch in batches if not batch.is_success), None)
+        status_code = (failed_batch or batches[0]).status_code
+        return cls(endpoint=endpoint, status_code=status_code, batches=batches)
+
+    @property
+    def is_success(self) -> bool:
+        return self.status_code in SUCCESS_STATUS_CODES_COLLECTION
+
+    @property
+    def url_count(self) -> int:
+        return sum(batch.url_count for batch in self.batches)
+
+    @property
+    def submitted_url_count(self) -> int:
+        return sum(batch.url_count for batch in self.batches if batch.is_success)
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..constant import DEFAULT_CACHE_DIRECTORY, DEFAULT_SITEMAP_CACHE_MAX_SIZE
+from .parse import ParsedSitemap, SitemapUrl
+
+
+@dataclass(slots=True, frozen=True)
+class CachedSitemap:
+    """A previously downloaded and parsed sitemap together with the validators needed for a conditional request.
+
+    Attributes:
+        etag (str | None): The `ETag` header of the response, if any.
+        last_modified (str | None): The `Last-Modified` header of the response, if any.
+        parsed_sitemap (ParsedSitemap): The URLs and nested sitemap links that were parsed from the sitemap.
+    """
+
+    etag: str | None
+    last_modified: str | None
+    parsed_sitemap: ParsedSitemap
+
+    @property
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that ask the server to respond with `304 Not Modified` if the sitemap has not changed."""
+
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class SitemapCache:
+    """On-disk cache of parsed sitemaps that uses conditional requests with `ETag` and `Last-Modified` validators. If a sitemap has not changed since the last run, the server responds with `304 Not Modified` and the previously parsed URLs are reused instead of downloading and parsing the sitemap again.
+
+    Args:
+        directory (Path | str, optional): Directory to store the cached sitemaps in. Defaults to `index-now/sitemaps` in the user's cache directory.
+        max_size (int, optional): Maximum total size of the cache in bytes. The least recently used sitemaps are evicted when the limit is exceeded.
+
+    Example:
+        Reuse the same cache across scheduled runs, so unchanged sitemaps are neither downloaded nor parsed again:
+
+        ```python linenums="1" hl_lines="9 13"
+        from index_now import submit_sitemap_to_index_now, IndexNowAuthentication, SitemapCache
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        cache = SitemapCache()
+
+        sitemap_location = "https://example.com/sitemap.xml"
+
+        submit_sitemap_to_index_now(authentication, sitemap_location, cache=cache)
+        ```
+
+        Only sitemaps whose server sends an `ETag` or `Last-Modified` header are cached.
+    """
+
+    __slots__ = ["directory", "max_size"]
+
+    def __init__(
+        self,
+        directory: Path | str = DEFAULT_CACHE_DIRECTORY / "sitemaps",
+        max_size: int = DEFAULT_SITEMAP_CACHE_MAX_SIZE,
+    ) -> None:
+        if max_size < 0:
+            raise ValueError("Max size of the cache cannot be negative.")
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def __repr__(self) -> str:
+        return f"SitemapCache(directory={self.directory}, max_size={self.max_size})"
+
+    def get_path(self, sitemap_location: str) -> Path:
+        return self.directory / f"{hashlib.sha256(sitemap_location.encode()).hexdigest()}.json"
+
+    def get(self, sitemap_location: str) -> CachedSitemap | None:
+        """Get a cached sitemap by its location, or `None` if it is not cached or the cache entry is unreadable."""
+
+        path = self.get_path(sitemap_location)
+        try:
+            with open(path, encoding="utf-8") as file:
+                entry = json.load(file)
+            if entry["location"] != sitemap_location:
+                return None
+            os.utime(path)  # Mark as recently used for the eviction.
+            return CachedSitemap(
+                etag=entry["etag"],
+                last_modified=entry["last_modified"],
+                parsed_sitemap=ParsedSitemap(
+                    urls=[SitemapUrl(*url) for url in entry["urls"]], nested_sitemap_links=entry["nested_sitemap_links"]
+                ),
+            )
+        except Exception:
+            return None
+
+    def put(
+        self, sitemap_location: str, etag: str | None, last_modified: str | None, parsed_sitemap: ParsedSitemap
+    ) -> None:
+        """Store a parsed sitemap with its validators. Sitemaps without validators are not stored, as they can never be revalidated."""
+
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            "location": sitemap_location,
+            "etag": etag,
+            "last_modified": last_modified,
+            "urls": [[url.loc, url.lastmod, url.changefreq, url.priority] for url in parsed_sitemap.urls],
+            "nested_sitemap_links": parsed_sitemap.nested_sitemap_links,
+        }
+        path = self.get_path(sitemap_location)
+        temporary_path: Path | None = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Unique per call, so threads and processes that cache the same sitemap never write to the same file:
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.directory, prefix=f"{path.stem}.", suffix=".tmp", delete=False
+            ) as file:
+                temporary_path = Path(file.name)
+                json.dump(entry, file, separators=(",", ":"))
+            os.replace(temporary_path, path)  # Atomic, so concurrent readers never see a partial entry.
+            self.evict()
+        except OSError:
+            if temporary_path is not None:
+                temporary_path.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """Remove the least recently used sitemaps until the total size of the cache is within the limit."""
+
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                continue
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all cached sitemaps."""
+
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,247 @@
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from queue import Full, Queue
+from threading import Event
+from typing import TYPE_CHECKING
+
+from ..client import IndexNowClient
+from ..constant import DEFAULT_MAX_IO_WORKERS, DEFAULT_MAX_SITEMAP_DEPTH, SITEMAP_PART_SIZE
+from ..log import logger
+from .get import stream_sitemap_xml
+from .parse import ParsedSitemap, SitemapEntryType, SitemapUrl, fetch_and_parse_sitemap_xml, iterparse_sitemap_xml
+
+if TYPE_CHECKING:
+    from .cache import SitemapCache
+
+
+@dataclass(slots=True, frozen=True)
+class CrawledSitemap:
+    """The URLs of one XML sitemap found while crawling an index sitemap and its nested sitemaps. A large sitemap is found in several parts with the same location and position.
+
+    Attributes:
+        location (str | None): The location of the sitemap, or `None` for an index sitemap that was parsed before the crawl.
+        depth (int): The level of the sitemap, where the index sitemap is level 1 and its nested sitemaps are level 2.
+        position (tuple[int, ...]): The position of the sitemap in the tree of nested sitemaps, e.g. `(2, 0)` for the first sitemap of the third nested sitemap. Sorting by position gives the order of the sitemaps in the XML files. A sitemap that is linked from several sitemaps only gets the position of the first one that was downloaded.
+        urls (list[SitemapUrl]): The `<url>...</url>` elements of the sitemap, or of this part of the sitemap.
+    """
+
+    location: str | None
+    depth: int
+    position: tuple[int, ...] = ()
+    urls: list[SitemapUrl] = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
+class SitemapPart:
+    """A part of a sitemap that is handed over from a download thread to the crawl.
+
+    Attributes:
+        location (str | None): The location of the sitemap.
+        depth (int): The level of the sitemap.
+        position (tuple[int, ...]): The position of the sitemap in the tree of nested sitemaps.
+        urls (list[SitemapUrl] | None): The next URLs of the sitemap, or `None` if the sitemap could not be retrieved.
+        nested_sitemap_links (list[str] | None): The locations of the nested sitemaps in the last part of a sitemap, or `None` if more parts follow.
+    """
+
+    location: str | None
+    depth: int
+    position: tuple[int, ...]
+    urls: list[SitemapUrl] | None = None
+    nested_sitemap_links: list[str] | None = None
+
+
+class SitemapCrawler:
+    """Crawler that expands nested XML sitemaps to any depth, e.g. an index sitemap of per-locale index sitemaps of per-section sitemaps, and streams the URLs of each sitemap as it is being downloaded and parsed. Each sitemap is downloaded only once, so links that point back to an ancestor sitemap do not cause an endless loop.
+
+    Args:
+        client (IndexNowClient | None, optional): Client with a connection pool used to download the sitemaps. Uses a shared default client if set to `None`.
+        max_workers (int, optional): Maximum number of sitemaps to download and parse at the same time across all levels. This also limits how many parts of sitemaps are held in memory until they are consumed.
+        max_depth (int, optional): Maximum number of levels to crawl, where the index sitemap is level 1 and its nested sitemaps are level 2. Deeper sitemaps are skipped with a warning.
+        max_urls (int | None, optional): Maximum number of URLs to yield, after which the crawl stops with a warning. Unlimited if set to `None`.
+        cache (SitemapCache | None, optional): Cache of previously parsed sitemaps. Ignored if set to `None`.
+
+    Example:
+        Stream the URLs of a three-level sitemap index with at most 8 downloads at the same time:
+
+        ```python linenums="1" hl_lines="3 4"
+        from index_now import SitemapCrawler
+
+        crawler = SitemapCrawler(max_workers=8, max_depth=3, max_urls=1_000_000)
+        for url in crawler.crawl("https://example.com/sitemap_index.xml"):
+            print(url.loc)
+        ```
+    """
+
+    __slots__ = ["client", "max_workers", "max_depth", "max_urls", "cache"]
+
+    def __init__(
+        self,
+        client: IndexNowClient | None = None,
+        max_workers: int = DEFAULT_MAX_IO_WORKERS,
+        max_depth: int = DEFAULT_MAX_SITEMAP_DEPTH,
+        max_urls: int | None = None,
+        cache: "SitemapCache | None" = None,
+    ) -> None:
+        if max_workers < 1 or max_depth < 1:
+            raise ValueError("Max workers and max depth must be at least 1.")
+        if max_urls is not None and max_urls < 0:
+            raise ValueError("Max URLs cannot be negative.")
+        self.client = client
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+        self.max_urls = max_urls
+        self.cache = cache
+
+    def __repr__(self) -> str:
+        return f"SitemapCrawler(max_workers={self.max_workers}, max_depth={self.max_depth}, max_urls={self.max_urls})"
+
+    def crawl(self, sitemap_location: str) -> Iterator[SitemapUrl]:
+        """Download a sitemap and yield its URLs and the URLs of all its nested sitemaps. The URLs of each sitemap are yielded in order, while the URLs of sitemaps that are downloaded at the same time may be interleaved.
+
+        Args:
+            sitemap_location (str): The location of the index sitemap.
+
+        Yields:
+            SitemapUrl: Each URL found in the sitemap and its nested sitemaps.
+        """
+
+        for crawled_sitemap in self.crawl_sitemaps(sitemap_location):
+            yield from crawled_sitemap.urls
+
+    def crawl_sitemaps(
+        self, sitemap_location: str | None = None, parsed_sitemap: ParsedSitemap | None = None
+    ) -> Iterator[CrawledSitemap]:
+        """Crawl a sitemap and its nested sitemaps and yield the URLs of each sitemap as it is being downloaded and parsed. A sitemap with more than `SITEMAP_PART_SIZE` URLs is yielded in several parts in order, so large sitemaps are never held in memory as a whole. Sitemaps that cannot be retrieved are skipped with a warning.
+
+        The downloads pause while the parts are not consumed, and a nested sitemap is only downloaded once the sitemap that links to it has been consumed, so the memory usage is bounded by the number of workers rather than by the size of the sitemaps.
+
+        Args:
+            sitemap_location (str | None, optional): The location of the index sitemap. Only used to detect links back to it if the sitemap is already parsed.
+            parsed_sitemap (ParsedSitemap | None, optional): The index sitemap if it has already been downloaded and parsed, e.g. to check the status code of the response first. Downloaded from `sitemap_location` if set to `None`.
+
+        Yields:
+            CrawledSitemap: The location, depth, position and URLs of each sitemap or part of a sitemap. The sitemaps without URLs, e.g. index sitemaps, are also yielded.
+        """
+
+        if sitemap_location is None and parsed_sitemap is None:
+            raise ValueError("Either a sitemap location or a parsed sitemap must be given.")
+
+        remaining_url_count = self.max_urls
+        visited_locations = {sitemap_location} if sitemap_location is not None else set()
+        waiting: deque[tuple[str, int, tuple[int, ...]]] = deque()
+        parts: Queue[SitemapPart] = Queue(maxsize=self.max_workers)
+        is_stopped = Event()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        running_count = 0
+
+        def schedule(nested_sitemap_links: list[str], depth: int, position: tuple[int, ...]) -> None:
+            if nested_sitemap_links and depth > self.max_depth:
+                log_max_sitemap_depth_reached(len(nested_sitemap_links), self.max_depth)
+                return
+            for index, nested_sitemap_link in enumerate(nested_sitemap_links):
+                if nested_sitemap_link not in visited_locations:
+                    visited_locations.add(nested_sitemap_link)
+                    waiting.append((nested_sitemap_link, depth, (*position, index)))
+
+        def submit_waiting() -> None:
+            nonlocal running_count
+            while waiting and running_count < self.max_workers:
+                location, depth, position = waiting.popleft()
+                executor.submit(self.fetch_in_parts, SitemapPart(location, depth, position), parts, is_stopped)
+                running_count += 1
+
+        try:
+            if parsed_sitemap is None:
+                waiting.append((sitemap_location or "", 1, ()))
+                submit_waiting()
+            else:
+                parts.put(
+                    SitemapPart(sitemap_location, 1, (), parsed_sitemap.urls, parsed_sitemap.nested_sitemap_links)
+                )
+                running_count += 1
+            while running_count:
+                part = parts.get()
+                if part.nested_sitemap_links is not None:
+                    running_count -= 1
+                    schedule(part.nested_sitemap_links, part.depth + 1, part.position)
+                if part.urls is not None:
+                    urls = part.urls
+                    if remaining_url_count is not None:
+                        urls = urls[:remaining_url_count]
+                        remaining_url_count -= len(urls)
+                    yield CrawledSitemap(part.location, part.depth, part.position, urls)
+                    if remaining_url_count == 0 and (running_count or waiting or len(urls) < len(part.urls)):
+                        logger.warning(
+                            "Stopped crawling sitemaps after the limit of %d URLs was reached.", self.max_urls
+                        )
+                        return
+                # The next sitemap is only downloaded once the previous one has been consumed:
+                submit_waiting()
+        finally:
+            # Downloads are stopped if the crawl stops early, e.g. when the caller stops iterating:
+            is_stopped.set()
+            executor.shutdown(cancel_futures=True)
+
+    def fetch_in_parts(self, part: SitemapPart, parts: Queue[SitemapPart], is_stopped: Event) -> None:
+        """Download and parse a single sitemap incrementally and hand over its URLs in parts of at most `SITEMAP_PART_SIZE` URLs. The last part also holds the nested sitemap links. The sitemap is skipped with a warning if it could not be retrieved or parsed.
+
+        Args:
+            part (SitemapPart): The location, depth and position of the sitemap.
+            parts (Queue[SitemapPart]): Queue to hand over the parts to the crawl, which pauses the download while it is full.
+            is_stopped (Event): Set when the crawl has stopped, after which no more parts are handed over.
+        """
+
+        def hand_over(urls: list[SitemapUrl] | None, nested_sitemap_links: list[str] | None) -> bool:
+            while not is_stopped.is_set():
+                try:
+                    parts.put(replace(part, urls=urls, nested_sitemap_links=nested_sitemap_links), timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        urls: list[SitemapUrl] = []
+        nested_sitemap_links: list[str] = []
+        is_retrieved = True
+        try:
+            for entry_type, url in self.fetch_entries(part.location or ""):
+                if entry_type is SitemapEntryType.SITEMAP:
+                    nested_sitemap_links.append(url.loc)
+                    continue
+                urls.append(url)
+                if len(urls) == SITEMAP_PART_SIZE:
+                    if not hand_over(urls, None):
+                        return
+                    urls = []
+        except Exception:
+            logger.warning("Skipped a sitemap that could not be retrieved or parsed: %s", part.location)
+            is_retrieved = False
+        finally:
+            hand_over(urls if is_retrieved else None, nested_sitemap_links)
+
+    def fetch_entries(self, sitemap_location: str) -> Iterator[tuple[SitemapEntryType, SitemapUrl]]:
+        """Download a single sitemap and yield its URLs and nested sitemaps one by one as it is being downloaded. With a cache, the sitemap is downloaded and parsed as a whole first, so it can be cached.
+
+        Raises:
+            LookupError: If the sitemap could not be retrieved from the server or the cache.
+            lxml.etree.XMLSyntaxError: If the sitemap could not be retrieved or is not a valid XML sitemap.
+        """
+
+        if self.cache is None:
+            yield from iterparse_sitemap_xml(stream_sitemap_xml(sitemap_location, self.client))
+            return
+        _, parsed_sitemap = fetch_and_parse_sitemap_xml(
+            sitemap_location, self.client, self.cache, timeout=10, stream=True
+        )
+        if parsed_sitemap is None:
+            raise LookupError(f"The sitemap could not be retrieved: {sitemap_location}")
+        yield from ((SitemapEntryType.URL, url) for url in parsed_sitemap.urls)
+        yield from ((SitemapEntryType.SITEMAP, SitemapUrl(link)) for link in parsed_sitemap.nested_sitemap_links)
+
+
+def log_max_sitemap_depth_reached(number_of_sitemaps: int, max_depth: int) -> None:
+    """Log that nested sitemaps were skipped, as they are deeper than the maximum number of levels."""
+
+    logger.warning("Skipped %d nested sitemap(s) beyond the limit of %d levels.", number_of_sitemaps, max_depth)
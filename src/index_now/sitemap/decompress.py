@@ -0,0 +1,54 @@
+import zlib
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from typing import Any, TypeGuard
+
+from index_now.constant import DEFAULT_CHUNK_SIZE, GZIP_MAGIC_NUMBER
+
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def is_gzip_compressed(sitemap_content: str | bytes | Any) -> TypeGuard[bytes]:
+    """Check whether the contents of a sitemap file are gzip compressed, e.g. from a `sitemap.xml.gz` file, by looking for the gzip magic number."""
+
+    return isinstance(sitemap_content, bytes) and sitemap_content.startswith(GZIP_MAGIC_NUMBER)
+
+
+def decompress_sitemap_chunks(sitemap_chunks: Iterable[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Transparently decompress the chunks of a gzip compressed sitemap file as they arrive. Chunks that are not gzip compressed are passed through unchanged.
+
+    Args:
+        sitemap_chunks (Iterable[bytes]): The content of the sitemap file in chunks, compressed or not.
+        chunk_size (int, optional): Maximum size of each decompressed chunk in bytes, so a highly compressed input never expands into one large buffer.
+
+    Yields:
+        bytes: The next chunk of the decompressed XML sitemap file.
+
+    Raises:
+        zlib.error: If the content starts like gzip but is corrupt.
+    """
+
+    chunks = iter(sitemap_chunks)
+
+    # Read enough of the beginning to detect the gzip magic number:
+    first_chunk = b""
+    while len(first_chunk) < len(GZIP_MAGIC_NUMBER) and (chunk := next(chunks, None)) is not None:
+        first_chunk += chunk
+    if not is_gzip_compressed(first_chunk):
+        if first_chunk:
+            yield first_chunk
+        yield from chunks
+        return
+
+    decompressor = zlib.decompressobj(wbits=GZIP_WBITS)
+    for chunk in chain([first_chunk], chunks):
+        compressed_data = chunk
+        while compressed_data:
+            if decompressed_data := decompressor.decompress(compressed_data, chunk_size):
+                yield decompressed_data
+            compressed_data = decompressor.unconsumed_tail
+            if decompressor.eof:  # A gzip file may consist of several concatenated members.
+                compressed_data = decompressor.unused_data
+                decompressor = zlib.decompressobj(wbits=GZIP_WBITS)
+    if decompressed_data := decompressor.flush():
+        yield decompressed_data
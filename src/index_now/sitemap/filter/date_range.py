@@ -1,5 +1,5 @@
 from abc import ABC
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 
 class DateRange(ABC):
@@ -49,6 +49,11 @@ class DateRange(ABC):
 
         return self.start.date() <= date.date() <= self.end.date()
 
+    def get_ordinal_bounds(self) -> tuple[int, int]:
+        """Get the first and last day within the date range as proleptic Gregorian ordinals, e.g. to compare dates as integers. The range is empty if the first day is after the last day. Subclasses that override `is_within_range()` should override this method accordingly, as a `SitemapUrlTable` is otherwise filtered by calling `is_within_range()` for each row."""
+
+        return self.start.toordinal(), self.end.toordinal()
+
 
 class Between(DateRange):
     """A date range between two not included dates for filtering sitemap URLs.
@@ -82,6 +87,9 @@ class Between(DateRange):
 
         return self.start.date() < date.date() < self.end.date()
 
+    def get_ordinal_bounds(self) -> tuple[int, int]:
+        return self.start.toordinal() + 1, self.end.toordinal() - 1
+
 
 class Today(DateRange):
     """Today as range for filtering sitemap URLs.
@@ -204,6 +212,9 @@ class LaterThan(DateRange):
 
         return self.start.date() < date.date()
 
+    def get_ordinal_bounds(self) -> tuple[int, int]:
+        return self.start.toordinal() + 1, date.max.toordinal()
+
 
 class LaterThanAndIncluding(DateRange):
     """Period of time after and including a specific date as range for filtering sitemap URLs.
@@ -236,6 +247,9 @@ class LaterThanAndIncluding(DateRange):
 
         return self.start.date() <= date.date()
 
+    def get_ordinal_bounds(self) -> tuple[int, int]:
+        return self.start.toordinal(), date.max.toordinal()
+
 
 class EarlierThan(DateRange):
     """Period of time before a specific date as range for filtering sitemap URLs.
@@ -268,6 +282,9 @@ class EarlierThan(DateRange):
 
         return date.date() < self.end.date()
 
+    def get_ordinal_bounds(self) -> tuple[int, int]:
+        return date.min.toordinal(), self.end.toordinal() - 1
+
 
 class EarlierThanAndIncluding(DateRange):
     """Period of time before and including a specific date as range for filtering sitemap URLs.
@@ -299,3 +316,6 @@ class EarlierThanAndIncluding(DateRange):
         """Check if a given date is within the date range."""
 
         return date.date() <= self.end.date()
+
+    def get_ordinal_bounds(self) -> tuple[int, int]:
+        return date.min.toordinal(), self.end.toordinal()
@@ -1,10 +1,22 @@
+import bisect
+import logging
 import re
-from dataclasses import dataclass
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from colorist import Color
-
+from ...log import logger
 from ..parse import SitemapUrl
+from ..table import (
+    CHANGE_FREQUENCY_CODES,
+    MISSING_CHANGE_FREQUENCY,
+    MISSING_LASTMOD,
+    SitemapUrlTable,
+    get_timestamp_bounds,
+    get_timestamp_predicate,
+    has_ordinal_bounds,
+)
 from .change_frequency import ChangeFrequency
 from .date_range import DateRange
 
@@ -18,7 +30,7 @@ class SitemapFilter:
         date_range (DateRange | None): Optional filter for URLs based on a date range, e.g. `Today`, `Day`, `DaysAgo`, `LaterThan`, `EarlierThan`, etc. Note that if no `<lastmod>` element is found in the sitemap entry, the filter is bypassed. Ignored by default or if set to `None`.
         contains (str | None): Optional filter for URLs. Can be simple string (e.g. `"section1"`) or regular expression (e.g. `r"(section1)|(section2)"`). Ignored by default or if set to `None`.
         excludes (str | None): Optional filter for URLs. Can be simple string (e.g. `"not-include-this"`) or regular expression (e.g. `r"(not-include-this)|(not-include-that)"`). Ignored by default or if set to `None`.
-        skip (int | None): Optional number of URLs to be skipped. Ignored by default or if set to `None`.
+        skip (int | None): Optional number of URLs to be skipped, which cannot be negative. Ignored by default or if set to `None`.
         take (int | None): Optional limit of URLs to be taken. Ignored by default or if set to `None`.
 
     Example:
@@ -92,72 +104,378 @@ class SitemapFilter:
     skip: int | None = None
     take: int | None = None
 
+    def __post_init__(self) -> None:
+        if self.skip is not None and self.skip < 0:
+            raise ValueError("Skip cannot be negative.")
+
+    def compile(self) -> "CompiledSitemapFilter":
+        """Compile the filter once into a reusable predicate pipeline, e.g. when the same filter is applied to many sitemaps."""
+
+        return CompiledSitemapFilter(self)
+
+
+@dataclass(slots=True, frozen=True)
+class FilterReport:
+    """Outcome of filtering sitemap URLs, with the number of URLs removed by each criterion.
+
+    Attributes:
+        urls (list[str]): The URLs left after filtering.
+        url_count_before (int): Number of URLs before filtering.
+        removed_counts (dict[str, int]): Number of URLs removed by each criterion in the order they are applied, e.g. `{"date_range": 120, "take": 30}`. A URL is counted under the first criterion it does not meet, and the URLs left unevaluated once `take` is reached are counted under `take`. Criteria that are not set are left out.
+
+    Example:
+        ```python linenums="1" hl_lines="5-7"
+        from index_now import SitemapFilter, DaysAgo
+        from index_now.sitemap.filter.sitemap import filter_sitemap_urls_with_report
+
+        report = filter_sitemap_urls_with_report(urls, SitemapFilter(date_range=DaysAgo(2), take=100))
+        print(report.url_count_before, len(report.urls))
+        for criterion, removed_count in report.removed_counts.items():
+            print(criterion, removed_count)
+        ```
+    """
+
+    urls: list[str]
+    url_count_before: int
+    removed_counts: dict[str, int] = field(default_factory=dict)
+
+
+class CompiledSitemapFilter:
+    """A `SitemapFilter` compiled into a predicate pipeline that evaluates all criteria in a single pass over the URLs. Regular expressions are compiled and the change frequency is normalized only once, and each distinct `<lastmod>` date is checked against the date range only once. Once `take` URLs have been found, the remaining URLs are not evaluated at all.
+
+    Args:
+        sitemap_filter (SitemapFilter): The filter to compile.
+
+    Example:
+        Compile the filter once and reuse it for many sitemaps:
+
+        ```python linenums="1" hl_lines="3 6"
+        from index_now import SitemapFilter, DaysAgo
+
+        compiled_filter = SitemapFilter(date_range=DaysAgo(2), contains="section1").compile()
 
-def filter_sitemap_urls(urls: list[SitemapUrl], filter: SitemapFilter) -> list[str]:
+        for urls in list_of_sitemap_urls:
+            filtered_urls = compiled_filter.filter(urls)
+        ```
+    """
+
+    __slots__ = ["sitemap_filter", "change_frequency", "date_range_results", "contains", "excludes", "criteria"]
+
+    def __init__(self, sitemap_filter: SitemapFilter) -> None:
+        self.sitemap_filter = sitemap_filter
+        self.change_frequency = (
+            str(sitemap_filter.change_frequency).lower() if sitemap_filter.change_frequency is not None else None
+        )
+        self.date_range_results: dict[str, bool] = {}  # Result of the date range check for each distinct date.
+        self.contains = re.compile(sitemap_filter.contains) if sitemap_filter.contains is not None else None
+        self.excludes = re.compile(sitemap_filter.excludes) if sitemap_filter.excludes is not None else None
+        self.criteria = [
+            criterion
+            for criterion, value in [
+                ("change_frequency", sitemap_filter.change_frequency),
+                ("date_range", sitemap_filter.date_range),
+                ("contains", sitemap_filter.contains),
+                ("excludes", sitemap_filter.excludes),
+            ]
+            if value is not None
+        ]
+
+    def __repr__(self) -> str:
+        return f"CompiledSitemapFilter({self.sitemap_filter})"
+
+    def is_within_date_range(self, date_range: DateRange, lastmod: str) -> bool:
+        """Check the date of a `<lastmod>` value against the date range. Timestamps on the same day share the result, as the range is evaluated by date only."""
+
+        day = lastmod[:10]
+        is_within_range = self.date_range_results.get(day)
+        if is_within_range is None:
+            is_within_range = date_range.is_within_range(datetime.fromisoformat(lastmod))
+            self.date_range_results[day] = is_within_range
+        return is_within_range
+
+    def filter(self, urls: list[SitemapUrl]) -> list[str]:
+        """Filter URLs based on the compiled criteria.
+
+        Args:
+            urls (list[SitemapUrl]): List of URLs to be filtered.
+
+        Returns:
+            list[str]: Filtered list of URLs, or empty list if no URLs are left.
+        """
+
+        return self.filter_with_report(urls).urls
+
+    def filter_with_report(self, urls: list[SitemapUrl]) -> FilterReport:
+        """Filter URLs based on the compiled criteria and report how many URLs were removed by each criterion.
+
+        Args:
+            urls (list[SitemapUrl]): List of URLs to be filtered.
+
+        Returns:
+            FilterReport: The filtered list of URLs and the number of URLs removed by each criterion. A URL is counted under the first criterion it does not meet, and URLs that were not evaluated because `take` was reached are counted under `take`.
+        """
+
+        report = FilterReport(urls=[], url_count_before=len(urls))
+        if self.is_nothing_to_filter(report):
+            return report
+
+        skip = self.sitemap_filter.skip
+        take = self.sitemap_filter.take
+        # The criteria are evaluated inline with local variables, as a function call per URL would cost more than the filtering itself:
+        change_frequency = self.change_frequency
+        change_frequency_results: dict[str, bool] = {}
+        date_range = self.sitemap_filter.date_range
+        date_range_results = self.date_range_results
+        contains = self.contains.search if self.contains is not None else None
+        excludes = self.excludes.search if self.excludes is not None else None
+        removed_by_change_frequency = removed_by_date_range = removed_by_contains = removed_by_excludes = 0
+        skip_count = skip or 0
+        take_count = len(urls) if take is None else take
+        number_of_evaluated_urls = 0
+        filtered_urls = report.urls
+        for url in urls:
+            if not take_count:
+                break
+            number_of_evaluated_urls += 1
+            if change_frequency is not None and (changefreq := url.changefreq):
+                is_match = change_frequency_results.get(changefreq)
+                if is_match is None:
+                    is_match = change_frequency_results[changefreq] = changefreq.lower() == change_frequency
+                if not is_match:
+                    removed_by_change_frequency += 1
+                    continue
+            if date_range is not None and (lastmod := url.lastmod):
+                is_within_range = date_range_results.get(lastmod[:10])
+                if is_within_range is None:
+                    is_within_range = self.is_within_date_range(date_range, lastmod)
+                if not is_within_range:
+                    removed_by_date_range += 1
+                    continue
+            if contains is not None and not contains(url.loc):
+                removed_by_contains += 1
+                continue
+            if excludes is not None and excludes(url.loc):
+                removed_by_excludes += 1
+                continue
+            if skip_count:
+                skip_count -= 1
+                continue
+            filtered_urls.append(url.loc)
+            take_count -= 1
+
+        removed_counts = {
+            "change_frequency": removed_by_change_frequency,
+            "date_range": removed_by_date_range,
+            "contains": removed_by_contains,
+            "excludes": removed_by_excludes,
+        }
+        return self.complete_report(report, removed_counts, skip_count, number_of_evaluated_urls)
+
+    def filter_stream(self, urls: Iterable[SitemapUrl]) -> Iterator[str]:
+        """Lazily filter a stream of URLs, e.g. as nested sitemaps are being downloaded, and yield each URL that meets the compiled criteria. Once `take` URLs have been yielded, the stream is not consumed any further.
+
+        Args:
+            urls (Iterable[SitemapUrl]): URLs to be filtered.
+
+        Yields:
+            str: Each URL left after filtering, in the order of the stream.
+        """
+
+        skip_count = self.sitemap_filter.skip or 0
+        take_count = self.sitemap_filter.take
+        if take_count is not None and take_count <= 0:
+            return
+        for url in urls:
+            if not self.is_match(url):
+                continue
+            if skip_count:
+                skip_count -= 1
+                continue
+            yield url.loc
+            if take_count is not None:
+                take_count -= 1
+                if not take_count:
+                    return
+
+    def is_match(self, url: SitemapUrl) -> bool:
+        """Check whether a URL meets the change frequency, date range, `contains` and `excludes` criteria. Missing `<changefreq>` and `<lastmod>` values are accepted."""
+
+        if self.change_frequency is not None and url.changefreq and url.changefreq.lower() != self.change_frequency:
+            return False
+        date_range = self.sitemap_filter.date_range
+        if date_range is not None and url.lastmod and not self.is_within_date_range(date_range, url.lastmod):
+            return False
+        if self.contains is not None and not self.contains.search(url.loc):
+            return False
+        return self.excludes is None or not self.excludes.search(url.loc)
+
+    def filter_table_with_report(self, table: SitemapUrlTable) -> FilterReport:
+        """Filter the rows of a `SitemapUrlTable` based on the compiled criteria and report how many URLs were removed by each criterion. The change frequency and date range are evaluated column by column as integer comparisons, and only the remaining rows are decoded for the `contains` and `excludes` patterns. Like for a list of URLs, date ranges are evaluated on the calendar date of `<lastmod>` as written.
+
+        Args:
+            table (SitemapUrlTable): Table of URLs to be filtered.
+
+        Returns:
+            FilterReport: The filtered list of URLs and the number of URLs removed by each criterion, counted the same way as for a list of URLs.
+        """
+
+        report = FilterReport(urls=[], url_count_before=len(table))
+        if self.is_nothing_to_filter(report):
+            return report
+
+        # Each column criterion narrows down the sorted row indices. They are kept to count removed rows afterwards:
+        column_stages: list[tuple[str, list[int] | range]] = []
+        row_indices: list[int] | range = range(len(table))
+        change_frequencies = table.change_frequencies
+        accepted_codes = {
+            MISSING_CHANGE_FREQUENCY,
+            CHANGE_FREQUENCY_CODES.get(self.change_frequency or "", MISSING_CHANGE_FREQUENCY),
+        }
+        if self.change_frequency is not None:
+            row_indices = [index for index in row_indices if change_frequencies[index] in accepted_codes]
+            column_stages.append(("change_frequency", row_indices))
+        date_range = self.sitemap_filter.date_range
+        if date_range is not None:
+            # The index can only be searched by ordinal bounds, so other date ranges are evaluated row by row:
+            lastmod_index = table.lastmod_index if has_ordinal_bounds(date_range) else None
+            start, stop = lastmod_index.get_position_bounds(date_range) if lastmod_index is not None else (0, 0)
+            if lastmod_index is not None and lastmod_index.is_selective(stop - start, len(row_indices)):
+                # The sorted index finds the rows within the date range by binary search, which are then put back in order:
+                row_indices = sorted(
+                    lastmod_index.row_indices[start:stop] + array("Q", lastmod_index.missing_row_indices)
+                )
+                if self.change_frequency is not None:
+                    row_indices = [index for index in row_indices if change_frequencies[index] in accepted_codes]
+            elif has_ordinal_bounds(date_range):
+                lower_bound, upper_bound = get_timestamp_bounds(date_range)
+                lastmods = table.lastmods
+                row_indices = [
+                    index
+                    for index in row_indices
+                    if lower_bound <= (lastmod := lastmods[index]) < upper_bound or lastmod == MISSING_LASTMOD
+                ]
+            else:
+                is_within_range = get_timestamp_predicate(date_range)
+                lastmods = table.lastmods
+                row_indices = [
+                    index
+                    for index in row_indices
+                    if (lastmod := lastmods[index]) == MISSING_LASTMOD or is_within_range(lastmod)
+                ]
+            column_stages.append(("date_range", row_indices))
+
+        contains = self.contains.search if self.contains is not None else None
+        excludes = self.excludes.search if self.excludes is not None else None
+        removed_counts = dict.fromkeys(["change_frequency", "date_range", "contains", "excludes"], 0)
+        skip_count = self.sitemap_filter.skip or 0
+        take = self.sitemap_filter.take
+        take_count = len(table) if take is None else take
+        number_of_evaluated_urls = len(table)
+        filtered_urls = report.urls
+        for index in row_indices:
+            location = table.get_location(index)
+            if contains is not None and not contains(location):
+                removed_counts["contains"] += 1
+                continue
+            if excludes is not None and excludes(location):
+                removed_counts["excludes"] += 1
+                continue
+            if skip_count:
+                skip_count -= 1
+                continue
+            filtered_urls.append(location)
+            take_count -= 1
+            if not take_count:
+                number_of_evaluated_urls = index + 1
+                break
+
+        # Only count the rows removed by the column criteria before take was reached, like the single pass over a list does:
+        previous_count = number_of_evaluated_urls
+        for criterion, stage_row_indices in column_stages:
+            count = bisect.bisect_left(stage_row_indices, number_of_evaluated_urls)
+            removed_counts[criterion] = previous_count - count
+            previous_count = count
+        return self.complete_report(report, removed_counts, skip_count, number_of_evaluated_urls)
+
+    def is_nothing_to_filter(self, report: FilterReport) -> bool:
+        """Check whether the result is empty before filtering, i.e. if there are no URLs or `take` is not positive."""
+
+        if not report.url_count_before:
+            logger.warning("No URLs given before filtering.")
+            return True
+        take = self.sitemap_filter.take
+        if take is not None and take <= 0:
+            logger.warning("No URLs left. The value for take should be greater than 0.")
+            report.removed_counts.update(dict.fromkeys(self.criteria, 0), take=report.url_count_before)
+            return True
+        return False
+
+    def complete_report(
+        self, report: FilterReport, removed_counts: dict[str, int], skip_count: int, number_of_evaluated_urls: int
+    ) -> FilterReport:
+        """Add the number of URLs removed by each criterion to the report and log the outcome."""
+
+        report.removed_counts.update((criterion, removed_counts[criterion]) for criterion in self.criteria)
+        if self.sitemap_filter.skip is not None:
+            report.removed_counts["skip"] = self.sitemap_filter.skip - skip_count
+        if self.sitemap_filter.take is not None:
+            report.removed_counts["take"] = report.url_count_before - number_of_evaluated_urls
+        if not report.urls:
+            self.log_empty_result(report)
+        if logger.isEnabledFor(logging.DEBUG):
+            for criterion, removed_count in report.removed_counts.items():
+                logger.debug(
+                    "Number of URLs removed by %s: %d of %d", criterion, removed_count, report.url_count_before
+                )
+        return report
+
+    def log_empty_result(self, report: FilterReport) -> None:
+        """Log the first criterion that left no URLs."""
+
+        number_of_urls_left = report.url_count_before
+        for criterion, removed_count in report.removed_counts.items():
+            number_of_urls_left -= removed_count
+            if number_of_urls_left > 0:
+                continue
+            if criterion == "contains":
+                logger.warning('No URLs contained the pattern "%s".', self.sitemap_filter.contains)
+            elif criterion == "excludes":
+                logger.warning('No URLs left after excluding the pattern "%s".', self.sitemap_filter.excludes)
+            elif criterion == "skip":
+                logger.warning("No URLs left after skipping %d URL(s) from sitemap.", self.sitemap_filter.skip)
+            return
+
+
+def filter_sitemap_urls(
+    urls: list[SitemapUrl] | SitemapUrlTable, filter: SitemapFilter | CompiledSitemapFilter
+) -> list[str]:
     """Filter URLs based on the given criteria.
 
     Args:
-        urls (list[SitemapUrl]): List of URLs to be filtered.
-        filter (SitemapFilter): Filter for URLs.
+        urls (list[SitemapUrl] | SitemapUrlTable): List or table of URLs to be filtered.
+        filter (SitemapFilter | CompiledSitemapFilter): Filter for URLs. Compile the filter beforehand with `filter.compile()` to reuse it for many lists of URLs.
 
     Returns:
         list[str]: Filtered list of URLs, or empty list if no URLs are found.
     """
 
-    def filter_by_change_frequency(urls: list[SitemapUrl], change_frequency: ChangeFrequency | str) -> list[SitemapUrl]:
-        return [url for url in urls if not url.changefreq or url.changefreq.lower() == str(change_frequency).lower()]
+    return filter_sitemap_urls_with_report(urls, filter).urls
 
-    def filter_by_date_range(urls: list[SitemapUrl], date_range: DateRange) -> list[SitemapUrl]:
-        return [
-            url for url in urls if not url.lastmod or date_range.is_within_range(datetime.fromisoformat(url.lastmod))
-        ]
 
-    if not urls:
-        print(f"{Color.YELLOW}No URLs given before filtering.{Color.OFF}")
-        return []
-
-    if filter.change_frequency is not None:
-        print(f"Number of URLs before filtering by change frequency {filter.change_frequency}: {len(urls)}")
-        urls = filter_by_change_frequency(urls, filter.change_frequency)
-        print(f"Number of URLs left after filtering by change frequency {filter.change_frequency}: {len(urls)}")
-
-    if filter.date_range is not None:
-        print(f"Number of URLs before filtering by date range {filter.date_range}: {len(urls)}")
-        urls = filter_by_date_range(urls, filter.date_range)
-        print(f"Number of URLs left after filtering by date range {filter.date_range}: {len(urls)}")
-
-    if filter.contains is not None:
-        print(f'Number of URLs before filtering by contains "{filter.contains}": {len(urls)}')
-        pattern = re.compile(filter.contains)
-        urls = [url for url in urls if pattern.search(url.loc)]
-        if not urls:
-            print(f'{Color.YELLOW}No URLs contained the pattern "{filter.contains}".{Color.OFF}')
-            return []
-        print(f'Number of URLs left after filtering by contains "{filter.contains}": {len(urls)}')
-
-    if filter.excludes is not None:
-        print(f'Number of URLs before filtering by excludes "{filter.excludes}": {len(urls)}')
-        pattern = re.compile(filter.excludes)
-        urls = [url for url in urls if not pattern.search(url.loc)]
-        if not urls:
-            print(f'{Color.YELLOW}No URLs left after excluding the pattern "{filter.excludes}".{Color.OFF}')
-            return []
-        print(f'Number of URLs left after filtering by excludes "{filter.excludes}": {len(urls)}')
-
-    if filter.skip is not None:
-        if filter.skip >= len(urls):
-            print(f"{Color.YELLOW}No URLs left after skipping {filter.skip} URL(s) from sitemap.{Color.OFF}")
-            return []
-        print(f"Number of URLs before skipping {filter.skip} URL(s) from sitemap: {len(urls)}")
-        urls = urls[filter.skip :]
-        print(f"Number of URLs left after skipping {filter.skip} URL(s) from sitemap: {len(urls)}")
-
-    if filter.take is not None:
-        if filter.take <= 0:
-            print(f"{Color.YELLOW}No URLs left. The value for take should be greater than 0.{Color.OFF}")
-            return []
-        print(f"Number of URLs before taking {filter.take} URL(s) from sitemap: {len(urls)}")
-        urls = urls[: filter.take]
-        print(f"Number of URLs left after taking {filter.take} URL(s) from sitemap: {len(urls)}")
-
-    return [url.loc for url in urls]
+def filter_sitemap_urls_with_report(
+    urls: list[SitemapUrl] | SitemapUrlTable, filter: SitemapFilter | CompiledSitemapFilter
+) -> FilterReport:
+    """Filter URLs based on the given criteria and report how many URLs were removed by each criterion.
+
+    Args:
+        urls (list[SitemapUrl] | SitemapUrlTable): List or table of URLs to be filtered.
+        filter (SitemapFilter | CompiledSitemapFilter): Filter for URLs. Compile the filter beforehand with `filter.compile()` to reuse it for many lists of URLs.
+
+    Returns:
+        FilterReport: The filtered list of URLs, which is empty if no URLs are left, and the number of URLs removed by each criterion.
+    """
+
+    compiled_filter = filter if isinstance(filter, CompiledSitemapFilter) else filter.compile()
+    if isinstance(urls, SitemapUrlTable):
+        return compiled_filter.filter_table_with_report(urls)
+    return compiled_filter.filter_with_report(urls)
@@ -1,37 +1,70 @@
-from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Iterator
+from itertools import repeat
 from typing import Any
 
-import requests
+from index_now.client import IndexNowClient, get_default_client
+from index_now.constant import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_IO_WORKERS
+from index_now.executor import map_in_threads
 
-from index_now.constant import NUMBER_OF_CPU_CORES
 
-
-def get_sitemap_xml(sitemap_location: str) -> str | bytes | Any:
+def get_sitemap_xml(sitemap_location: str, client: IndexNowClient | None = None) -> str | bytes | Any:
     """Get the contents of an XML sitemap file.
 
     Args:
         sitemap_location (str): The location of the sitemap to get the URLs from.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across calls. Uses a shared default client if set to `None`.
 
     Returns:
-        str | bytes | Any: The contents of the XML sitemp file or an empty string if the sitemap could not be retrieved.
+        str | bytes | Any: The contents of the XML sitemp file, still compressed if it is a `sitemap.xml.gz` file, or an empty string if the sitemap could not be retrieved.
     """
 
     if not sitemap_location:
         return ""
 
     try:
-        response = requests.get(sitemap_location, timeout=10)
+        client = client or get_default_client()
+        response = client.get(sitemap_location, timeout=10)
         response.raise_for_status()
         return response.content
     except Exception:
         return ""
 
 
-def get_multiple_sitemap_xml(sitemap_locations: list[str]) -> list[str | bytes | Any]:
-    """Get the contents of multiple XML sitemaps in parallel.
+def stream_sitemap_xml(
+    sitemap_location: str, client: IndexNowClient | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Stream the contents of an XML sitemap file in chunks as they are downloaded, so the entire file does not need to be held in memory.
+
+    Args:
+        sitemap_location (str): The location of the sitemap to get the URLs from.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across calls. Uses a shared default client if set to `None`.
+        chunk_size (int, optional): Maximum size of each chunk in bytes.
+
+    Yields:
+        bytes: The next chunk of the XML sitemap file as downloaded, i.e. still compressed if it is a `sitemap.xml.gz` file. Nothing is yielded if the sitemap could not be retrieved.
+    """
+
+    if not sitemap_location:
+        return
+
+    try:
+        client = client or get_default_client()
+        with client.get(sitemap_location, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=chunk_size)
+    except Exception:
+        return
+
+
+def get_multiple_sitemap_xml(
+    sitemap_locations: list[str], client: IndexNowClient | None = None, max_workers: int = DEFAULT_MAX_IO_WORKERS
+) -> list[str | bytes | Any]:
+    """Get the contents of multiple XML sitemaps in parallel threads.
 
     Args:
         sitemap_locations (list[str]): List of sitemap locations to get the URLs from.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across calls. Uses a shared default client if set to `None`.
+        max_workers (int, optional): Maximum number of sitemaps to download at the same time.
 
     Returns:
         list[str | bytes | Any]: List of the contents of the XML sitemap files or an empty list if the sitemaps could not be retrieved.
@@ -41,10 +74,9 @@ def get_multiple_sitemap_xml(sitemap_locations: list[str]) -> list[str | bytes |
     if not sitemap_locations:
         return []
     if len(sitemap_locations) == 1:
-        return [get_sitemap_xml(sitemap_locations[0])]
-
-    max_workers = min(NUMBER_OF_CPU_CORES - 1, len(sitemap_locations))
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        multiple_contents = list(executor.map(get_sitemap_xml, sitemap_locations))
+        return [get_sitemap_xml(sitemap_locations[0], client)]
 
-    return multiple_contents
+    client = client or get_default_client()
+    return map_in_threads(
+        get_sitemap_xml, sitemap_locations, repeat(client), max_workers=min(max_workers, len(sitemap_locations))
+    )
@@ -1,15 +1,24 @@
-from concurrent.futures import ProcessPoolExecutor
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
 from enum import StrEnum, auto, unique
-from itertools import repeat
-from typing import Any
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
 
 import lxml.etree
-from colorist import Color
+import requests
 
-from index_now.constant import NUMBER_OF_CPU_CORES
+from index_now.client import IndexNowClient, get_default_client
+from index_now.constant import DEFAULT_CHUNK_SIZE
+from index_now.executor import DEFAULT_EXECUTOR_STRATEGY, ExecutorStrategy, ParseExecutor, map_in_processes
+from index_now.log import logger
 
-from .get import get_sitemap_xml
+from .decompress import decompress_sitemap_chunks, is_gzip_compressed
+from .filter.change_frequency import ChangeFrequency
+from .get import get_multiple_sitemap_xml
+
+if TYPE_CHECKING:  # Avoid a circular import, as the cache stores parsed sitemaps.
+    from .cache import SitemapCache
 
 
 @dataclass(slots=True, frozen=True)
@@ -29,6 +38,19 @@ class SitemapUrl:
     priority: float | None = None
 
 
+@dataclass(slots=True, frozen=True)
+class ParsedSitemap:
+    """Result of parsing an XML sitemap file once, i.e. both the URLs and the links to any nested XML sitemaps.
+
+    Attributes:
+        urls (list[SitemapUrl]): The `<url>...</url>` elements of the sitemap.
+        nested_sitemap_links (list[str]): The locations of the `<sitemap>...</sitemap>` elements of the sitemap.
+    """
+
+    urls: list[SitemapUrl] = field(default_factory=list)
+    nested_sitemap_links: list[str] = field(default_factory=list)
+
+
 @unique
 class SitemapEntryType(StrEnum):
     SITEMAP = auto()
@@ -37,6 +59,37 @@ class SitemapEntryType(StrEnum):
 
 SITEMAP_SCHEMA_NAMESPACE = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
 
+SITEMAP_ENTRY_TAGS = {
+    f"{{{SITEMAP_SCHEMA_NAMESPACE['ns']}}}{SitemapEntryType.URL}": SitemapEntryType.URL,
+    f"{{{SITEMAP_SCHEMA_NAMESPACE['ns']}}}{SitemapEntryType.SITEMAP}": SitemapEntryType.SITEMAP,
+}
+
+SITEMAP_LOC_TAG = f"{{{SITEMAP_SCHEMA_NAMESPACE['ns']}}}loc"
+SITEMAP_LASTMOD_TAG = f"{{{SITEMAP_SCHEMA_NAMESPACE['ns']}}}lastmod"
+SITEMAP_CHANGEFREQ_TAG = f"{{{SITEMAP_SCHEMA_NAMESPACE['ns']}}}changefreq"
+SITEMAP_PRIORITY_TAG = f"{{{SITEMAP_SCHEMA_NAMESPACE['ns']}}}priority"
+
+KNOWN_CHANGE_FREQUENCIES = frozenset(change_frequency.value for change_frequency in ChangeFrequency)
+
+
+def parse_sitemap_xml_tree(sitemap_content: str | bytes | Any) -> Any:
+    """Parse the contents of an XML sitemap file into an element tree. Gzip compressed content, e.g. from a `sitemap.xml.gz` file, is decompressed in chunks and fed directly into the parser, so the decompressed file is never held in memory as a whole.
+
+    Args:
+        content (str | bytes | Any): The content of the XML sitemap file, compressed or not.
+
+    Returns:
+        _Element: The root element of the XML sitemap file.
+    """
+
+    if not is_gzip_compressed(sitemap_content):
+        return lxml.etree.fromstring(sitemap_content)
+
+    parser = lxml.etree.XMLParser()
+    for chunk in decompress_sitemap_chunks([sitemap_content]):
+        parser.feed(chunk)
+    return parser.close()
+
 
 def parse_sitemap_xml_and_get_xpath_objects(
     sitemap_content: str | bytes | Any, type: SitemapEntryType, loc_only: bool
@@ -57,10 +110,180 @@ def parse_sitemap_xml_and_get_xpath_objects(
         return f"{base_xpath}/ns:loc/text()" if loc_only else base_xpath
 
     xpath = define_xpath(type, loc_only)
-    sitemap_tree = lxml.etree.fromstring(sitemap_content)
+    sitemap_tree = parse_sitemap_xml_tree(sitemap_content)
     return sitemap_tree.xpath(xpath, namespaces=SITEMAP_SCHEMA_NAMESPACE)
 
 
+def parse_sitemap_url_element(sitemap_element: Any) -> SitemapUrl | None:
+    """Parse an `<url>...</url>` or `<sitemap>...</sitemap>` element of an XML sitemap file into a `SitemapUrl` object. Invalid optional values are set to `None` instead of discarding the element.
+
+    Args:
+        sitemap_element (_Element): The element to parse.
+
+    Returns:
+        SitemapUrl | None: The location and the optional attributes of the element, or `None` if the element has no location.
+    """
+
+    # Walk the children once instead of evaluating an XPath expression per attribute. First occurrence wins:
+    values: dict[str, str] = {}
+    for child in sitemap_element:
+        if child.text is not None and child.tag not in values:
+            values[child.tag] = child.text
+    loc = values.get(SITEMAP_LOC_TAG, "").strip()
+    if not loc:
+        logger.warning("Skipped a sitemap entry without a location.")
+        return None
+    return SitemapUrl(
+        loc=loc,
+        lastmod=parse_sitemap_lastmod(values.get(SITEMAP_LASTMOD_TAG)),
+        changefreq=parse_sitemap_changefreq(values.get(SITEMAP_CHANGEFREQ_TAG)),
+        priority=parse_sitemap_priority(values.get(SITEMAP_PRIORITY_TAG)),
+    )
+
+
+def parse_sitemap_lastmod(lastmod: str | None) -> str | None:
+    """Validate a `<lastmod>` value. Returns the value as written, or `None` if it is missing or not a valid W3C datetime."""
+
+    if not lastmod:
+        return None
+    try:
+        datetime.fromisoformat(lastmod)
+    except ValueError:
+        return None
+    return lastmod
+
+
+def parse_sitemap_changefreq(changefreq: str | None) -> str | None:
+    """Validate a `<changefreq>` value. Returns the value as written, or `None` if it is missing or not a known change frequency."""
+
+    if not changefreq or changefreq.lower() not in KNOWN_CHANGE_FREQUENCIES:
+        return None
+    return changefreq
+
+
+def parse_sitemap_priority(priority: str | None) -> float | None:
+    """Parse a `<priority>` value. Returns `None` if the value is missing, not a number or outside the valid range from 0.0 to 1.0."""
+
+    if priority is None:
+        return None
+    try:
+        value = float(priority)
+    except ValueError:
+        return None
+    return value if 0.0 <= value <= 1.0 else None
+
+
+def iterparse_sitemap_xml(sitemap_chunks: Iterable[bytes]) -> Iterator[tuple[SitemapEntryType, SitemapUrl]]:
+    """Incrementally parse the contents of an XML sitemap file, e.g. as it is being downloaded, and yield the URLs and nested XML sitemaps one by one. The parsed elements are released after each chunk, so the memory usage stays flat regardless of the size of the sitemap.
+
+    Args:
+        sitemap_chunks (Iterable[bytes]): The content of the XML sitemap file in chunks, e.g. from `stream_sitemap_xml()`. Gzip compressed chunks are decompressed on the fly.
+
+    Yields:
+        tuple[SitemapEntryType, SitemapUrl]: Type of the sitemap element, i.e. URL or nested XML sitemap, and its location and optional attributes. Elements without a location are skipped.
+
+    Raises:
+        lxml.etree.XMLSyntaxError: If the content is not a valid XML sitemap.
+    """
+
+    parser = lxml.etree.XMLPullParser(events=("end",), tag=list(SITEMAP_ENTRY_TAGS))
+
+    def read_parsed_elements() -> Iterator[tuple[SitemapEntryType, SitemapUrl]]:
+        sitemap_element: Any = None
+        for _, sitemap_element in parser.read_events():
+            if url := parse_sitemap_url_element(sitemap_element):
+                yield SITEMAP_ENTRY_TAGS[sitemap_element.tag], url
+        # Release the parsed elements of each chunk in one go, so the tree does not grow:
+        if sitemap_element is not None and (parent_element := sitemap_element.getparent()) is not None:
+            del parent_element[: parent_element.index(sitemap_element) + 1]
+
+    for chunk in decompress_sitemap_chunks(sitemap_chunks):
+        parser.feed(chunk)
+        yield from read_parsed_elements()
+    parser.close()
+    yield from read_parsed_elements()
+
+
+def iterparse_sitemap_xml_and_get_urls_as_elements(sitemap_chunks: Iterable[bytes]) -> Iterator[SitemapUrl]:
+    """Incrementally parse the contents of an XML sitemap file, e.g. as it is being downloaded, and lazily yield the URLs as `SitemapUrl` elements. Nested XML sitemaps are skipped. The memory usage stays flat regardless of the size of the sitemap.
+
+    Args:
+        sitemap_chunks (Iterable[bytes]): The content of the XML sitemap file in chunks, e.g. from `stream_sitemap_xml()`.
+
+    Yields:
+        SitemapUrl: Each URL found in the XML sitemap file. If the XML could not be parsed, the iteration stops.
+
+    Example:
+        Download and parse a large sitemap without holding it all in memory:
+
+        ```python linenums="1" hl_lines="4-5"
+        from index_now.sitemap.get import stream_sitemap_xml
+        from index_now.sitemap.parse import iterparse_sitemap_xml_and_get_urls_as_elements
+
+        sitemap_chunks = stream_sitemap_xml("https://example.com/sitemap.xml")
+        for url in iterparse_sitemap_xml_and_get_urls_as_elements(sitemap_chunks):
+            print(url.loc, url.lastmod)
+        ```
+    """
+
+    try:
+        for entry_type, url in iterparse_sitemap_xml(sitemap_chunks):
+            if entry_type is SitemapEntryType.URL:
+                yield url
+    except Exception:
+        log_invalid_sitemap()
+
+
+def parse_sitemap_xml(sitemap_content: str | bytes | Any) -> ParsedSitemap:
+    """Parse the contents of an XML sitemap file, e.g. from a response, and retrieve both the URLs as `SitemapUrl` elements and the nested sitemap links in one walk of the tree.
+
+    Args:
+        content (str | bytes | Any): The content of the XML sitemap file.
+
+    Returns:
+        ParsedSitemap: The URLs and nested sitemap links found in the XML sitemap file. Entries without a location are skipped. Both lists are empty if the XML could not be parsed.
+    """
+
+    try:
+        sitemap_tree = parse_sitemap_xml_tree(sitemap_content)
+    except Exception:
+        log_invalid_sitemap()
+        return ParsedSitemap()
+
+    parsed_sitemap = ParsedSitemap()
+    for sitemap_element in sitemap_tree.iter(*SITEMAP_ENTRY_TAGS):
+        if (url := parse_sitemap_url_element(sitemap_element)) is None:
+            continue
+        if SITEMAP_ENTRY_TAGS[sitemap_element.tag] is SitemapEntryType.URL:
+            parsed_sitemap.urls.append(url)
+        else:
+            parsed_sitemap.nested_sitemap_links.append(url.loc)
+    return parsed_sitemap
+
+
+def iterparse_sitemap_xml_and_get_parsed_sitemap(sitemap_chunks: Iterable[bytes]) -> ParsedSitemap:
+    """Incrementally parse the contents of an XML sitemap file as it is being downloaded, and retrieve both the URLs as `SitemapUrl` elements and the nested sitemap links. Unlike `parse_sitemap_xml()`, neither the file nor its element tree is held in memory as a whole.
+
+    Args:
+        sitemap_chunks (Iterable[bytes]): The content of the XML sitemap file in chunks, e.g. from `stream_sitemap_xml()`.
+
+    Returns:
+        ParsedSitemap: The URLs and nested sitemap links found in the XML sitemap file. Both lists are empty if the XML could not be parsed.
+    """
+
+    try:
+        parsed_sitemap = ParsedSitemap()
+        for entry_type, url in iterparse_sitemap_xml(sitemap_chunks):
+            if entry_type is SitemapEntryType.URL:
+                parsed_sitemap.urls.append(url)
+            else:
+                parsed_sitemap.nested_sitemap_links.append(url.loc)
+        return parsed_sitemap
+    except Exception:
+        log_invalid_sitemap()
+        return ParsedSitemap()
+
+
 def parse_sitemap_xml_and_get_urls_as_elements(sitemap_content: str | bytes | Any) -> list[SitemapUrl]:
     """Parse the contents of an XML sitemap file, e.g. from a response, and retrieve all the URLs from it as `SitemapUrl` elements.
 
@@ -72,32 +295,13 @@ def parse_sitemap_xml_and_get_urls_as_elements(sitemap_content: str | bytes | An
     """
 
     try:
-        urls: list[SitemapUrl] = []
         sitemap_elements = parse_sitemap_xml_and_get_xpath_objects(
             sitemap_content, SitemapEntryType.URL, loc_only=False
         )
-        for sitemap_element in sitemap_elements:
-            loc = sitemap_element.xpath("ns:loc/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)[0].strip()
-            lastmod = next(iter(sitemap_element.xpath("ns:lastmod/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)), None)
-            changefreq = next(
-                iter(sitemap_element.xpath("ns:changefreq/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)), None
-            )
-            priority = next(
-                iter(sitemap_element.xpath("ns:priority/text()", namespaces=SITEMAP_SCHEMA_NAMESPACE)), None
-            )
-            url = SitemapUrl(
-                loc=str(loc),
-                lastmod=str(lastmod) if lastmod else None,
-                changefreq=str(changefreq) if changefreq else None,
-                priority=float(priority) if priority is not None else None,
-            )
-            urls.append(url)
-        return urls
     except Exception:
-        print(
-            f"{Color.YELLOW}Invalid sitemap format. The XML could not be parsed. Please check the location of the sitemap.{Color.OFF}"
-        )
+        log_invalid_sitemap()
         return []
+    return [url for sitemap_element in sitemap_elements if (url := parse_sitemap_url_element(sitemap_element))]
 
 
 def parse_sitemap_xml_and_get_urls(sitemap_content: str | bytes | Any) -> list[str]:
@@ -114,9 +318,7 @@ def parse_sitemap_xml_and_get_urls(sitemap_content: str | bytes | Any) -> list[s
         sitemap_urls = parse_sitemap_xml_and_get_xpath_objects(sitemap_content, SitemapEntryType.URL, loc_only=True)
         return [str(url).strip() for url in sitemap_urls] if isinstance(sitemap_urls, list) and sitemap_urls else []
     except Exception:
-        print(
-            f"{Color.YELLOW}Invalid sitemap format. The XML could not be parsed. Please check the location of the sitemap.{Color.OFF}"
-        )
+        log_invalid_sitemap()
         return []
 
 
@@ -138,56 +340,153 @@ def parse_sitemap_xml_and_get_nested_sitemap_links(sitemap_content: str | bytes
             [str(link).strip() for link in sitemap_links] if isinstance(sitemap_links, list) and sitemap_links else []
         )
     except Exception:
-        print(
-            f"{Color.YELLOW}Invalid sitemap format. The XML could not be parsed. Please check the location of the sitemap.{Color.OFF}"
-        )
+        log_invalid_sitemap()
         return []
 
 
-def worker_get_urls_from_sitemap_xml(sitemap_location: str, as_elements: bool) -> list[Any]:
-    sitemap_content = get_sitemap_xml(sitemap_location)
-    if as_elements:
-        return parse_sitemap_xml_and_get_urls_as_elements(sitemap_content)
-    return parse_sitemap_xml_and_get_urls(sitemap_content)
+def fetch_and_parse_sitemap_xml(
+    sitemap_location: str,
+    client: IndexNowClient | None = None,
+    cache: "SitemapCache | None" = None,
+    timeout: float | None = None,
+    stream: bool = False,
+) -> tuple[requests.Response, ParsedSitemap | None]:
+    """Download and parse an XML sitemap file. If a cache is given, a conditional request is sent and the previously parsed sitemap is reused when the server responds with `304 Not Modified`.
 
+    Args:
+        sitemap_location (str): The location of the sitemap.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across calls. Uses a shared default client if set to `None`.
+        cache (SitemapCache | None, optional): Cache of previously parsed sitemaps. Ignored if set to `None`.
+        timeout (float | None, optional): Timeout in seconds for the request. Uses the default of the client if set to `None`.
+        stream (bool, optional): Whether to parse the sitemap incrementally as it is being downloaded, so neither the file nor its element tree is held in memory as a whole. The body of the response is then not available afterwards.
+
+    Returns:
+        tuple[requests.Response, ParsedSitemap | None]: The response and the parsed sitemap, or `None` if the sitemap could not be retrieved.
+    """
+
+    client = client or get_default_client()
+    cached_sitemap = cache.get(sitemap_location) if cache else None
+    headers = cached_sitemap.conditional_headers if cached_sitemap else {}
+    response = client.get(sitemap_location, headers=headers, timeout=timeout or client.timeout, stream=stream)
+    if stream and response.status_code != HTTPStatus.OK:
+        response.close()  # The body is not parsed, so the connection is released right away.
+    if response.status_code == HTTPStatus.NOT_MODIFIED and cached_sitemap:
+        return response, cached_sitemap.parsed_sitemap
+    if response.status_code != HTTPStatus.OK:
+        return response, None
+
+    if stream:
+        with response:
+            parsed_sitemap = iterparse_sitemap_xml_and_get_parsed_sitemap(
+                response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE)
+            )
+    else:
+        parsed_sitemap = parse_sitemap_xml(response.content)
+    if cache:
+        cache.put(sitemap_location, response.headers.get("ETag"), response.headers.get("Last-Modified"), parsed_sitemap)
+    return response, parsed_sitemap
+
+
+def controller_get_urls_from_parsed_sitemap(
+    parsed_sitemap: ParsedSitemap,
+    client: IndexNowClient | None = None,
+    executor_strategy: ExecutorStrategy | None = None,
+    cache: "SitemapCache | None" = None,
+    sitemap_location: str | None = None,
+) -> list[SitemapUrl]:
+    """Get the URLs of an already parsed XML sitemap, including the URLs of any nested XML sitemaps at any depth that are downloaded and parsed once.
+
+    Args:
+        parsed_sitemap (ParsedSitemap): The parsed XML sitemap.
+        client (IndexNowClient | None, optional): Client with a connection pool used to download nested sitemaps. Uses a shared default client if set to `None`.
+        executor_strategy (ExecutorStrategy | None, optional): How nested sitemaps are downloaded and parsed in parallel, and how deep they are crawled. Uses threads by default if set to `None`.
+        cache (SitemapCache | None, optional): Cache of previously parsed nested sitemaps. Only used with the thread executor. Ignored if set to `None`.
+        sitemap_location (str | None, optional): The location of the parsed sitemap, so nested sitemaps that link back to it are not downloaded again.
+
+    Returns:
+        list[SitemapUrl]: List of the URL elements found in the sitemap and its nested sitemaps in the order of the XML files. A URL that is listed more than once, e.g. in several nested sitemaps, is only included the first time. If no URLs are found, the list will be empty.
+    """
+
+    from .crawl import SitemapCrawler, log_max_sitemap_depth_reached  # Avoid a circular import.
+
+    strategy = executor_strategy or DEFAULT_EXECUTOR_STRATEGY
+    nested_sitemap_links = parsed_sitemap.nested_sitemap_links
+    if not nested_sitemap_links:
+        return deduplicate_sitemap_urls(parsed_sitemap.urls)[: strategy.max_sitemap_urls]
+
+    client = client or get_default_client()
+    if strategy.parse_executor is ParseExecutor.PROCESS and len(nested_sitemap_links) > 1 and cache is None:
+        # Download and parse one level of nested sitemaps at a time, as the processes only parse:
+        all_urls = list(parsed_sitemap.urls)
+        visited_locations = {sitemap_location}
+        depth = 1
+        while nested_sitemap_links := [
+            link for link in dict.fromkeys(nested_sitemap_links) if link not in visited_locations
+        ]:
+            if depth == strategy.max_sitemap_depth:
+                log_max_sitemap_depth_reached(len(nested_sitemap_links), strategy.max_sitemap_depth)
+                break
+            if strategy.max_sitemap_urls is not None and len(all_urls) >= strategy.max_sitemap_urls:
+                break
+            depth += 1
+            visited_locations.update(nested_sitemap_links)
+            multiple_nested_sitemap_contents = get_multiple_sitemap_xml(
+                nested_sitemap_links, client, strategy.max_fetch_workers
+            )
+            multiple_nested_sitemaps: list[ParsedSitemap] = map_in_processes(
+                parse_sitemap_xml,
+                multiple_nested_sitemap_contents,
+                max_workers=min(strategy.max_parse_workers, len(nested_sitemap_links)),
+            )
+            nested_sitemap_links = []
+            for nested_sitemap in multiple_nested_sitemaps:
+                all_urls.extend(nested_sitemap.urls)
+                nested_sitemap_links.extend(nested_sitemap.nested_sitemap_links)
+        return deduplicate_sitemap_urls(all_urls)[: strategy.max_sitemap_urls]
+
+    crawler = SitemapCrawler(
+        client, strategy.max_fetch_workers, strategy.max_sitemap_depth, strategy.max_sitemap_urls, cache
+    )
+    crawled_sitemaps = sorted(
+        crawler.crawl_sitemaps(sitemap_location, parsed_sitemap), key=lambda crawled_sitemap: crawled_sitemap.position
+    )
+    return deduplicate_sitemap_urls([url for crawled_sitemap in crawled_sitemaps for url in crawled_sitemap.urls])
+
+
+def deduplicate_sitemap_urls(url_elements: list[SitemapUrl]) -> list[SitemapUrl]:
+    """Remove the URL elements with a location that is listed more than once, e.g. in several nested sitemaps, and keep the first occurrence in the given order. The URL elements are already in memory, so the locations are compared exactly."""
+
+    unique_url_elements: dict[str, SitemapUrl] = {}
+    for url_element in url_elements:
+        unique_url_elements.setdefault(url_element.loc, url_element)
+    return list(unique_url_elements.values())
 
-def controller_parse_sitemap_xml_and_get_urls(sitemap_content: str | bytes | Any, as_elements: bool) -> list[Any]:
-    """Parse the contents of an XML sitemap file and get the URLs from it, including any nested XML sitemaps.
+
+def controller_parse_sitemap_xml_and_get_urls(
+    sitemap_content: str | bytes | Any,
+    as_elements: bool,
+    client: IndexNowClient | None = None,
+    executor_strategy: ExecutorStrategy | None = None,
+) -> list[Any]:
+    """Parse the contents of an XML sitemap file and get the URLs from it, including any nested XML sitemaps. Each sitemap is downloaded and parsed only once.
 
     Args:
         content (str | bytes | Any): The content of the XML sitemap file.
         as_elements (bool): If `True`, return the URLs as `SitemapUrl` elements instead of strings. If `False`, return the URLs as strings.
+        client (IndexNowClient | None, optional): Client with a connection pool used to download nested sitemaps. Uses a shared default client if set to `None`.
+        executor_strategy (ExecutorStrategy | None, optional): How nested sitemaps are downloaded and parsed in parallel. Uses threads by default if set to `None`.
 
     Returns:
-        list[str] | list[SitemapUrl]: List of the URLs or URL elements found in the XML sitemap file. If no URLs are found, the list will be empty.
+        list[str] | list[SitemapUrl]: List of the unique URLs or URL elements found in the XML sitemap file and its nested sitemaps. If no URLs are found, the list will be empty.
     """
 
-    first_level_urls = (
-        parse_sitemap_xml_and_get_urls_as_elements(sitemap_content)
-        if as_elements
-        else parse_sitemap_xml_and_get_urls(sitemap_content)
-    )
-    # Note that only level 2 sitemaps are supported, not level 3 or beyond, so no recursion is needed:
-    nested_sitemap_links = parse_sitemap_xml_and_get_nested_sitemap_links(sitemap_content)
+    all_urls = controller_get_urls_from_parsed_sitemap(parse_sitemap_xml(sitemap_content), client, executor_strategy)
+    if as_elements:
+        return all_urls
+    return [url.loc for url in all_urls]
 
-    # Quick exits if there are no URLs or nested sitemap links to process:
-    if not first_level_urls and not nested_sitemap_links:
-        return []
-    if not nested_sitemap_links:
-        return first_level_urls
 
-    # We now need to process and merge URLs from multiple sitemaps:
-    multiple_nested_sitemap_urls: list[list[Any]] = []
-    if len(nested_sitemap_links) == 1:
-        multiple_nested_sitemap_urls = worker_get_urls_from_sitemap_xml(nested_sitemap_links[0], as_elements)
-    else:
-        max_workers = min(NUMBER_OF_CPU_CORES - 1, len(nested_sitemap_links))
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            multiple_nested_sitemap_urls = list(
-                executor.map(worker_get_urls_from_sitemap_xml, nested_sitemap_links, repeat(as_elements))
-            )
+def log_invalid_sitemap() -> None:
+    """Log that the XML of a sitemap could not be parsed."""
 
-    all_urls = first_level_urls
-    for nested_sitemap_urls in multiple_nested_sitemap_urls:
-        all_urls.extend(nested_sitemap_urls)
-    return all_urls
+    logger.warning("Invalid sitemap format. The XML could not be parsed. Please check the location of the sitemap.")
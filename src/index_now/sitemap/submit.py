@@ -1,13 +1,29 @@
+import dataclasses
+from collections.abc import Iterable, Iterator
+from contextlib import nullcontext
 from http import HTTPStatus
-
-import requests
-from colorist import Color
+from itertools import repeat
+from operator import attrgetter
 
 from ..authentication import IndexNowAuthentication
+from ..client import IndexNowClient, get_default_client
+from ..constant import DEFAULT_MAX_CONCURRENT_BATCHES, MAX_URLS_PER_BATCH
 from ..endpoint import SearchEngineEndpoint
-from ..url.submit import submit_urls_to_index_now
+from ..executor import DEFAULT_EXECUTOR_STRATEGY, ExecutorStrategy, map_in_threads
+from ..ledger import SubmissionLedger
+from ..log import logger
+from ..result import SitemapOutcome, SubmissionResult
+from ..url.dedup import UrlDeduplicator
+from ..url.submit import submit_url_stream_to_index_now, submit_urls_to_index_now
+from .cache import SitemapCache
+from .crawl import SitemapCrawler
 from .filter.sitemap import SitemapFilter, filter_sitemap_urls
-from .parse import SitemapUrl, controller_parse_sitemap_xml_and_get_urls
+from .parse import (
+    SitemapUrl,
+    controller_get_urls_from_parsed_sitemap,
+    deduplicate_sitemap_urls,
+    fetch_and_parse_sitemap_xml,
+)
 
 
 def submit_sitemap_to_index_now(
@@ -15,17 +31,27 @@ def submit_sitemap_to_index_now(
     sitemap_location: str,
     filter: SitemapFilter | None = None,
     endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
-) -> int:
-    """Submit a sitemap to the IndexNow API of a search engine. Note that nested sitemaps up to level 2 of the index sitemap will be included.
+    client: IndexNowClient | None = None,
+    executor_strategy: ExecutorStrategy | None = None,
+    cache: SitemapCache | None = None,
+    incremental: bool = False,
+    ledger: SubmissionLedger | None = None,
+) -> SubmissionResult:
+    """Submit a sitemap to the IndexNow API of a search engine. Note that nested sitemaps of the index sitemap will be included up to level 5 by default.
 
     Args:
         authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
         sitemap_location (str): The URL of the sitemap to submit, e.g. `https://example.com/sitemap.xml`.
         filter (SitemapFilter | None): Optional filter for URLs. Ignored by default or if set to `None`.
         endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (IndexNowClient | None, optional): Client with a connection pool that is reused for downloading the sitemaps and submitting the URLs. Uses a shared default client if set to `None`.
+        executor_strategy (ExecutorStrategy | None, optional): How nested sitemaps are downloaded and parsed in parallel. Uses threads by default if set to `None`.
+        cache (SitemapCache | None, optional): Cache of previously parsed sitemaps, so sitemaps that have not changed since the last run are neither downloaded nor parsed again. Ignored if set to `None`.
+        incremental (bool, optional): If `True`, only submit URLs that are new or have been modified since they were last submitted to the endpoint, according to the ledger.
+        ledger (SubmissionLedger | None, optional): Ledger of previous submissions used in incremental mode. Uses a ledger at the default location if set to `None`.
 
     Returns:
-        int: Status code of the response, e.g. `200` or `202` for, respectively, success or accepted, or `400` for bad request, etc.
+        SubmissionResult: Status code of the response, e.g. `200` or `202` for, respectively, success or accepted, or `400` for bad request, etc., and the result of each batch. If nothing was submitted, e.g. because a sitemap could not be downloaded or the filter removed all URLs, there are no batches.
 
     Example:
         After adding your authentication credentials to the [`IndexNowAuthentication`](../configuration/authentication.md) class, you can now submit an entire sitemap to the IndexNow API:
@@ -112,36 +138,30 @@ def submit_sitemap_to_index_now(
         ```
     """
 
-    urls: list[str] = []
-    response = requests.get(sitemap_location)
-    if response.status_code != HTTPStatus.OK:
-        print(f"{Color.YELLOW}Failure. Please check the sitemap location: {sitemap_location}{Color.OFF}")
-        print(f"Status code: {Color.RED}{response.status_code}{Color.OFF}")
-        print(f"Response: {response.text}")
-        return response.status_code
+    client = client or get_default_client()
+    response, parsed_sitemap = fetch_and_parse_sitemap_xml(sitemap_location, client, cache)
+    if parsed_sitemap is None:
+        log_sitemap_failure(sitemap_location, response.status_code, response.text)
+        return SubmissionResult(str(endpoint), response.status_code)
 
+    url_elements = controller_get_urls_from_parsed_sitemap(
+        parsed_sitemap, client, executor_strategy, cache, sitemap_location
+    )
+    if not url_elements:
+        log_no_urls_found(sitemap_location)
+        return SubmissionResult(str(endpoint), HTTPStatus.UNPROCESSABLE_ENTITY)
     if not filter:
-        urls = controller_parse_sitemap_xml_and_get_urls(response.content, as_elements=False)
-        if not urls:
-            print(
-                f"{Color.YELLOW}No URLs found in the sitemap. Please check the sitemap location: {sitemap_location}{Color.OFF}"
-            )
-            return HTTPStatus.UNPROCESSABLE_ENTITY
+        urls = [url_element.loc for url_element in url_elements]
     else:
-        url_elements = controller_parse_sitemap_xml_and_get_urls(response.content, as_elements=True)
-        if not url_elements:
-            print(
-                f"{Color.YELLOW}No URLs found in the sitemap. Please check the sitemap location: {sitemap_location}{Color.OFF}"
-            )
-            return HTTPStatus.UNPROCESSABLE_ENTITY
         urls = filter_sitemap_urls(url_elements, filter)
         if not urls:
-            print(f"{Color.YELLOW}No URLs left after filtering. Please check your filter parameters.{Color.OFF}")
-            return HTTPStatus.NO_CONTENT
+            log_no_urls_left_after_filtering()
+            return SubmissionResult(str(endpoint), HTTPStatus.NO_CONTENT)
 
-    print(f"Found {Color.GREEN}{len(urls):,} URL(s){Color.OFF} in total from this sitemap: {sitemap_location}")
-    status_code = submit_urls_to_index_now(authentication, urls, endpoint)
-    return status_code
+    logger.info("Found %d URL(s) in total from this sitemap: %s", len(urls), sitemap_location)
+    if incremental:
+        return submit_new_or_modified_urls_to_index_now(authentication, urls, url_elements, endpoint, client, ledger)
+    return submit_urls_to_index_now(authentication, urls, endpoint, client)
 
 
 def submit_sitemaps_to_index_now(
@@ -149,17 +169,29 @@ def submit_sitemaps_to_index_now(
     sitemap_locations: list[str],
     filter: SitemapFilter | None = None,
     endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
-) -> int:
-    """Submit multiple sitemaps to the IndexNow API of a search engine. Note that nested sitemaps up to level 2 of the index sitemaps will be included.
+    client: IndexNowClient | None = None,
+    executor_strategy: ExecutorStrategy | None = None,
+    cache: SitemapCache | None = None,
+    incremental: bool = False,
+    ledger: SubmissionLedger | None = None,
+) -> SubmissionResult:
+    """Submit multiple sitemaps to the IndexNow API of a search engine. Note that nested sitemaps of the index sitemaps will be included up to level 5 by default.
+
+    The sitemaps are downloaded and parsed concurrently, and each sitemap is isolated from the others: a sitemap that cannot be downloaded, cannot be parsed or contains no URLs is skipped with a warning, while the URLs of the healthy sitemaps are still merged in the given order and submitted. A URL that is listed in more than one sitemap is only submitted once. The outcome of each sitemap is reported in `SubmissionResult.sitemap_outcomes`.
 
     Args:
         authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
         sitemap_locations (list[str]): List of sitemap locations to submit, e.g. `["https://example.com/sitemap1.xml", "https://example.com/sitemap2.xml, "https://example.com/sitemap3.xml"]`.
         filter (SitemapFilter | None): Optional filter for URLs. Ignored by default or if set to `None`.
         endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (IndexNowClient | None, optional): Client with a connection pool that is reused for downloading the sitemaps and submitting the URLs. Uses a shared default client if set to `None`.
+        executor_strategy (ExecutorStrategy | None, optional): How the sitemaps and their nested sitemaps are downloaded and parsed in parallel, where `max_fetch_workers` is shared by all the sitemaps. Uses threads by default if set to `None`.
+        cache (SitemapCache | None, optional): Cache of previously parsed sitemaps, so sitemaps that have not changed since the last run are neither downloaded nor parsed again. Ignored if set to `None`.
+        incremental (bool, optional): If `True`, only submit URLs that are new or have been modified since they were last submitted to the endpoint, according to the ledger.
+        ledger (SubmissionLedger | None, optional): Ledger of previous submissions used in incremental mode. Uses a ledger at the default location if set to `None`.
 
     Returns:
-        int: Status code of the response, e.g. `200` or `202` for, respectively, success or accepted, or `400` for bad request, etc.
+        SubmissionResult: Status code of the response, e.g. `200` or `202` for, respectively, success or accepted, or `400` for bad request, etc., the result of each batch, and the outcome of each sitemap. If none of the sitemaps could be used, nothing is submitted and the status code is the one of the first sitemap that failed, e.g. `404`, or `422` if the sitemaps contain no URLs. If the filter removed all URLs, the status code is `204`.
 
     Example:
         After adding your authentication credentials to the [`IndexNowAuthentication`](../configuration/authentication.md) class, you can now submit multiple sitemaps to the IndexNow API:
@@ -182,6 +214,16 @@ def submit_sitemaps_to_index_now(
         submit_sitemaps_to_index_now(authentication, sitemap_locations)
         ```
 
+        Check which sitemaps were skipped, e.g. because they could not be downloaded:
+
+        ```python linenums="15" hl_lines="3-4" title=""
+        result = submit_sitemaps_to_index_now(authentication, sitemap_locations)
+
+        for outcome in result.sitemap_outcomes:
+            if not outcome.is_success:
+                print(outcome.location, outcome.status_code, outcome.error)
+        ```
+
         If you want to submit to a specific search engine, alternatively customize the endpoint:
 
         ```python linenums="15" hl_lines="1-2" title=""
@@ -254,35 +296,258 @@ def submit_sitemaps_to_index_now(
         ```
     """
 
-    merged_urls: list[str] = []
-    responses: list[requests.Response] = []
-    for sitemap_location in sitemap_locations:
-        response = requests.get(sitemap_location)
-        if response.status_code != HTTPStatus.OK:
-            print(f"{Color.YELLOW}Failure. Please check the sitemap location: {sitemap_location}{Color.OFF}")
-            print(f"Status code: {Color.RED}{response.status_code}{Color.OFF}")
-            print(f"Response: {response.text}")
-            return response.status_code
-        urls = controller_parse_sitemap_xml_and_get_urls(response.content, as_elements=False)
-        if not urls:
-            print(
-                f"{Color.YELLOW}No URLs found in the sitemap. Please check the sitemap location: {sitemap_location}{Color.OFF}"
-            )
-            return HTTPStatus.UNPROCESSABLE_ENTITY
-        merged_urls.extend(urls)
-        responses.append(response)
-
-    if filter:
-        url_elements: list[SitemapUrl] = []
-        for response in responses:
-            url_elements.extend(controller_parse_sitemap_xml_and_get_urls(response.content, as_elements=True))
-        merged_urls = filter_sitemap_urls(url_elements, filter)
+    client = client or get_default_client()
+    strategy = executor_strategy or DEFAULT_EXECUTOR_STRATEGY
+    number_of_workers = max(1, min(strategy.max_fetch_workers, len(sitemap_locations)))
+    # Share the download workers between the sitemaps, so the nested sitemaps do not multiply the number of threads:
+    nested_strategy = dataclasses.replace(
+        strategy, max_fetch_workers=max(1, strategy.max_fetch_workers // number_of_workers)
+    )
+    outcomes_and_url_elements: list[tuple[SitemapOutcome, list[SitemapUrl]]] = map_in_threads(
+        get_sitemap_urls_with_outcome,
+        sitemap_locations,
+        repeat(client),
+        repeat(nested_strategy),
+        repeat(cache),
+        max_workers=number_of_workers,
+    )
+    sitemap_outcomes = [outcome for outcome, _ in outcomes_and_url_elements]
+    merged_url_elements = merge_sitemap_urls([url_elements for _, url_elements in outcomes_and_url_elements])
+    if not merged_url_elements:
+        return SubmissionResult(
+            str(endpoint), get_status_code_of_failed_sitemaps(sitemap_outcomes), [], sitemap_outcomes
+        )
+    log_skipped_sitemaps(sitemap_outcomes)
+
+    if not filter:
+        merged_urls = [url_element.loc for url_element in merged_url_elements]
+    else:
+        merged_urls = filter_sitemap_urls(merged_url_elements, filter)
         if not merged_urls:
-            print(f"{Color.YELLOW}No URLs left after filtering. Please check your filter parameters.{Color.OFF}")
-            return HTTPStatus.NO_CONTENT
+            log_no_urls_left_after_filtering()
+            return SubmissionResult(str(endpoint), HTTPStatus.NO_CONTENT, [], sitemap_outcomes)
+
+    healthy_locations = [outcome.location for outcome in sitemap_outcomes if outcome.is_success]
+    logger.info("Found %d URL(s) in total from these sitemaps: %s", len(merged_urls), ", ".join(healthy_locations))
+    if incremental:
+        result = submit_new_or_modified_urls_to_index_now(
+            authentication, merged_urls, merged_url_elements, endpoint, client, ledger
+        )
+    else:
+        result = submit_urls_to_index_now(authentication, merged_urls, endpoint, client)
+    return dataclasses.replace(result, sitemap_outcomes=sitemap_outcomes)
+
+
+def merge_sitemap_urls(multiple_url_elements: list[list[SitemapUrl]]) -> list[SitemapUrl]:
+    """Merge the URL elements of several sitemaps in the given order, where a URL that is listed in more than one sitemap is only included the first time."""
+
+    merged_url_elements = [url_element for url_elements in multiple_url_elements for url_element in url_elements]
+    unique_url_elements = deduplicate_sitemap_urls(merged_url_elements)
+    if len(unique_url_elements) < len(merged_url_elements):
+        logger.info(
+            "Removed %d duplicate URL(s) found in more than one sitemap.",
+            len(merged_url_elements) - len(unique_url_elements),
+        )
+    return unique_url_elements
+
+
+def get_sitemap_urls_with_outcome(
+    sitemap_location: str,
+    client: IndexNowClient,
+    executor_strategy: ExecutorStrategy | None = None,
+    cache: SitemapCache | None = None,
+) -> tuple[SitemapOutcome, list[SitemapUrl]]:
+    """Download and parse a sitemap and its nested sitemaps. Errors are caught and reported in the outcome with a warning, so a sitemap that fails does not affect the others that are submitted together with it.
+
+    Returns:
+        tuple[SitemapOutcome, list[SitemapUrl]]: The outcome of the sitemap and its URLs, which are empty if the sitemap failed.
+    """
+
+    try:
+        response, parsed_sitemap = fetch_and_parse_sitemap_xml(sitemap_location, client, cache)
+        if parsed_sitemap is None:
+            log_sitemap_failure(sitemap_location, response.status_code, response.text)
+            return SitemapOutcome(sitemap_location, response.status_code, error=response.text), []
+        url_elements = controller_get_urls_from_parsed_sitemap(
+            parsed_sitemap, client, executor_strategy, cache, sitemap_location
+        )
+    except Exception as error:
+        logger.warning("Failure. Please check the sitemap location: %s (error: %s)", sitemap_location, error)
+        return SitemapOutcome(sitemap_location, None, error=str(error) or type(error).__name__), []
+    return get_sitemap_outcome(sitemap_location, response.status_code, url_elements), url_elements
+
+
+def get_sitemap_outcome(sitemap_location: str, status_code: int, url_elements: list[SitemapUrl]) -> SitemapOutcome:
+    """Get the outcome of a sitemap that was downloaded and parsed, where a sitemap without URLs is reported with a warning."""
+
+    if not url_elements:
+        log_no_urls_found(sitemap_location)
+        return SitemapOutcome(sitemap_location, status_code, error="No URLs found in the sitemap.")
+    return SitemapOutcome(sitemap_location, status_code, len(url_elements))
+
+
+def get_status_code_of_failed_sitemaps(sitemap_outcomes: list[SitemapOutcome]) -> int:
+    """Get the status code to return when none of the sitemaps could be used: the status code of the first sitemap that could not be downloaded, `502` if no response was received at all, or otherwise `422`, as the sitemaps contain no URLs."""
+
+    for outcome in sitemap_outcomes:
+        if outcome.status_code is None:
+            return HTTPStatus.BAD_GATEWAY
+        if outcome.status_code not in (HTTPStatus.OK, HTTPStatus.NOT_MODIFIED):
+            return outcome.status_code
+    return HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def log_skipped_sitemaps(sitemap_outcomes: list[SitemapOutcome]) -> None:
+    """Log how many of the sitemaps were skipped, if any, while the URLs of the others are still submitted."""
+
+    number_of_skipped_sitemaps = sum(not outcome.is_success for outcome in sitemap_outcomes)
+    if number_of_skipped_sitemaps:
+        logger.warning(
+            "Skipped %d of %d sitemaps. Submitting the URLs of the other sitemaps.",
+            number_of_skipped_sitemaps,
+            len(sitemap_outcomes),
+        )
+
+
+def stream_sitemap_to_index_now(
+    authentication: IndexNowAuthentication,
+    sitemap_location: str,
+    filter: SitemapFilter | None = None,
+    endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
+    client: IndexNowClient | None = None,
+    executor_strategy: ExecutorStrategy | None = None,
+    cache: SitemapCache | None = None,
+    batch_size: int = MAX_URLS_PER_BATCH,
+    max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+) -> SubmissionResult:
+    """Submit a sitemap to the IndexNow API of a search engine as a stream: the URLs of each nested sitemap flow through the filter into batches while the sitemap is being downloaded and parsed, and each batch is submitted as soon as it is full. Compared to `submit_sitemap_to_index_now()`, the first URLs are submitted before all nested sitemaps have been downloaded, and the memory usage is bounded by the batch size and the number of download workers rather than by the size of the sitemaps.
 
-    print(
-        f"Found {Color.GREEN}{len(merged_urls):,} URL(s){Color.OFF} in total from these sitemaps: {', '.join(sitemap_locations)}"
+    Note that the URLs are submitted in the order they are downloaded, so the URLs of nested sitemaps that are downloaded at the same time may be interleaved. A URL that is listed in several nested sitemaps is only submitted once, and the submission cannot be incremental, as the ledger needs all the URLs at once.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        sitemap_location (str): The URL of the sitemap to submit, e.g. `https://example.com/sitemap.xml`.
+        filter (SitemapFilter | None): Optional filter for URLs. Ignored by default or if set to `None`.
+        endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (IndexNowClient | None, optional): Client with a connection pool that is reused for downloading the sitemaps and submitting the URLs. Uses a shared default client if set to `None`.
+        executor_strategy (ExecutorStrategy | None, optional): How many nested sitemaps are downloaded at the same time, and how deep they are crawled. Uses the default strategy if set to `None`.
+        cache (SitemapCache | None, optional): Cache of previously parsed sitemaps. Ignored if set to `None`.
+        batch_size (int, optional): Maximum number of URLs per request. Should be between 1 and 10,000.
+        max_concurrent_batches (int, optional): Maximum number of batches that are submitted at the same time.
+
+    Returns:
+        SubmissionResult: Status code of the response and the result of each batch. If nothing was submitted, e.g. because the sitemap could not be downloaded or the filter removed all URLs, there are no batches.
+
+    Example:
+        Start submitting the URLs of a large sitemap index while its nested sitemaps are still being downloaded:
+
+        ```python linenums="1" hl_lines="11"
+        from index_now import stream_sitemap_to_index_now, IndexNowAuthentication, SitemapFilter, DaysAgo
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        sitemap_location = "https://example.com/sitemap_index.xml"
+
+        stream_sitemap_to_index_now(authentication, sitemap_location, SitemapFilter(date_range=DaysAgo(2)))
+        ```
+    """
+
+    client = client or get_default_client()
+    strategy = executor_strategy or DEFAULT_EXECUTOR_STRATEGY
+    response, parsed_sitemap = fetch_and_parse_sitemap_xml(sitemap_location, client, cache)
+    if parsed_sitemap is None:
+        log_sitemap_failure(sitemap_location, response.status_code, response.text)
+        return SubmissionResult(str(endpoint), response.status_code)
+
+    crawler = SitemapCrawler(
+        client, strategy.max_fetch_workers, strategy.max_sitemap_depth, strategy.max_sitemap_urls, cache
+    )
+    url_counter = UrlCounter(
+        url
+        for crawled_sitemap in crawler.crawl_sitemaps(sitemap_location, parsed_sitemap)
+        for url in crawled_sitemap.urls
+    )
+    # Only the fingerprints of the URLs seen so far are kept, so the memory usage stays small:
+    unique_urls = UrlDeduplicator().filter(url_counter, key=attrgetter("loc"))
+    urls = filter.compile().filter_stream(unique_urls) if filter else (url.loc for url in unique_urls)
+    result = submit_url_stream_to_index_now(authentication, urls, endpoint, client, batch_size, max_concurrent_batches)
+    if result.batches:
+        return result
+    # A filter that takes no URLs at all does not consume the stream, so no URLs are counted:
+    if not url_counter.count and not (filter and filter.take is not None and filter.take <= 0):
+        log_no_urls_found(sitemap_location)
+        return SubmissionResult(str(endpoint), HTTPStatus.UNPROCESSABLE_ENTITY)
+    log_no_urls_left_after_filtering()
+    return result
+
+
+class UrlCounter:
+    """Pass a stream of sitemap URLs through while counting them, so the number of URLs found is known once the stream has been consumed."""
+
+    __slots__ = ["urls", "count"]
+
+    def __init__(self, urls: Iterable[SitemapUrl]) -> None:
+        self.urls = urls
+        self.count = 0
+
+    def __repr__(self) -> str:
+        return f"UrlCounter(count={self.count})"
+
+    def __iter__(self) -> Iterator[SitemapUrl]:
+        for url in self.urls:
+            self.count += 1
+            yield url
+
+
+def submit_new_or_modified_urls_to_index_now(
+    authentication: IndexNowAuthentication,
+    urls: list[str],
+    url_elements: list[SitemapUrl],
+    endpoint: SearchEngineEndpoint | str,
+    client: IndexNowClient,
+    ledger: SubmissionLedger | None,
+) -> SubmissionResult:
+    """Submit only the URLs that are new or modified according to the ledger, and record the successfully submitted URLs in the ledger afterwards."""
+
+    url_elements_by_location = {url_element.loc: url_element for url_element in url_elements}
+    selected_url_elements = [url_elements_by_location[url] for url in dict.fromkeys(urls)]
+    # Only close the ledger afterwards if it was opened here:
+    with nullcontext(ledger) if ledger else SubmissionLedger() as active_ledger:
+        new_or_modified_urls = active_ledger.get_new_or_modified_urls(str(endpoint), selected_url_elements)
+        if not new_or_modified_urls:
+            logger.warning("No new or modified URLs since the last submission. Nothing to submit.")
+            return SubmissionResult(str(endpoint), HTTPStatus.NO_CONTENT)
+
+        logger.info("Submitting %d new or modified URL(s).", len(new_or_modified_urls))
+        result = submit_urls_to_index_now(
+            authentication, [url_element.loc for url_element in new_or_modified_urls], endpoint, client
+        )
+        active_ledger.record_submission(new_or_modified_urls, result)
+    return result
+
+
+def log_sitemap_failure(sitemap_location: str, status_code: int, response_text: str) -> None:
+    """Log that a sitemap could not be downloaded."""
+
+    logger.warning(
+        "Failure. Please check the sitemap location: %s (status code: %d, response: %s)",
+        sitemap_location,
+        status_code,
+        response_text,
     )
-    status_code = submit_urls_to_index_now(authentication, merged_urls, endpoint)
-    return status_code
+
+
+def log_no_urls_found(sitemap_location: str) -> None:
+    """Log that a sitemap did not contain any URLs."""
+
+    logger.warning("No URLs found in the sitemap. Please check the sitemap location: %s", sitemap_location)
+
+
+def log_no_urls_left_after_filtering() -> None:
+    """Log that the filter removed all URLs."""
+
+    logger.warning("No URLs left after filtering. Please check your filter parameters.")
@@ -0,0 +1,316 @@
+import bisect
+import math
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from .filter.change_frequency import ChangeFrequency
+from .filter.date_range import DateRange
+from .parse import SitemapUrl, iterparse_sitemap_xml_and_get_urls_as_elements
+
+MISSING_LASTMOD = -(2**63)
+
+MISSING_CHANGE_FREQUENCY = 0
+
+UNKNOWN_CHANGE_FREQUENCY = 255
+
+CHANGE_FREQUENCY_CODES = {
+    change_frequency.value: code for code, change_frequency in enumerate(ChangeFrequency, start=1)
+}
+
+CHANGE_FREQUENCY_VALUES = {code: value for value, code in CHANGE_FREQUENCY_CODES.items()}
+
+SECONDS_PER_DAY = 86_400
+
+LASTMOD_INDEX_MAX_FRACTION = 0.125
+
+EPOCH = datetime(1970, 1, 1)
+
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+
+def parse_lastmod_timestamp(lastmod: str | None) -> int | None:
+    """Parse a `<lastmod>` value into seconds since the epoch, keeping the date and time as written. The time zone offset is ignored, so the value falls on the same calendar date as when a list of URLs is filtered.
+
+    Returns:
+        int | None: The timestamp, or `None` if the value is missing or not a valid W3C datetime.
+    """
+
+    if not lastmod:
+        return None
+    try:
+        timestamp = datetime.fromisoformat(lastmod)
+    except ValueError:
+        return None
+    return math.floor(timestamp.replace(tzinfo=UTC).timestamp())
+
+
+def get_lastmod_datetime(timestamp: int) -> datetime:
+    """Convert a timestamp from `parse_lastmod_timestamp()` back into the date and time as written, without a time zone."""
+
+    return EPOCH + timedelta(seconds=timestamp)
+
+
+def get_change_frequency_code(changefreq: str | None) -> int:
+    """Encode a `<changefreq>` value as a small integer. Unrecognized values share one code."""
+
+    if not changefreq:
+        return MISSING_CHANGE_FREQUENCY
+    return CHANGE_FREQUENCY_CODES.get(changefreq.lower(), UNKNOWN_CHANGE_FREQUENCY)
+
+
+def has_ordinal_bounds(date_range: DateRange) -> bool:
+    """Check whether a date range can be evaluated by its ordinal bounds. This is not the case for subclasses that override `is_within_range()` without overriding `get_ordinal_bounds()`."""
+
+    date_range_type = type(date_range)
+    return (
+        date_range_type.get_ordinal_bounds is not DateRange.get_ordinal_bounds
+        or date_range_type.is_within_range is DateRange.is_within_range
+    )
+
+
+def get_timestamp_bounds(date_range: DateRange) -> tuple[int, int]:
+    """Get the timestamps where a date range starts and ends, as a half-open interval in seconds since the epoch."""
+
+    first_day, last_day = date_range.get_ordinal_bounds()
+    return (first_day - EPOCH_ORDINAL) * SECONDS_PER_DAY, (last_day + 1 - EPOCH_ORDINAL) * SECONDS_PER_DAY
+
+
+def get_timestamp_predicate(date_range: DateRange) -> Callable[[int], bool]:
+    """Get a function that checks whether a timestamp from `parse_lastmod_timestamp()` is within a date range. Date ranges without ordinal bounds are evaluated by `is_within_range()` once per distinct day."""
+
+    if has_ordinal_bounds(date_range):
+        lower_bound, upper_bound = get_timestamp_bounds(date_range)
+        return lambda timestamp: lower_bound <= timestamp < upper_bound
+
+    day_results: dict[int, bool] = {}  # Result of the date range check for each distinct day.
+
+    def is_within_range(timestamp: int) -> bool:
+        day = timestamp // SECONDS_PER_DAY
+        result = day_results.get(day)
+        if result is None:
+            result = day_results[day] = date_range.is_within_range(get_lastmod_datetime(timestamp))
+        return result
+
+    return is_within_range
+
+
+class LastModifiedIndex:
+    """Sorted index on the `<lastmod>` column of a `SitemapUrlTable`, so the rows within a date range can be found by binary search instead of scanning every row. This pays off when the same large table is sliced by many date ranges. Rows without a `<lastmod>` value are kept separately.
+
+    The index is a snapshot and is not updated when rows are added to the table. Use `SitemapUrlTable.create_lastmod_index()` to create it.
+
+    Args:
+        lastmods (array[int]): The `<lastmod>` column of the table.
+    """
+
+    __slots__ = ["lastmods", "row_indices", "missing_row_indices"]
+
+    def __init__(self, lastmods: "array[int]") -> None:
+        self.missing_row_indices = [index for index, lastmod in enumerate(lastmods) if lastmod == MISSING_LASTMOD]
+        self.row_indices = array("Q", sorted(range(len(lastmods)), key=lastmods.__getitem__))
+        del self.row_indices[: len(self.missing_row_indices)]
+        self.lastmods = array("q", (lastmods[index] for index in self.row_indices))
+
+    def __repr__(self) -> str:
+        return f"LastModifiedIndex(urls={len(self.row_indices)}, missing={len(self.missing_row_indices)})"
+
+    def __len__(self) -> int:
+        return len(self.row_indices)
+
+    def get_position_bounds(self, date_range: DateRange) -> tuple[int, int]:
+        """Get the first and the past-the-end position in the index of the rows within a date range, found by binary search.
+
+        Raises:
+            ValueError: If the date range has no ordinal bounds, see `has_ordinal_bounds()`.
+        """
+
+        if not has_ordinal_bounds(date_range):
+            raise ValueError(f"{date_range!r} has no ordinal bounds to search the index by.")
+        lower_bound, upper_bound = get_timestamp_bounds(date_range)
+        start = bisect.bisect_left(self.lastmods, lower_bound)
+        return start, max(start, bisect.bisect_left(self.lastmods, upper_bound, lo=start))
+
+    def count(self, date_range: DateRange) -> int:
+        """Count the rows within a date range. Rows without a `<lastmod>` value are not counted."""
+
+        if not has_ordinal_bounds(date_range):
+            return len(self.get_row_indices(date_range))
+        start, stop = self.get_position_bounds(date_range)
+        return stop - start
+
+    def is_selective(self, number_of_rows_in_range: int, number_of_candidate_rows: int) -> bool:
+        """Check whether putting the rows found in the index back in order is cheaper than scanning the candidate rows, which is only the case for narrow date ranges."""
+
+        number_of_rows = number_of_rows_in_range + len(self.missing_row_indices)
+        return number_of_rows < number_of_candidate_rows * LASTMOD_INDEX_MAX_FRACTION
+
+    def get_row_indices(self, date_range: DateRange) -> list[int]:
+        """Get the indices of the rows within a date range in table order. Rows without a `<lastmod>` value are not included."""
+
+        if not has_ordinal_bounds(date_range):
+            is_within_range = get_timestamp_predicate(date_range)
+            return sorted(
+                index
+                for index, lastmod in zip(self.row_indices, self.lastmods, strict=True)
+                if is_within_range(lastmod)
+            )
+        start, stop = self.get_position_bounds(date_range)
+        return sorted(self.row_indices[start:stop])
+
+
+class SitemapUrlTable:
+    """Columnar table of sitemap URLs as a compact alternative to a `list[SitemapUrl]`, e.g. when aggregating millions of URLs from many sitemaps. Instead of one object per URL and per attribute, each attribute is stored in one contiguous column:
+
+    - The URLs are encoded as UTF-8 in one buffer with an array of offsets.
+    - `<lastmod>` is stored as seconds since the epoch of the date and time as written, i.e. the time zone offset is not preserved. Date ranges are thus evaluated on the calendar date as written, the same as for a list of URLs.
+    - `<changefreq>` is stored as a small integer code, where unrecognized values share one code and are not preserved.
+    - `<priority>` is stored as a 32-bit float.
+
+    Missing or invalid values are stored as missing.
+
+    Args:
+        urls (Iterable[SitemapUrl], optional): URLs to add to the table, e.g. lazily from `iterparse_sitemap_xml_and_get_urls_as_elements()`.
+
+    Example:
+        Build a table from several sitemaps and filter it directly:
+
+        ```python linenums="1" hl_lines="5-7 9"
+        from index_now import SitemapFilter, SitemapUrlTable, DaysAgo
+        from index_now.sitemap.filter.sitemap import filter_sitemap_urls
+        from index_now.sitemap.table import parse_sitemap_xml_and_get_url_table
+
+        table = SitemapUrlTable()
+        for sitemap_content in list_of_sitemap_contents:
+            table.extend(parse_sitemap_xml_and_get_url_table(sitemap_content))
+
+        urls = filter_sitemap_urls(table, SitemapFilter(date_range=DaysAgo(2)))
+        ```
+    """
+
+    __slots__ = ["locations", "location_offsets", "lastmods", "change_frequencies", "priorities", "lastmod_index"]
+
+    def __init__(self, urls: Iterable[SitemapUrl] = ()) -> None:
+        self.locations = bytearray()
+        self.location_offsets = array("Q", [0])
+        self.lastmods = array("q")
+        self.change_frequencies = array("B")
+        self.priorities = array("f")
+        self.lastmod_index: LastModifiedIndex | None = None
+        self.extend(urls)
+
+    def __repr__(self) -> str:
+        return f"SitemapUrlTable(urls={len(self)}, nbytes={self.nbytes})"
+
+    def __len__(self) -> int:
+        return len(self.lastmods)
+
+    def __getitem__(self, index: int) -> SitemapUrl:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Sitemap URL table index out of range.")
+        lastmod = self.lastmods[index]
+        priority = self.priorities[index]
+        return SitemapUrl(
+            loc=self.get_location(index),
+            lastmod=get_lastmod_datetime(lastmod).isoformat() if lastmod != MISSING_LASTMOD else None,
+            changefreq=CHANGE_FREQUENCY_VALUES.get(self.change_frequencies[index]),
+            priority=None if math.isnan(priority) else priority,
+        )
+
+    def __iter__(self) -> Iterator[SitemapUrl]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SitemapUrlTable):
+            return NotImplemented
+        return all(
+            getattr(self, column) == getattr(other, column)
+            for column in ["locations", "location_offsets", "lastmods", "change_frequencies", "priorities"]
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the columns."""
+
+        columns: list[array[Any]] = [self.location_offsets, self.lastmods, self.change_frequencies, self.priorities]
+        return len(self.locations) + sum(column.itemsize * len(column) for column in columns)
+
+    def append(self, url: SitemapUrl) -> None:
+        """Add a URL to the end of the table."""
+
+        self.locations += url.loc.encode()
+        self.location_offsets.append(len(self.locations))
+        lastmod = parse_lastmod_timestamp(url.lastmod)
+        self.lastmods.append(MISSING_LASTMOD if lastmod is None else lastmod)
+        self.change_frequencies.append(get_change_frequency_code(url.changefreq))
+        self.priorities.append(math.nan if url.priority is None else url.priority)
+        self.lastmod_index = None
+
+    def extend(self, urls: "Iterable[SitemapUrl] | SitemapUrlTable") -> None:
+        """Add URLs to the end of the table. Another table is appended column by column."""
+
+        if isinstance(urls, SitemapUrlTable):
+            offset = len(self.locations)
+            self.locations += urls.locations
+            self.location_offsets.extend(location_offset + offset for location_offset in urls.location_offsets[1:])
+            self.lastmods.extend(urls.lastmods)
+            self.change_frequencies.extend(urls.change_frequencies)
+            self.priorities.extend(urls.priorities)
+            self.lastmod_index = None
+        else:
+            for url in urls:
+                self.append(url)
+
+    def create_lastmod_index(self) -> LastModifiedIndex:
+        """Create a sorted index on the `<lastmod>` column, which is then used when the table is filtered by date range. The index is dropped when rows are added to the table.
+
+        Returns:
+            LastModifiedIndex: The index, which can also be queried directly, e.g. to count the URLs within a date range.
+
+        Example:
+            Slice the same table by many date ranges without scanning every row each time:
+
+            ```python linenums="1" hl_lines="6"
+            from datetime import datetime
+            from index_now import SitemapFilter, SitemapUrlTable, Day
+            from index_now.sitemap.filter.sitemap import filter_sitemap_urls
+
+            table = SitemapUrlTable(urls)
+            table.create_lastmod_index()
+
+            for day in range(1, 32):
+                urls_of_day = filter_sitemap_urls(table, SitemapFilter(date_range=Day(datetime(2025, 1, day))))
+            ```
+        """
+
+        self.lastmod_index = LastModifiedIndex(self.lastmods)
+        return self.lastmod_index
+
+    def get_location(self, index: int) -> str:
+        """Get the URL of a row without creating a `SitemapUrl` for it."""
+
+        return self.locations[self.location_offsets[index] : self.location_offsets[index + 1]].decode()
+
+    def get_locations(self, indices: Iterable[int] | None = None) -> list[str]:
+        """Get the URLs of the given rows, or of all rows if set to `None`."""
+
+        return [self.get_location(index) for index in (range(len(self)) if indices is None else indices)]
+
+
+def parse_sitemap_xml_and_get_url_table(sitemap_content: str | bytes | Any) -> SitemapUrlTable:
+    """Parse the contents of an XML sitemap file, e.g. from a response, directly into a `SitemapUrlTable` without creating a list of `SitemapUrl` elements first. Nested XML sitemaps are skipped.
+
+    Args:
+        sitemap_content (str | bytes | Any): The content of the XML sitemap file.
+
+    Returns:
+        SitemapUrlTable: Table of the URLs found in the XML sitemap file. The table is empty if the XML could not be parsed.
+    """
+
+    if isinstance(sitemap_content, str):
+        sitemap_content = sitemap_content.encode()
+    return SitemapUrlTable(iterparse_sitemap_xml_and_get_urls_as_elements([sitemap_content]))
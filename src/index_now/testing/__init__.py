@@ -0,0 +1,5 @@
+"""Local IndexNow-compatible stand-in server for load and chaos testing of the client offline, e.g. in CI or on a laptop."""
+
+__all__ = ["IndexNowStandInServer", "RecordedRequest", "StandInServerStatistics"]
+
+from .server import IndexNowStandInServer, RecordedRequest, StandInServerStatistics
@@ -0,0 +1,424 @@
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from urllib.parse import parse_qs, urlsplit
+
+from ..constant import MAX_URLS_PER_BATCH
+
+ENDPOINT_PATH = "/indexnow"
+
+API_KEY_PATTERN = re.compile(r"[a-zA-Z0-9-]{8,128}")
+
+DEFAULT_FAILURE_STATUS_CODES = (
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+)
+
+RETRY_AFTER_STATUS_CODES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+
+
+def is_success(status_code: int) -> bool:
+    return HTTPStatus.OK <= status_code < HTTPStatus.MULTIPLE_CHOICES
+
+
+@dataclass(slots=True, frozen=True)
+class RecordedRequest:
+    """A request received by the stand-in server.
+
+    Attributes:
+        method (str): The HTTP method, e.g. `GET` or `POST`.
+        path (str): The path of the request including the query string.
+        body (bytes): The body of the request, which is empty for `GET` requests.
+        status_code (int): The status code of the response.
+        url_count (int): Number of URLs submitted in the request, or `0` if it was not a submission.
+        client_address (tuple[str, int]): Address and port of the client connection, e.g. to check that connections are reused.
+    """
+
+    method: str
+    path: str
+    body: bytes
+    status_code: int
+    url_count: int = 0
+    client_address: tuple[str, int] = ("", 0)
+
+
+@dataclass(slots=True, frozen=True)
+class StandInServerStatistics:
+    """Counters of the requests received by the stand-in server since it was started or reset.
+
+    Attributes:
+        request_count (int): Number of requests, including requests for sitemaps.
+        submission_count (int): Number of requests to the IndexNow endpoint.
+        accepted_url_count (int): Number of URLs in submissions that succeeded with a `2xx` status code.
+        received_bytes (int): Number of bytes received in request bodies.
+        status_code_counts (dict[int, int]): Number of responses by status code.
+    """
+
+    request_count: int = 0
+    submission_count: int = 0
+    accepted_url_count: int = 0
+    received_bytes: int = 0
+    status_code_counts: dict[int, int] = field(default_factory=dict)
+
+
+class IndexNowStandInServer:
+    """Local IndexNow-compatible server that stands in for the search engines and the sitemaps of a website, so the client can be load-tested and its backoff behavior can be tested offline, e.g. in CI or on a laptop. The server runs in a background thread.
+
+    Submissions are accepted at the `/indexnow` path as `GET` requests with `url` and `key` query parameters, or as `POST` requests with a JSON payload with `host`, `key` and `urlList`. Like the search engines, the server responds with:
+
+    - `200 OK` if the submission is valid.
+    - `400 Bad Request` if the payload or the parameters are invalid.
+    - `403 Forbidden` if the key does not have 8 to 128 letters, digits or dashes.
+    - `413 Content Too Large` if the payload exceeds the size limit or has too many URLs.
+    - `422 Unprocessable Entity` if the URLs do not belong to the host of the payload.
+
+    Failures can be injected before the submission is validated, with an optional `Retry-After` header for `429` and `503`. Every other `GET` request is answered with a sitemap fixture by path with an `ETag` header, or `404 Not Found`.
+
+    Args:
+        files (dict[str, bytes] | None, optional): Sitemap fixtures to serve by path, e.g. `{"/sitemap.xml": b"<?xml ..."}`.
+        host (str, optional): Address to listen on.
+        port (int, optional): Port to listen on. Uses a free port if set to `0`.
+        latency (float, optional): Seconds to wait before responding to each submission.
+        latency_jitter (float, optional): Maximum number of random seconds added to the latency.
+        failure_rate (float, optional): Probability between `0` and `1` that a submission fails with one of the failure status codes.
+        failure_status_codes (Iterable[int], optional): Status codes of the random failures, chosen with equal probability.
+        status_codes (Iterable[int], optional): Status codes of the next submissions in this order, e.g. `[429, 503]` to let the first two submissions fail. Takes precedence over the random failures. A `2xx` status code is used for the response if the submission is valid.
+        success_status_code (int, optional): Status code of a valid submission, e.g. `202 Accepted`.
+        retry_after (int | None, optional): Value of the `Retry-After` header in whole seconds for `429` and `503` responses. No header if set to `None`.
+        max_payload_size (int | None, optional): Maximum number of bytes of a request body. Unlimited if set to `None`.
+        max_urls_per_request (int, optional): Maximum number of URLs per submission.
+        seed (int | None, optional): Seed of the random failures and latency, so a run can be reproduced.
+        record_requests (bool, optional): If `True`, keep every request in `requests`. Disable it for long load tests to save memory, as the counters are kept either way.
+
+    Example:
+        Measure how the client handles a server that throttles every fourth request:
+
+        ```python linenums="1" hl_lines="4-6 9"
+        from index_now import IndexNowAuthentication, IndexNowClient, submit_urls_to_index_now
+        from index_now.testing import IndexNowStandInServer
+
+        with IndexNowStandInServer(
+            latency=0.05, failure_rate=0.25, failure_status_codes=[429], retry_after=1, seed=42
+        ) as server, IndexNowClient(max_retries=5) as client:
+            authentication = IndexNowAuthentication("example.com", "a1b2c3d4", "https://example.com/a1b2c3d4.txt")
+            urls = [f"https://example.com/page{number}" for number in range(100_000)]
+            result = submit_urls_to_index_now(authentication, urls, server.endpoint, client, batch_size=1_000)
+            print(result.status_code, server.statistics)
+        ```
+
+        Or run the server from the command line, e.g. on port 8000 with 50 milliseconds of latency and 10% failures:
+
+        ```shell
+        python -m index_now.testing --port 8000 --latency 0.05 --failure-rate 0.1
+        ```
+    """
+
+    __slots__ = [
+        "files",
+        "host",
+        "port",
+        "latency",
+        "latency_jitter",
+        "failure_rate",
+        "failure_status_codes",
+        "status_codes",
+        "retry_after",
+        "success_status_code",
+        "max_payload_size",
+        "max_urls_per_request",
+        "randomizer",
+        "record_requests",
+        "requests",
+        "counters",
+        "lock",
+        "server",
+        "thread",
+    ]
+
+    def __init__(
+        self,
+        files: dict[str, bytes] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        failure_status_codes: Iterable[int] = DEFAULT_FAILURE_STATUS_CODES,
+        status_codes: Iterable[int] = (),
+        retry_after: int | None = None,
+        success_status_code: int = HTTPStatus.OK,
+        max_payload_size: int | None = None,
+        max_urls_per_request: int = MAX_URLS_PER_BATCH,
+        seed: int | None = None,
+        record_requests: bool = True,
+    ) -> None:
+        if latency < 0 or latency_jitter < 0:
+            raise ValueError("Latency cannot be negative.")
+        if not 0 <= failure_rate <= 1:
+            raise ValueError("Failure rate must be between 0 and 1.")
+        self.failure_status_codes = list(failure_status_codes)
+        if failure_rate and not self.failure_status_codes:
+            raise ValueError("Failure status codes are required for a failure rate above 0.")
+        self.files = files if files is not None else {}
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.failure_rate = failure_rate
+        self.status_codes = list(status_codes)
+        self.retry_after = retry_after
+        self.success_status_code = success_status_code
+        self.max_payload_size = max_payload_size
+        self.max_urls_per_request = max_urls_per_request
+        self.randomizer = random.Random(seed)
+        self.record_requests = record_requests
+        self.requests: list[RecordedRequest] = []
+        self.counters: Counter[str] = Counter()
+        self.lock = threading.Lock()
+        self.server: ThreadingHTTPServer | None = None
+        self.thread: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"IndexNowStandInServer(url={self.url}, latency={self.latency}, failure_rate={self.failure_rate}, "
+            f"retry_after={self.retry_after})"
+        )
+
+    def __enter__(self) -> "IndexNowStandInServer":
+        self.start()
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, e.g. for the locations of the sitemap fixtures."""
+
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def endpoint(self) -> str:
+        """URL of the IndexNow endpoint to submit to."""
+
+        return f"{self.url}{ENDPOINT_PATH}"
+
+    @property
+    def statistics(self) -> StandInServerStatistics:
+        """Snapshot of the counters since the server was started or reset."""
+
+        with self.lock:
+            return StandInServerStatistics(
+                request_count=self.counters["requests"],
+                submission_count=self.counters["submissions"],
+                accepted_url_count=self.counters["accepted_urls"],
+                received_bytes=self.counters["received_bytes"],
+                status_code_counts={
+                    int(key.removeprefix("status_")): count
+                    for key, count in sorted(self.counters.items())
+                    if key.startswith("status_")
+                },
+            )
+
+    def reset_statistics(self) -> None:
+        """Reset the counters and forget the recorded requests, e.g. between the phases of a load test."""
+
+        with self.lock:
+            self.counters.clear()
+            self.requests.clear()
+
+    def start(self) -> None:
+        """Start listening in a background thread."""
+
+        if self.server is not None:
+            raise RuntimeError("The server has already been started.")
+        self.server = ThreadingHTTPServer((self.host, self.port), create_request_handler(self))
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, name="index-now-stand-in-server", daemon=True)
+        self.thread.start()
+
+    def close(self) -> None:
+        """Stop the server and close its socket."""
+
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def get_next_status_code(self) -> int | None:
+        """Get the scripted status code or the status code of a random failure for the next submission, if any."""
+
+        with self.lock:
+            if self.status_codes:
+                return self.status_codes.pop(0)
+            if self.failure_rate and self.randomizer.random() < self.failure_rate:
+                return self.randomizer.choice(self.failure_status_codes)
+            return None
+
+    def get_delay(self) -> float:
+        """Get the number of seconds to wait before responding to a submission."""
+
+        if not self.latency_jitter:
+            return self.latency
+        with self.lock:
+            return self.latency + self.randomizer.uniform(0, self.latency_jitter)
+
+    def handle_submission(self, method: str, path: str, body: bytes) -> tuple[int, str, int]:
+        """Validate a submission like a search engine would.
+
+        Returns:
+            tuple[int, str, int]: The status code, the response text and the number of submitted URLs.
+        """
+
+        if method == "GET":
+            query = parse_qs(urlsplit(path).query)
+            urls, keys = query.get("url", []), query.get("key", [])
+            if len(urls) != 1 or len(keys) != 1:
+                return HTTPStatus.BAD_REQUEST, "Exactly one url and one key parameter are required.", 0
+            host, key = urlsplit(urls[0]).hostname, keys[0]
+        else:
+            try:
+                payload = json.loads(body)
+                host, key, urls = payload["host"], payload["key"], payload["urlList"]
+            except (ValueError, TypeError, KeyError):
+                return HTTPStatus.BAD_REQUEST, "The payload must be JSON with host, key and urlList.", 0
+            if not isinstance(urls, list) or not urls or not all(isinstance(url, str) for url in urls):
+                return HTTPStatus.BAD_REQUEST, "The urlList must be a non-empty list of URLs.", 0
+        if not isinstance(key, str) or not API_KEY_PATTERN.fullmatch(key):
+            return HTTPStatus.FORBIDDEN, "The key is not valid.", len(urls)
+        if len(urls) > self.max_urls_per_request:
+            return (
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"At most {self.max_urls_per_request} URLs are allowed.",
+                len(urls),
+            )
+        if not host or any(urlsplit(url).hostname != host for url in urls):
+            return HTTPStatus.UNPROCESSABLE_ENTITY, "The URLs do not belong to the host.", len(urls)
+        return self.success_status_code, "", len(urls)
+
+    def count(self, request: RecordedRequest, is_submission: bool) -> None:
+        """Update the counters with a request that has been answered."""
+
+        with self.lock:
+            self.counters["requests"] += 1
+            self.counters["received_bytes"] += len(request.body)
+            self.counters[f"status_{request.status_code}"] += 1
+            if is_submission:
+                self.counters["submissions"] += 1
+                if is_success(request.status_code):
+                    self.counters["accepted_urls"] += request.url_count
+            if self.record_requests:
+                self.requests.append(request)
+
+
+def create_request_handler(stand_in_server: IndexNowStandInServer) -> type[BaseHTTPRequestHandler]:
+    """Create a request handler class that answers the requests on behalf of the stand-in server."""
+
+    class RequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+        def handle_request(self) -> None:
+            content_length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(content_length) if content_length else b""
+            is_submission = urlsplit(self.path).path == ENDPOINT_PATH
+            url_count = 0
+            if not is_submission:
+                status_code, content, headers = self.get_file(urlsplit(self.path).path)
+            elif stand_in_server.max_payload_size is not None and len(body) > stand_in_server.max_payload_size:
+                status_code, content, headers = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, b"The payload is too large.", {}
+            elif (next_status_code := stand_in_server.get_next_status_code()) and not is_success(next_status_code):
+                status_code, content, headers = next_status_code, b"Injected failure.", {}
+                if stand_in_server.retry_after is not None and status_code in RETRY_AFTER_STATUS_CODES:
+                    headers["Retry-After"] = str(stand_in_server.retry_after)
+            else:
+                status_code, text, url_count = stand_in_server.handle_submission(self.command, self.path, body)
+                if next_status_code and is_success(status_code):
+                    status_code = next_status_code
+                content, headers = text.encode(), {}
+            if is_submission and (delay := stand_in_server.get_delay()):
+                time.sleep(delay)
+
+            # Counted before responding, so the counters are up to date once the client has the response:
+            request = RecordedRequest(self.command, self.path, body, status_code, url_count, self.client_address[:2])
+            stand_in_server.count(request, is_submission)
+            self.respond(status_code, content, headers)
+
+        def get_file(self, path: str) -> tuple[int, bytes, dict[str, str]]:
+            if self.command != "GET" or (content := stand_in_server.files.get(path)) is None:
+                return HTTPStatus.NOT_FOUND, b"Not found", {}
+            etag = f'"{hashlib.sha256(content).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                return HTTPStatus.NOT_MODIFIED, b"", {"ETag": etag}
+            return HTTPStatus.OK, content, {"ETag": etag}
+
+        def respond(self, status_code: int, body: bytes, headers: dict[str, str]) -> None:
+            self.send_response(status_code)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = handle_request
+        do_POST = handle_request
+
+    return RequestHandler
+
+
+def main() -> None:
+    """Run the stand-in server from the command line until it is interrupted."""
+
+    parser = argparse.ArgumentParser(description="Local IndexNow-compatible server for load and chaos testing.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before each response.")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Maximum random seconds added.")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability that a submission fails.")
+    parser.add_argument(
+        "--failure-status-codes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_FAILURE_STATUS_CODES),
+        help="Status codes of the random failures.",
+    )
+    parser.add_argument("--retry-after", type=int, default=None, help="Retry-After seconds for 429 and 503.")
+    parser.add_argument("--max-payload-size", type=int, default=None, help="Maximum bytes of a request body.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the random failures and latency.")
+    arguments = parser.parse_args()
+
+    server = IndexNowStandInServer(
+        host=arguments.host,
+        port=arguments.port,
+        latency=arguments.latency,
+        latency_jitter=arguments.latency_jitter,
+        failure_rate=arguments.failure_rate,
+        failure_status_codes=arguments.failure_status_codes,
+        retry_after=arguments.retry_after,
+        max_payload_size=arguments.max_payload_size,
+        seed=arguments.seed,
+        record_requests=False,
+    )
+    with server:
+        print(f"Accepting IndexNow submissions at {server.endpoint} (press Ctrl+C to stop).")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(server.statistics)
@@ -0,0 +1,200 @@
+import atexit
+import threading
+import time
+import weakref
+from types import TracebackType
+
+from ..authentication import IndexNowAuthentication
+from ..client import IndexNowClient, get_default_client
+from ..constant import DEFAULT_BUFFER_MAX_DELAY, DEFAULT_BUFFER_MAX_SIZE, MAX_URLS_PER_BATCH
+from ..endpoint import SearchEngineEndpoint
+from ..log import logger
+from ..queue import is_permanent_failure
+from ..result import SubmissionResult
+from .submit import submit_urls_to_index_now
+
+OPEN_SUBMITTERS: "weakref.WeakSet[BufferedSubmitter]" = weakref.WeakSet()
+
+
+@atexit.register
+def close_open_submitters() -> None:
+    """Flush and close the submitters that are still open when the program exits. The submitters are only referenced weakly, so this does not keep them alive."""
+
+    for submitter in list(OPEN_SUBMITTERS):
+        submitter.close()
+
+
+class BufferedSubmitter:
+    """Collect single URLs and submit them together in one request, instead of one request per URL. The buffer is flushed in the background when it holds `max_size` URLs, or `max_delay` seconds after the first URL was added, whichever comes first. Duplicate URLs are only submitted once per flush, and anything left in the buffer is submitted when the program exits. If a background flush fails temporarily, e.g. because of a network error or a `5xx` or `429` response, the URLs are put back in the buffer and submitted again after `max_delay` seconds. URLs that are rejected for good, e.g. with `403 Forbidden`, are not retried.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across submissions. Uses a shared default client if set to `None`.
+        max_size (int, optional): Number of unique URLs that triggers a flush. Cannot exceed 10,000 URLs.
+        max_delay (float, optional): Maximum number of seconds a URL waits in the buffer before it is submitted.
+
+    Example:
+        Create one buffer for the lifetime of the application, and add a URL each time a page is edited:
+
+        ```python linenums="1" hl_lines="9 12"
+        from index_now import BufferedSubmitter, IndexNowAuthentication
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
+        )
+
+        submitter = BufferedSubmitter(authentication, max_size=500, max_delay=30)
+
+        def on_page_edited(url: str) -> None:
+            submitter.submit(url)
+        ```
+
+        Use `submitter.flush()` to submit the buffered URLs right away, or `submitter.close()` to flush and stop the background thread.
+    """
+
+    __slots__ = [
+        "authentication",
+        "endpoint",
+        "client",
+        "max_size",
+        "max_delay",
+        "urls",
+        "first_added_at",
+        "retry_at",
+        "is_closed",
+        "condition",
+        "thread",
+        "__weakref__",
+    ]
+
+    def __init__(
+        self,
+        authentication: IndexNowAuthentication,
+        endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
+        client: IndexNowClient | None = None,
+        max_size: int = DEFAULT_BUFFER_MAX_SIZE,
+        max_delay: float = DEFAULT_BUFFER_MAX_DELAY,
+    ) -> None:
+        if not 1 <= max_size <= MAX_URLS_PER_BATCH:
+            raise ValueError(f"Max size must be between 1 and {MAX_URLS_PER_BATCH:,}.")
+        if max_delay <= 0:
+            raise ValueError("Max delay must be positive.")
+        self.authentication = authentication
+        self.endpoint = endpoint
+        self.client = client or get_default_client()
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.urls: dict[str, None] = {}  # Ordered set for deduplication.
+        self.first_added_at = 0.0
+        self.retry_at = 0.0
+        self.is_closed = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="index-now-buffered-submitter", daemon=True)
+        self.thread.start()
+        OPEN_SUBMITTERS.add(self)
+
+    def __repr__(self) -> str:
+        return f"BufferedSubmitter(endpoint={self.endpoint}, max_size={self.max_size}, max_delay={self.max_delay})"
+
+    def __len__(self) -> int:
+        with self.condition:
+            return len(self.urls)
+
+    def __enter__(self) -> "BufferedSubmitter":
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def submit(self, url: str) -> None:
+        """Add a URL to the buffer. This returns immediately, as the URL is submitted in the background."""
+
+        with self.condition:
+            if self.is_closed:
+                raise RuntimeError("Cannot submit URLs to a closed buffer.")
+            if not self.urls:
+                self.first_added_at = time.monotonic()
+                self.condition.notify()  # Start the timer for the time-based flush.
+            self.urls[url] = None
+            if len(self.urls) >= self.max_size:
+                self.condition.notify()
+
+    def take_urls(self) -> list[str]:
+        urls = list(self.urls)
+        self.urls = {}
+        return urls
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.is_closed:
+                    if not self.urls:
+                        self.condition.wait()
+                        continue
+                    now = time.monotonic()
+                    flush_at = now if len(self.urls) >= self.max_size else self.first_added_at + self.max_delay
+                    flush_at = max(flush_at, self.retry_at)
+                    if flush_at <= now:
+                        break
+                    self.condition.wait(flush_at - now)
+                if self.is_closed:  # What is left is flushed by close().
+                    return
+                urls = self.take_urls()
+            try:
+                result = submit_urls_to_index_now(self.authentication, urls, self.endpoint, self.client)
+            except Exception:  # E.g. a network error, which should not stop the background thread.
+                logger.exception(
+                    "Failed to submit %d buffered URL(s). Retrying in %g seconds.", len(urls), self.max_delay
+                )
+                self.put_back_urls(urls)
+                continue
+            if not result.is_success and not is_permanent_failure(result.status_code):
+                logger.warning(
+                    "Failed to submit %d buffered URL(s) with status code %d. Retrying in %g seconds.",
+                    len(urls),
+                    result.status_code,
+                    self.max_delay,
+                )
+                self.put_back_urls(urls)
+
+    def put_back_urls(self, urls: list[str]) -> None:
+        """Put the URLs of a failed flush back in front of the buffer, so they are retried after `max_delay` seconds or flushed by `close()`."""
+
+        with self.condition:
+            self.urls = dict.fromkeys([*urls, *self.urls])
+            self.first_added_at = time.monotonic()
+            self.retry_at = self.first_added_at + self.max_delay
+
+    def flush(self) -> SubmissionResult | None:
+        """Submit the buffered URLs right away in the current thread.
+
+        Returns:
+            SubmissionResult | None: The result of the submission, or `None` if the buffer was empty.
+        """
+
+        with self.condition:
+            urls = self.take_urls()
+        if not urls:
+            return None
+        return submit_urls_to_index_now(self.authentication, urls, self.endpoint, self.client)
+
+    def close(self) -> SubmissionResult | None:
+        """Stop the background thread and submit what is left in the buffer. This is called automatically when the program exits.
+
+        Returns:
+            SubmissionResult | None: The result of the final submission, or `None` if the buffer was empty.
+        """
+
+        with self.condition:
+            if self.is_closed:
+                return None
+            self.is_closed = True
+            self.condition.notify_all()
+        self.thread.join()
+        OPEN_SUBMITTERS.discard(self)
+        return self.flush()
@@ -0,0 +1,140 @@
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from typing import TypeVar
+
+T = TypeVar("T")
+
+FINGERPRINT_MASK = 2**64 - 1
+
+EMPTY_SLOT = 0
+
+MIN_CAPACITY = 16
+
+MAX_LOAD_FACTOR = 0.5
+
+
+def get_url_fingerprint(url: str) -> int:
+    """Get a 64-bit fingerprint of a URL, which is never `0`, as that marks an empty slot. The fingerprint is based on the built-in string hash, which is cached on the string and is only stable within the same process."""
+
+    return hash(url) & FINGERPRINT_MASK or 1
+
+
+class UrlDeduplicator:
+    """Probabilistic, order-preserving deduplication of a stream of URLs, e.g. when sitemaps are streamed and the same URL is listed in several locale, category or tag sitemaps. Instead of keeping a second copy of every URL string in a `set`, only a 64-bit fingerprint of each URL is stored in an open-addressing hash table backed by one contiguous `array`, which takes 16 to 32 bytes per unique URL.
+
+    As the deduplication is probabilistic, two different URLs may share a fingerprint, so a new URL is taken for a duplicate and dropped. The probability is small, about 1 in 37 million for 1,000,000 unique URLs, but not zero, so only use the deduplicator when the URLs are not kept in memory anyway. A list of URLs that is already in memory is deduplicated exactly with `dict.fromkeys()` at no extra cost. As the fingerprints are only stable within the same process, the deduplicator cannot be persisted.
+
+    Args:
+        expected_count (int, optional): Expected number of unique URLs, so the table can be allocated at once instead of being resized while URLs are added.
+
+    Example:
+        Merge the URLs of several sitemaps and keep the first occurrence of each URL:
+
+        ```python linenums="1" hl_lines="3 5"
+        from index_now import UrlDeduplicator
+
+        deduplicator = UrlDeduplicator()
+        for url in urls_of_all_sitemaps:
+            if deduplicator.add(url):
+                print(url)
+        ```
+    """
+
+    __slots__ = ["slots", "mask", "count"]
+
+    def __init__(self, expected_count: int = 0) -> None:
+        if expected_count < 0:
+            raise ValueError("Expected count cannot be negative.")
+        capacity = MIN_CAPACITY
+        while capacity * MAX_LOAD_FACTOR < expected_count:
+            capacity *= 2
+        self.slots = array("Q", [EMPTY_SLOT]) * capacity
+        self.mask = capacity - 1
+        self.count = 0
+
+    def __repr__(self) -> str:
+        return f"UrlDeduplicator(urls={self.count}, nbytes={self.nbytes})"
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, url: object) -> bool:
+        if not isinstance(url, str):
+            return False
+        fingerprint = get_url_fingerprint(url)
+        slots, mask = self.slots, self.mask
+        index = fingerprint & mask
+        while (slot := slots[index]) != EMPTY_SLOT:
+            if slot == fingerprint:
+                return True
+            index = (index + 1) & mask
+        return False
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the hash table."""
+
+        return self.slots.itemsize * len(self.slots)
+
+    def add(self, url: str) -> bool:
+        """Add a URL to the seen URLs.
+
+        Returns:
+            bool: `True` if the URL has not been seen before, or otherwise `False`.
+        """
+
+        fingerprint = get_url_fingerprint(url)
+        slots, mask = self.slots, self.mask
+        index = fingerprint & mask
+        while (slot := slots[index]) != EMPTY_SLOT:
+            if slot == fingerprint:
+                return False
+            index = (index + 1) & mask
+        slots[index] = fingerprint
+        self.count += 1
+        if self.count > len(slots) * MAX_LOAD_FACTOR:
+            self.resize(len(slots) * 2)
+        return True
+
+    def resize(self, capacity: int) -> None:
+        """Move the fingerprints to a larger hash table, so the probe sequences stay short."""
+
+        old_slots = self.slots
+        self.slots = slots = array("Q", [EMPTY_SLOT]) * capacity
+        self.mask = mask = capacity - 1
+        for fingerprint in old_slots:
+            if fingerprint != EMPTY_SLOT:
+                index = fingerprint & mask
+                while slots[index] != EMPTY_SLOT:
+                    index = (index + 1) & mask
+                slots[index] = fingerprint
+
+    def filter(self, urls: Iterable[T], key: Callable[[T], str] | None = None) -> Iterator[T]:
+        """Lazily yield the URLs that have not been seen before, in the given order.
+
+        Args:
+            urls (Iterable[T]): The URLs, or items that each have a URL, e.g. `SitemapUrl` elements.
+            key (Callable[[T], str] | None, optional): Function that gets the URL of an item, e.g. `operator.attrgetter("loc")`. The items are the URLs if set to `None`.
+
+        Yields:
+            T: Each URL or item with a URL that has not been seen before.
+        """
+
+        # Same as `add()` with the probing inlined, as the method call dominates the cost per URL:
+        slots, mask = self.slots, self.mask
+        max_count = len(slots) * MAX_LOAD_FACTOR
+        for url in urls:
+            fingerprint = hash(key(url) if key else url) & FINGERPRINT_MASK or 1
+            index = fingerprint & mask
+            while (slot := slots[index]) != EMPTY_SLOT:
+                if slot == fingerprint:
+                    break
+                index = (index + 1) & mask
+            else:
+                slots[index] = fingerprint
+                self.count += 1
+                if self.count > max_count:
+                    self.resize(len(slots) * 2)
+                    slots, mask = self.slots, self.mask
+                    max_count = len(slots) * MAX_LOAD_FACTOR
+                yield url
@@ -1,25 +1,35 @@
-import requests
-from colorist import Color
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from http import HTTPStatus
+from itertools import islice, product, repeat
 
-from ..authentication import IndexNowAuthentication
+from ..authentication import AuthenticationRegistry, IndexNowAuthentication
+from ..client import IndexNowClient, get_default_client
+from ..constant import DEFAULT_MAX_CONCURRENT_BATCHES, DEFAULT_MAX_IO_WORKERS, JSON_HEADERS, MAX_URLS_PER_BATCH
 from ..endpoint import SearchEngineEndpoint
-from ..status_code import SUCCESS_STATUS_CODES_COLLECTION, SUCCESS_STATUS_CODES_COLLECTION_DICTIONARY
+from ..log import logger
+from ..result import BatchResult, SubmissionResult
+from ..status_code import SUCCESS_STATUS_CODES_COLLECTION_DICTIONARY
 
 
 def submit_url_to_index_now(
     authentication: IndexNowAuthentication,
     url: str,
     endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
-) -> int:
-    """Submit a list of URLs to the IndexNow API of a search engine.
+    client: IndexNowClient | None = None,
+) -> SubmissionResult:
+    """Submit a single URL to the IndexNow API of a search engine.
 
     Args:
         authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
         url (str): URL to submit, e.g. `"https://example.com/page1"`.
         endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across calls. Uses a shared default client if set to `None`.
 
     Returns:
-        int: The status code of the response, e.g. `200` for success, `202` for accepted, `400` for bad request, etc.
+        SubmissionResult: The status code of the response, e.g. `200` for success, `202` for accepted, `400` for bad request, etc., and the response text.
 
     Example:
         After adding your authentication credentials to the [`IndexNowAuthentication`](../configuration/authentication.md) class, you can now submit a single URL to the IndexNow API:
@@ -46,37 +56,120 @@ def submit_url_to_index_now(
         ```
     """
 
-    response = requests.get(
-        url=str(endpoint),
-        params={"url": url, "key": authentication.api_key, "keyLocation": authentication.api_key_location},
-    )
+    client = client or get_default_client()
+    response = client.get(url=str(endpoint), params=create_query_parameters(authentication, url))
+    batch_result = BatchResult(url_count=1, status_code=response.status_code, response_text=response.text)
+    result = SubmissionResult.from_batches(str(endpoint), [batch_result])
+    log_url_submission(result)
+    return result
 
-    if response.status_code in SUCCESS_STATUS_CODES_COLLECTION:
-        print(f"{Color.GREEN}1 URL was submitted successfully to this IndexNow API endpoint:{Color.OFF} {endpoint}")
-        print(
-            f"Status code: {Color.GREEN}{response.status_code} {SUCCESS_STATUS_CODES_COLLECTION_DICTIONARY[response.status_code]}{Color.OFF}"
+
+def create_query_parameters(authentication: IndexNowAuthentication, url: str) -> dict[str, str]:
+    """Create the query parameters for submitting a single URL with a GET request."""
+
+    return {"url": url, "key": authentication.api_key, "keyLocation": authentication.api_key_location}
+
+
+def create_payload(authentication: IndexNowAuthentication, urls: list[str]) -> dict[str, str | list[str]]:
+    """Create the JSON payload for submitting a list of URLs with a POST request."""
+
+    return {
+        "host": authentication.host,
+        "key": authentication.api_key,
+        "keyLocation": authentication.api_key_location,
+        "urlList": urls,
+    }
+
+
+def serialize_payload(authentication: IndexNowAuthentication, urls: list[str]) -> bytes:
+    """Serialize the JSON payload for submitting a list of URLs, so the same bytes can be sent to several endpoints."""
+
+    return json.dumps(create_payload(authentication, urls), allow_nan=False).encode()
+
+
+def log_url_submission(result: SubmissionResult) -> None:
+    """Log the outcome of submitting a single URL."""
+
+    if result.is_success:
+        logger.info(
+            "1 URL was submitted successfully to this IndexNow API endpoint: %s (status code: %d %s)",
+            result.endpoint,
+            result.status_code,
+            SUCCESS_STATUS_CODES_COLLECTION_DICTIONARY[result.status_code],
         )
     else:
-        print(f"{Color.YELLOW}Failure. No URL was submitted to this IndexNow API endpoint:{Color.OFF} {endpoint}")
-        print(f"Status code: {Color.RED}{response.status_code}{Color.OFF}")
-        print(f"Response: {response.text}")
-    return response.status_code
+        logger.warning(
+            "Failure. No URL was submitted to this IndexNow API endpoint: %s (status code: %d, response: %s)",
+            result.endpoint,
+            result.status_code,
+            result.batches[0].response_text,
+        )
+
+
+def split_urls_into_batches(urls: list[str], batch_size: int) -> list[list[str]]:
+    """Split a list of URLs into batches of a given maximum size. An empty list results in a single empty batch."""
+
+    return [urls[i : i + batch_size] for i in range(0, len(urls), batch_size)] or [urls]
+
+
+def iterate_batches(urls: Iterable[str], batch_size: int) -> Iterator[list[str]]:
+    """Lazily split an iterable of URLs into batches of a given maximum size, so only one batch is held in memory at a time."""
+
+    iterator = iter(urls)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def submit_batch_to_index_now(
+    authentication: IndexNowAuthentication,
+    urls: list[str],
+    endpoint: SearchEngineEndpoint | str,
+    client: IndexNowClient,
+) -> BatchResult:
+    """Submit a single batch of URLs in one request to the IndexNow API of a search engine.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        urls (list[str]): List of URLs to submit. Should not exceed the maximum of 10,000 URLs per request.
+        endpoint (SearchEngineEndpoint | str): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (IndexNowClient): Client with a connection pool.
+
+    Returns:
+        BatchResult: The outcome of the request.
+    """
+
+    return post_payload_to_index_now(serialize_payload(authentication, urls), len(urls), endpoint, client)
+
+
+def post_payload_to_index_now(
+    payload: bytes, url_count: int, endpoint: SearchEngineEndpoint | str, client: IndexNowClient
+) -> BatchResult:
+    """Post an already serialized payload with a batch of URLs to the IndexNow API of a search engine."""
+
+    response = client.post(url=str(endpoint), data=payload, headers=JSON_HEADERS)
+    return BatchResult(url_count=url_count, status_code=response.status_code, response_text=response.text)
 
 
 def submit_urls_to_index_now(
     authentication: IndexNowAuthentication,
     urls: list[str],
     endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
-) -> int:
-    """Submit a list of URLs to the IndexNow API of a search engine.
+    client: IndexNowClient | None = None,
+    batch_size: int = MAX_URLS_PER_BATCH,
+    max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+) -> SubmissionResult:
+    """Submit a list of URLs to the IndexNow API of a search engine. Long lists are automatically split into batches of up to 10,000 URLs, which is the maximum allowed by the IndexNow protocol per request.
 
     Args:
         authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
         urls (list[str]): List of URLs to submit. For example: `["https://example.com/page1", "https://example.com/page2", "https://example.com/page3"]`
         endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across calls. Uses a shared default client if set to `None`.
+        batch_size (int, optional): Maximum number of URLs per request. Should be between 1 and 10,000.
+        max_concurrent_batches (int, optional): Maximum number of batches that are submitted at the same time.
 
     Returns:
-        int: The status code of the response, e.g. `200` for success, `202` for accepted, `400` for bad request, etc.
+        SubmissionResult: The overall status code, e.g. `200` for success, `202` for accepted, `400` for bad request, etc., and the result of each batch.
 
     Example:
         After adding your authentication credentials to the [`IndexNowAuthentication`](../configuration/authentication.md) class, you can now submit multiple URLs to the IndexNow API:
@@ -101,27 +194,279 @@ def submit_urls_to_index_now(
         submit_urls_to_index_now(authentication, urls,
             endpoint="https://www.bing.com/indexnow")
         ```
+
+        Large lists are split into batches that are submitted concurrently. Use the returned result to check the outcome of each batch:
+
+        ```python linenums="11" hl_lines="1-4" title=""
+        result = submit_urls_to_index_now(authentication, urls,
+            batch_size=5000, max_concurrent_batches=2)
+        for batch in result.batches:
+            print(batch.url_count, batch.status_code)
+        ```
     """
 
-    payload: dict[str, str | list[str]] = {
-        "host": authentication.host,
-        "key": authentication.api_key,
-        "keyLocation": authentication.api_key_location,
-        "urlList": urls,
-    }
-    response = requests.post(
-        url=str(endpoint), json=payload, headers={"Content-Type": "application/json; charset=utf-8"}
-    )
+    validate_batch_arguments(batch_size, max_concurrent_batches)
+    client = client or get_default_client()
+    batches = split_urls_into_batches(urls, batch_size)
+    if len(batches) == 1:
+        batch_results = [submit_batch_to_index_now(authentication, batches[0], endpoint, client)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_concurrent_batches, len(batches))) as executor:
+            batch_results = list(
+                executor.map(
+                    submit_batch_to_index_now, repeat(authentication), batches, repeat(endpoint), repeat(client)
+                )
+            )
+    result = SubmissionResult.from_batches(str(endpoint), batch_results)
+    log_urls_submission(result)
+    return result
 
-    if response.status_code in SUCCESS_STATUS_CODES_COLLECTION:
-        print(
-            f"{Color.GREEN}{len(urls):,} URL(s) were submitted successfully to this IndexNow API endpoint:{Color.OFF} {endpoint}"
+
+def submit_url_stream_to_index_now(
+    authentication: IndexNowAuthentication,
+    urls: Iterable[str],
+    endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
+    client: IndexNowClient | None = None,
+    batch_size: int = MAX_URLS_PER_BATCH,
+    max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+) -> SubmissionResult:
+    """Submit a stream of URLs, e.g. from a generator, to the IndexNow API of a search engine. Each batch is submitted as soon as it is full, while the next batch is being collected, so the first URLs are submitted before the stream has ended. The memory usage is bounded by the batch size, as the stream is paused while `max_concurrent_batches` batches are being submitted.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        urls (Iterable[str]): URLs to submit, which are consumed lazily.
+        endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across calls. Uses a shared default client if set to `None`.
+        batch_size (int, optional): Maximum number of URLs per request. Should be between 1 and 10,000.
+        max_concurrent_batches (int, optional): Maximum number of batches that are submitted at the same time.
+
+    Returns:
+        SubmissionResult: The overall status code and the result of each batch in the order of the stream. If the stream is empty, nothing is submitted and the status code is `204` without any batches.
+
+    Example:
+        Submit the URLs of a large file line by line without reading the whole file into memory:
+
+        ```python linenums="1" hl_lines="10-11"
+        from index_now import submit_url_stream_to_index_now, IndexNowAuthentication
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
         )
-        print(
-            f"Status code: {Color.GREEN}{response.status_code} {SUCCESS_STATUS_CODES_COLLECTION_DICTIONARY[response.status_code]}{Color.OFF}"
+
+        with open("urls.txt") as file:
+            urls = (line.strip() for line in file if line.strip())
+            submit_url_stream_to_index_now(authentication, urls)
+        ```
+    """
+
+    validate_batch_arguments(batch_size, max_concurrent_batches)
+    client = client or get_default_client()
+    futures: list[Future[BatchResult]] = []
+    with ThreadPoolExecutor(max_workers=max_concurrent_batches) as executor:
+        for batch in iterate_batches(urls, batch_size):
+            # Pause the stream until a batch has been submitted, so no more batches than this are held in memory:
+            if len(pending := [future for future in futures if not future.done()]) >= max_concurrent_batches:
+                wait(pending, return_when=FIRST_COMPLETED)
+            futures.append(executor.submit(submit_batch_to_index_now, authentication, batch, endpoint, client))
+            logger.debug("Submitting batch %d with %d URL(s).", len(futures), len(batch))
+    if not futures:
+        return SubmissionResult(str(endpoint), HTTPStatus.NO_CONTENT)
+    result = SubmissionResult.from_batches(str(endpoint), [future.result() for future in futures])
+    log_urls_submission(result)
+    return result
+
+
+def submit_urls_to_multiple_endpoints(
+    authentication: IndexNowAuthentication,
+    urls: list[str],
+    endpoints: list[SearchEngineEndpoint | str],
+    client: IndexNowClient | None = None,
+    batch_size: int = MAX_URLS_PER_BATCH,
+    max_concurrent_requests: int = DEFAULT_MAX_IO_WORKERS,
+) -> dict[str, SubmissionResult]:
+    """Submit a list of URLs to the IndexNow API of several search engines at once. The payload of each batch is serialized only once, and all endpoints are notified concurrently, so the total time is that of the slowest endpoint rather than the sum of all of them.
+
+    Args:
+        authentication (IndexNowAuthentication): Authentication credentials for the IndexNow API.
+        urls (list[str]): List of URLs to submit. For example: `["https://example.com/page1", "https://example.com/page2", "https://example.com/page3"]`
+        endpoints (list[SearchEngineEndpoint | str]): The search engines to submit to, or custom URLs as endpoints.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across calls. Uses a shared default client if set to `None`.
+        batch_size (int, optional): Maximum number of URLs per request. Cannot exceed 10,000 URLs.
+        max_concurrent_requests (int, optional): Maximum number of requests in flight at the same time across all endpoints and batches.
+
+    Returns:
+        dict[str, SubmissionResult]: The result of the submission for each endpoint.
+
+    Example:
+        After adding your authentication credentials to the [`IndexNowAuthentication`](../configuration/authentication.md) class, you can now submit multiple URLs to several search engines at once:
+
+        ```python linenums="1" hl_lines="11-15"
+        from index_now import submit_urls_to_multiple_endpoints, IndexNowAuthentication, SearchEngineEndpoint
+
+        authentication = IndexNowAuthentication(
+            host="example.com",
+            api_key="a1b2c3d4",
+            api_key_location="https://example.com/a1b2c3d4.txt",
         )
-    else:
-        print(f"{Color.YELLOW}Failure. No URL(s) were submitted to this IndexNow API endpoint:{Color.OFF} {endpoint}")
-        print(f"Status code: {Color.RED}{response.status_code}{Color.OFF}")
-        print(f"Response: {response.text}")
-    return response.status_code
+
+        urls = ["https://example.com/page1", "https://example.com/page2", "https://example.com/page3"]
+
+        results = submit_urls_to_multiple_endpoints(authentication, urls,
+            endpoints=[SearchEngineEndpoint.BING, SearchEngineEndpoint.YANDEX, SearchEngineEndpoint.NAVER])
+
+        for endpoint, result in results.items():
+            print(endpoint, result.status_code)
+        ```
+    """
+
+    validate_batch_arguments(batch_size, max_concurrent_requests)
+    if not endpoints:
+        return {}
+
+    client = client or get_default_client()
+    batches = split_urls_into_batches(urls, batch_size)
+    payloads = [serialize_payload(authentication, batch) for batch in batches]
+    submissions = list(product(endpoints, range(len(batches))))
+    with ThreadPoolExecutor(max_workers=min(max_concurrent_requests, len(submissions))) as executor:
+        batch_results = list(
+            executor.map(
+                post_payload_to_index_now,
+                (payloads[batch_index] for _, batch_index in submissions),
+                (len(batches[batch_index]) for _, batch_index in submissions),
+                (endpoint for endpoint, _ in submissions),
+                repeat(client),
+            )
+        )
+
+    results: dict[str, SubmissionResult] = {}
+    for index, endpoint in enumerate(endpoints):
+        endpoint_batch_results = batch_results[index * len(batches) : (index + 1) * len(batches)]
+        results[str(endpoint)] = SubmissionResult.from_batches(str(endpoint), endpoint_batch_results)
+        log_urls_submission(results[str(endpoint)])
+    return results
+
+
+def submit_urls_to_multiple_hosts(
+    registry: AuthenticationRegistry,
+    urls: Iterable[str],
+    endpoint: SearchEngineEndpoint | str = SearchEngineEndpoint.INDEXNOW,
+    client: IndexNowClient | None = None,
+    batch_size: int = MAX_URLS_PER_BATCH,
+    max_concurrent_requests: int = DEFAULT_MAX_IO_WORKERS,
+) -> dict[str, SubmissionResult]:
+    """Submit URLs of several websites to the IndexNow API of a search engine at once. The URLs are partitioned by host in one pass, and the partitions are submitted concurrently, each with the credentials of its host from the registry. URLs of hosts that are not registered are skipped with a warning.
+
+    Args:
+        registry (AuthenticationRegistry): Authentication credentials of each host.
+        urls (Iterable[str]): URLs of any of the registered hosts in any order. For example: `["https://example.com/page1", "https://example.org/page1", "https://example.com/page2"]`
+        endpoint (SearchEngineEndpoint | str, optional): Select the search engine you want to submit to or use a custom URL as endpoint.
+        client (IndexNowClient | None, optional): Client with a connection pool to reuse across calls. Uses a shared default client if set to `None`.
+        batch_size (int, optional): Maximum number of URLs per request. Cannot exceed 10,000 URLs.
+        max_concurrent_requests (int, optional): Maximum number of requests in flight at the same time across all hosts and batches.
+
+    Returns:
+        dict[str, SubmissionResult]: The result of the submission for each host that has URLs, in the order the hosts are first seen.
+
+    Example:
+        Register the credentials of each website, and submit a mixed list of URLs with one call instead of one call per host:
+
+        ```python linenums="1" hl_lines="3-6 14"
+        from index_now import AuthenticationRegistry, IndexNowAuthentication, submit_urls_to_multiple_hosts
+
+        registry = AuthenticationRegistry([
+            IndexNowAuthentication("example.com", "a1b2c3d4", "https://example.com/a1b2c3d4.txt"),
+            IndexNowAuthentication("example.org", "e5f6g7h8", "https://example.org/e5f6g7h8.txt"),
+        ])
+
+        urls = [
+            "https://example.com/page1",
+            "https://example.org/page1",
+            "https://example.com/page2",
+        ]
+
+        results = submit_urls_to_multiple_hosts(registry, urls)
+
+        for host, result in results.items():
+            print(host, result.status_code)
+        ```
+    """
+
+    validate_batch_arguments(batch_size, max_concurrent_requests)
+    urls_by_host, unregistered_urls = registry.partition(urls)
+    if unregistered_urls:
+        logger.warning(
+            "Skipped %d URL(s) of hosts without authentication credentials, e.g. %s",
+            len(unregistered_urls),
+            unregistered_urls[0],
+        )
+    if not urls_by_host:
+        return {}
+
+    client = client or get_default_client()
+    submissions = [
+        (host, batch)
+        for host, host_urls in urls_by_host.items()
+        for batch in split_urls_into_batches(host_urls, batch_size)
+    ]
+    with ThreadPoolExecutor(max_workers=min(max_concurrent_requests, len(submissions))) as executor:
+        batch_results = list(
+            executor.map(
+                submit_batch_to_index_now,
+                (registry.authentications[host] for host, _ in submissions),
+                (batch for _, batch in submissions),
+                repeat(endpoint),
+                repeat(client),
+            )
+        )
+
+    batch_results_by_host: dict[str, list[BatchResult]] = {host: [] for host in urls_by_host}
+    for (host, _), batch_result in zip(submissions, batch_results):
+        batch_results_by_host[host].append(batch_result)
+    results: dict[str, SubmissionResult] = {}
+    for host, host_batch_results in batch_results_by_host.items():
+        results[host] = SubmissionResult.from_batches(str(endpoint), host_batch_results)
+        log_urls_submission(results[host])
+    return results
+
+
+def validate_batch_arguments(batch_size: int, max_concurrent_batches: int) -> None:
+    """Validate the batch size against the maximum number of URLs per request allowed by the IndexNow protocol."""
+
+    if not 1 <= batch_size <= MAX_URLS_PER_BATCH:
+        raise ValueError(f"Batch size must be between 1 and {MAX_URLS_PER_BATCH:,}.")
+    if max_concurrent_batches < 1:
+        raise ValueError("Max concurrent batches must be at least 1.")
+
+
+def log_urls_submission(result: SubmissionResult) -> None:
+    """Log the outcome of submitting a list of URLs in one or more batches."""
+
+    if result.is_success:
+        logger.info(
+            "%d URL(s) were submitted successfully to this IndexNow API endpoint: %s (status code: %d %s, batches: %d)",
+            result.url_count,
+            result.endpoint,
+            result.status_code,
+            SUCCESS_STATUS_CODES_COLLECTION_DICTIONARY[result.status_code],
+            len(result.batches),
+        )
+    elif logger.isEnabledFor(logging.WARNING):
+        failed_batch = next(batch for batch in result.batches if not batch.is_success)
+        if result.submitted_url_count:
+            logger.warning(
+                "Partial failure. Only %d of %d URL(s) were submitted to this IndexNow API endpoint: %s (status code: %d, response: %s)",
+                result.submitted_url_count,
+                result.url_count,
+                result.endpoint,
+                failed_batch.status_code,
+                failed_batch.response_text,
+            )
+        else:
+            logger.warning(
+                "Failure. No URL(s) were submitted to this IndexNow API endpoint: %s (status code: %d, response: %s)",
+                result.endpoint,
+                failed_batch.status_code,
+                failed_batch.response_text,
+            )
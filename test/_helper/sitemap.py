@@ -48,3 +48,13 @@ INVALID_SITEMAP_LOCATIONS = [INVALID_SITEMAP_LOCATION, INVALID_SITEMAP_LOCATION]
 NON_EXISTING_SITEMAP_LOCATION = "https://jakob-bagterp.github.io/index-now-for-python/non-existing-sitemap.xml"
 
 NON_EXISTING_SITEMAP_LOCATIONS = [NON_EXISTING_SITEMAP_LOCATION, NON_EXISTING_SITEMAP_LOCATION]
+
+
+def generate_sitemap_content(urls: list[str], nested_sitemap_locations: list[str] | None = None) -> bytes:
+    url_entries = "".join(f"<url><loc>{url}</loc></url>" for url in urls)
+    sitemap_entries = "".join(
+        f"<sitemap><loc>{location}</loc></sitemap>" for location in nested_sitemap_locations or []
+    )
+    return (
+        f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{url_entries}{sitemap_entries}</urlset>'.encode()
+    )
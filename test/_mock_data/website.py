@@ -46,3 +46,10 @@ INDEX_NOW_FOR_PYTHON_INVALID_API_KEY = IndexNowWebsiteData(
     authentication=GITHUB_PAGES_AUTHENTICATION_INVALID_API_KEY,
     sitemap_location="https://jakob-bagterp.github.io/index-now-for-python/sitemap.xml",
 )
+
+EXAMPLE_WEBSITE = IndexNowWebsiteData(
+    authentication=IndexNowAuthentication(
+        host="example.com", api_key="a1b2c3d4", api_key_location="https://example.com/a1b2c3d4.txt"
+    ),
+    sitemap_location="https://example.com/sitemap.xml",
+)
@@ -0,0 +1,187 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+from _helper.sitemap import generate_sitemap_content
+from _mock_data.website import EXAMPLE_WEBSITE
+
+from index_now import SitemapFilter, SubmissionResult
+from index_now.testing import IndexNowStandInServer
+
+pytest.importorskip("httpx")
+
+from index_now.aio import (  # noqa: E402
+    AsyncIndexNowClient,
+    async_controller_parse_sitemap_xml_and_get_urls,
+    async_get_multiple_sitemap_xml,
+    async_get_sitemap_xml,
+    async_submit_sitemap_to_index_now,
+    async_submit_sitemaps_to_index_now,
+    async_submit_url_stream_to_index_now,
+    async_submit_url_to_index_now,
+    async_submit_urls_to_index_now,
+)
+
+URLS = [f"https://example.com/page{i}" for i in range(25)]
+
+
+def test_async_submit_url_to_index_now(capfd: object) -> None:
+    async def submit(server: IndexNowStandInServer) -> list[SubmissionResult]:
+        async with AsyncIndexNowClient() as client:
+            return list(
+                await asyncio.gather(
+                    *(
+                        async_submit_url_to_index_now(EXAMPLE_WEBSITE.authentication, url, server.endpoint, client)
+                        for url in URLS
+                    )
+                )
+            )
+
+    with IndexNowStandInServer() as server:
+        results = asyncio.run(submit(server))
+    assert [result.status_code for result in results] == [200] * len(URLS)
+    assert len(server.requests) == len(URLS)
+    terminal_output, _ = capfd.readouterr()
+    assert f"1 URL was submitted successfully to this IndexNow API endpoint: {server.endpoint}" in terminal_output
+
+
+def test_async_submit_urls_to_index_now_in_batches() -> None:
+    with IndexNowStandInServer() as server:
+        result = asyncio.run(
+            async_submit_urls_to_index_now(EXAMPLE_WEBSITE.authentication, URLS, server.endpoint, batch_size=10)
+        )
+    assert result.is_success
+    assert [batch.url_count for batch in result.batches] == [10, 10, 5]
+    submitted_urls = sorted(url for request in server.requests for url in json.loads(request.body)["urlList"])
+    assert submitted_urls == sorted(URLS)
+
+
+def test_async_client_retries_transient_status_codes() -> None:
+    async def submit(server: IndexNowStandInServer) -> int:
+        async with AsyncIndexNowClient(max_retries=2, backoff_factor=0) as client:
+            result = await async_submit_url_to_index_now(
+                EXAMPLE_WEBSITE.authentication, URLS[0], server.endpoint, client
+            )
+            return result.status_code
+
+    with IndexNowStandInServer(failure_rate=1, failure_status_codes=[503]) as server:
+        assert asyncio.run(submit(server)) == 503
+    assert len(server.requests) == 3
+
+
+def test_async_get_sitemap_xml() -> None:
+    sitemap_content = generate_sitemap_content(URLS[:3])
+    with IndexNowStandInServer(files={"/sitemap.xml": sitemap_content}) as server:
+        assert asyncio.run(async_get_sitemap_xml(f"{server.url}/sitemap.xml")) == sitemap_content
+        assert asyncio.run(async_get_sitemap_xml(f"{server.url}/non-existing-sitemap.xml")) == ""
+        assert asyncio.run(async_get_sitemap_xml("")) == ""
+        multiple_contents = asyncio.run(
+            async_get_multiple_sitemap_xml([f"{server.url}/sitemap.xml", f"{server.url}/non-existing-sitemap.xml"])
+        )
+        assert multiple_contents == [sitemap_content, ""]
+
+
+def test_async_controller_parse_sitemap_xml_and_get_urls() -> None:
+    with IndexNowStandInServer() as server:
+        server.files = {
+            "/sitemap1.xml": generate_sitemap_content(URLS[1:10]),
+            "/sitemap2.xml": generate_sitemap_content(URLS[10:]),
+        }
+        index_sitemap_content = generate_sitemap_content(
+            URLS[:1], [f"{server.url}/sitemap1.xml", f"{server.url}/sitemap2.xml"]
+        )
+        urls = asyncio.run(async_controller_parse_sitemap_xml_and_get_urls(index_sitemap_content, as_elements=False))
+    assert urls == URLS
+
+
+@pytest.mark.parametrize("max_depth, expected_urls", [(3, URLS), (2, URLS[:10])])
+def test_async_controller_parse_sitemap_xml_and_get_urls_with_three_levels(
+    max_depth: int, expected_urls: list[str]
+) -> None:
+    with IndexNowStandInServer() as server:
+        server.files = {
+            "/sitemap1.xml": generate_sitemap_content(URLS[1:10], [f"{server.url}/sitemap2.xml"]),
+            "/sitemap2.xml": generate_sitemap_content(URLS[10:], [f"{server.url}/sitemap1.xml"]),
+        }
+        index_sitemap_content = generate_sitemap_content(URLS[:1], [f"{server.url}/sitemap1.xml"])
+        urls = asyncio.run(
+            async_controller_parse_sitemap_xml_and_get_urls(index_sitemap_content, False, max_depth=max_depth)
+        )
+    assert urls == expected_urls
+
+
+@pytest.mark.parametrize(
+    "sitemap_filter, expected_url_count", [(None, 25), (SitemapFilter(take=5), 5), (SitemapFilter(contains="page2"), 6)]
+)
+def test_async_submit_sitemap_to_index_now(sitemap_filter: SitemapFilter | None, expected_url_count: int) -> None:
+    with IndexNowStandInServer(files={"/sitemap.xml": generate_sitemap_content(URLS)}) as server:
+        result = asyncio.run(
+            async_submit_sitemap_to_index_now(
+                EXAMPLE_WEBSITE.authentication, f"{server.url}/sitemap.xml", sitemap_filter, server.endpoint
+            )
+        )
+    assert result.status_code == 200
+    assert len(json.loads(server.requests[-1].body)["urlList"]) == expected_url_count
+
+
+def test_async_submit_sitemaps_to_index_now() -> None:
+    with IndexNowStandInServer() as server:
+        server.files = {
+            "/sitemap1.xml": generate_sitemap_content(URLS[:10]),
+            "/sitemap2.xml": generate_sitemap_content(URLS[10:]),
+        }
+        sitemap_locations = [f"{server.url}/sitemap1.xml", f"{server.url}/sitemap2.xml"]
+        result = asyncio.run(
+            async_submit_sitemaps_to_index_now(
+                EXAMPLE_WEBSITE.authentication, sitemap_locations, endpoint=server.endpoint
+            )
+        )
+        assert result.status_code == 200
+        assert json.loads(server.requests[-1].body)["urlList"] == URLS
+
+        result = asyncio.run(
+            async_submit_sitemaps_to_index_now(
+                EXAMPLE_WEBSITE.authentication,
+                [f"{server.url}/non-existing-sitemap.xml", *sitemap_locations],
+                endpoint=server.endpoint,
+            )
+        )
+        assert result.status_code == 200
+        assert json.loads(server.requests[-1].body)["urlList"] == URLS
+        assert [outcome.status_code for outcome in result.sitemap_outcomes] == [404, 200, 200]
+        assert [outcome.url_count for outcome in result.sitemap_outcomes] == [0, 10, len(URLS) - 10]
+
+        result = asyncio.run(
+            async_submit_sitemaps_to_index_now(
+                EXAMPLE_WEBSITE.authentication, [f"{server.url}/non-existing-sitemap.xml"], endpoint=server.endpoint
+            )
+        )
+        assert result.status_code == 404
+        assert not result.batches
+
+
+def test_async_submit_url_stream_to_index_now() -> None:
+    async def generate_urls() -> AsyncIterator[str]:
+        for url in URLS:
+            yield url
+
+    async def submit(server: IndexNowStandInServer) -> SubmissionResult:
+        async with AsyncIndexNowClient() as client:
+            return await async_submit_url_stream_to_index_now(
+                EXAMPLE_WEBSITE.authentication, generate_urls(), server.endpoint, client, batch_size=10
+            )
+
+    with IndexNowStandInServer() as server:
+        result = asyncio.run(submit(server))
+    assert result.status_code == 200
+    assert [batch.url_count for batch in result.batches] == [10, 10, 5]
+    submitted_urls = [url for request in server.requests for url in json.loads(request.body)["urlList"]]
+    assert sorted(submitted_urls) == sorted(URLS)
+
+
+def test_async_submit_url_stream_to_index_now_with_empty_stream() -> None:
+    with IndexNowStandInServer() as server:
+        result = asyncio.run(async_submit_url_stream_to_index_now(EXAMPLE_WEBSITE.authentication, [], server.endpoint))
+    assert result.status_code == 204
+    assert server.requests == []
@@ -0,0 +1,51 @@
+import pytest
+
+from index_now import AuthenticationRegistry, IndexNowAuthentication
+from index_now.authentication import get_url_host
+
+EXAMPLE_COM = IndexNowAuthentication("example.com", "a1b2c3d4", "https://example.com/a1b2c3d4.txt")
+
+EXAMPLE_ORG = IndexNowAuthentication("Example.org", "e5f6g7h8", "https://example.org/e5f6g7h8.txt")
+
+
+@pytest.mark.parametrize(
+    "url, expected_host",
+    [
+        ("https://example.com/page1", "example.com"),
+        ("https://Example.COM:8443/page1?query=1", "example.com"),
+        ("https://user@www.example.com", "www.example.com"),
+        ("not a url", ""),
+    ],
+)
+def test_get_url_host(url: str, expected_host: str) -> None:
+    assert get_url_host(url) == expected_host
+
+
+def test_authentication_registry_register_and_get() -> None:
+    registry = AuthenticationRegistry([EXAMPLE_COM, EXAMPLE_ORG])
+    assert len(registry) == 2
+    assert "EXAMPLE.com" in registry
+    assert "www.example.com" not in registry
+    assert registry.get("example.org") is EXAMPLE_ORG
+    assert registry.get("example.net") is None
+    replacement = IndexNowAuthentication("example.com", "i9j0k1l2", "https://example.com/i9j0k1l2.txt")
+    registry.register(replacement)
+    assert len(registry) == 2
+    assert registry.get("example.com") is replacement
+
+
+def test_authentication_registry_partition() -> None:
+    urls = [
+        "https://example.org/page1",
+        "https://example.com/page1",
+        "https://example.net/page1",
+        "https://EXAMPLE.org/page2",
+        "https://example.com/page2",
+    ]
+    urls_by_host, unregistered_urls = AuthenticationRegistry([EXAMPLE_COM, EXAMPLE_ORG]).partition(iter(urls))
+    assert urls_by_host == {
+        "example.org": ["https://example.org/page1", "https://EXAMPLE.org/page2"],
+        "example.com": ["https://example.com/page1", "https://example.com/page2"],
+    }
+    assert list(urls_by_host) == ["example.org", "example.com"]
+    assert unregistered_urls == ["https://example.net/page1"]
@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+from _helper.sitemap import generate_sitemap_content
+from _mock_data.website import EXAMPLE_WEBSITE
+
+from index_now import IndexNowClient, submit_sitemap_to_index_now, submit_url_to_index_now, submit_urls_to_index_now
+from index_now.client import get_default_client, reset_default_client
+from index_now.sitemap.get import get_sitemap_xml
+from index_now.testing import IndexNowStandInServer
+
+
+def test_client_reuses_connection_across_submissions() -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        for i in range(5):
+            status_code = submit_url_to_index_now(
+                EXAMPLE_WEBSITE.authentication, f"https://example.com/page{i}", server.endpoint, client
+            ).status_code
+            assert status_code == 200
+        result = submit_urls_to_index_now(
+            EXAMPLE_WEBSITE.authentication, ["https://example.com/page1"], server.endpoint, client
+        )
+        assert result.status_code == 200
+    assert len(server.requests) == 6
+    assert len({request.client_address for request in server.requests}) == 1
+
+
+def test_client_is_shared_for_sitemap_download_and_submission() -> None:
+    sitemap_content = generate_sitemap_content(["https://example.com/page1", "https://example.com/page2"])
+    with IndexNowStandInServer(files={"/sitemap.xml": sitemap_content}) as server, IndexNowClient() as client:
+        assert get_sitemap_xml(f"{server.url}/sitemap.xml", client) == sitemap_content
+        status_code = submit_sitemap_to_index_now(
+            EXAMPLE_WEBSITE.authentication, f"{server.url}/sitemap.xml", endpoint=server.endpoint, client=client
+        ).status_code
+        assert status_code == 200
+    assert [request.method for request in server.requests] == ["GET", "GET", "POST"]
+    assert len({request.client_address for request in server.requests}) == 1
+
+
+def test_client_retries_transient_status_codes() -> None:
+    with (
+        IndexNowStandInServer(failure_rate=1, failure_status_codes=[503]) as server,
+        IndexNowClient(max_retries=2, backoff_factor=0) as client,
+    ):
+        status_code = submit_url_to_index_now(
+            EXAMPLE_WEBSITE.authentication, "https://example.com/page1", server.endpoint, client
+        ).status_code
+    assert status_code == 503
+    assert len(server.requests) == 3
+
+
+@pytest.mark.parametrize("pool_connections, pool_maxsize, max_retries", [(0, 10, 0), (10, 0, 0), (10, 10, -1)])
+def test_client_validation_of_arguments(pool_connections: int, pool_maxsize: int, max_retries: int) -> None:
+    with pytest.raises(ValueError):
+        IndexNowClient(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries)
+
+
+def test_client_can_be_pickled_for_worker_processes() -> None:
+    client = IndexNowClient(timeout=5)
+    unpickled_client = pickle.loads(pickle.dumps(client))
+    assert unpickled_client.timeout == 5
+
+
+def test_default_client_is_shared_and_can_be_reset() -> None:
+    client = get_default_client()
+    assert get_default_client() is client
+    reset_default_client()
+    assert get_default_client() is not client
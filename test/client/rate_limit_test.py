@@ -0,0 +1,121 @@
+import pickle
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from http import HTTPStatus
+
+import pytest
+from _mock_data.website import EXAMPLE_WEBSITE
+
+from index_now import IndexNowClient, RateLimiter, submit_urls_to_index_now
+from index_now.rate_limit import TokenBucket, compute_retry_delay, parse_retry_after
+from index_now.testing import IndexNowStandInServer
+
+URLS = ["https://example.com/page1", "https://example.com/page2"]
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    in_one_minute = format_datetime(datetime.now(UTC) + timedelta(minutes=1), usegmt=True)
+    retry_after_seconds = parse_retry_after(in_one_minute)
+    assert retry_after_seconds is not None and 55 < retry_after_seconds <= 60
+    assert parse_retry_after("Wed, 01 Jan 2020 00:00:00 GMT") == 0
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 2, 3])
+def test_compute_retry_delay_with_exponential_backoff_and_jitter(attempt: int) -> None:
+    delays = {compute_retry_delay(attempt, 1, None) for _ in range(20)}
+    assert len(delays) > 1
+    assert all(delay is not None and 2**attempt / 2 <= delay <= 2**attempt for delay in delays)
+
+
+def test_compute_retry_delay_honours_retry_after() -> None:
+    assert compute_retry_delay(0, 1, "7") == 7
+    assert compute_retry_delay(0, 1, "7", max_retry_after=5) is None
+
+
+def test_client_retries_after_too_many_requests() -> None:
+    with (
+        IndexNowStandInServer(status_codes=[HTTPStatus.TOO_MANY_REQUESTS], retry_after=1) as server,
+        IndexNowClient(max_retries=2, backoff_factor=0) as client,
+    ):
+        start = time.perf_counter()
+        result = submit_urls_to_index_now(EXAMPLE_WEBSITE.authentication, URLS, server.endpoint, client)
+        elapsed_time = time.perf_counter() - start
+    assert result.status_code == HTTPStatus.OK
+    assert len(server.requests) == 2
+    assert elapsed_time >= 1
+
+
+def test_client_does_not_retry_when_asked_to_wait_too_long() -> None:
+    with (
+        IndexNowStandInServer(
+            failure_rate=1, failure_status_codes=[HTTPStatus.TOO_MANY_REQUESTS], retry_after=3600
+        ) as server,
+        IndexNowClient(max_retries=2) as client,
+    ):
+        result = submit_urls_to_index_now(EXAMPLE_WEBSITE.authentication, URLS, server.endpoint, client)
+    assert result.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert len(server.requests) == 1
+
+
+def test_rate_limiter_limits_requests_per_host() -> None:
+    rate_limiter = RateLimiter(requests_per_second=20)
+    with IndexNowStandInServer() as server, IndexNowClient(rate_limiter=rate_limiter) as client:
+        start = time.perf_counter()
+        for _ in range(11):
+            client.post(server.endpoint)
+        elapsed_time = time.perf_counter() - start
+    assert elapsed_time >= 0.45
+    assert rate_limiter.get_bucket(server.endpoint) is rate_limiter.get_bucket(f"{server.url}/other")
+
+
+def test_token_bucket_adapts_rate_to_throttling() -> None:
+    bucket = TokenBucket(rate=16, capacity=1)
+    bucket.slow_down(0)
+    bucket.slow_down(0)
+    assert bucket.rate == 4
+    for _ in range(100):
+        bucket.speed_up()
+    assert bucket.rate == 16
+    bucket.slow_down(0.2)
+    assert bucket.reserve() > 0.1
+
+
+def test_client_only_recovers_rate_after_successful_requests() -> None:
+    rate_limiter = RateLimiter(requests_per_second=100)
+    with (
+        IndexNowStandInServer(status_codes=[HTTPStatus.FORBIDDEN] * 5) as server,
+        IndexNowClient(rate_limiter=rate_limiter) as client,
+    ):
+        bucket = rate_limiter.get_bucket(server.endpoint)
+        bucket.slow_down(0)
+        throttled_rate = bucket.rate
+        for _ in range(5):
+            submit_urls_to_index_now(EXAMPLE_WEBSITE.authentication, URLS, server.endpoint, client)
+        assert bucket.rate == throttled_rate
+        submit_urls_to_index_now(EXAMPLE_WEBSITE.authentication, URLS, server.endpoint, client)
+        assert bucket.rate > throttled_rate
+
+
+def test_token_bucket_without_rate_only_pauses_when_throttled() -> None:
+    bucket = TokenBucket(rate=None, capacity=1)
+    assert [bucket.reserve() for _ in range(100)] == [0] * 100
+    bucket.slow_down(1)
+    assert 0.9 < bucket.reserve() <= 1
+
+
+def test_client_with_rate_limiter_can_be_pickled() -> None:
+    client = IndexNowClient(rate_limiter=RateLimiter(requests_per_second=5, burst=2))
+    client.rate_limiter.get_bucket("https://example.com")
+    unpickled_client = pickle.loads(pickle.dumps(client))
+    assert unpickled_client.rate_limiter.requests_per_second == 5
+    assert unpickled_client.rate_limiter.burst == 2
+
+
+@pytest.mark.parametrize("requests_per_second, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_rate_limiter_validation_of_arguments(requests_per_second: float, burst: int) -> None:
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_second=requests_per_second, burst=burst)
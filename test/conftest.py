@@ -0,0 +1,14 @@
+from collections.abc import Iterator
+
+import pytest
+
+from index_now import configure_logging
+
+
+@pytest.fixture(autouse=True)
+def print_messages() -> Iterator[None]:
+    """Print the messages of the package to the terminal, as a script that opts in with `configure_logging()` would."""
+
+    configure_logging()
+    yield
+    configure_logging(print_to_stdout=False)
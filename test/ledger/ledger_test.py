@@ -0,0 +1,94 @@
+import json
+import time
+from http import HTTPStatus
+from pathlib import Path
+
+from index_now import (
+    BatchResult,
+    IndexNowAuthentication,
+    IndexNowClient,
+    SubmissionLedger,
+    SubmissionResult,
+    submit_sitemap_to_index_now,
+)
+from index_now.sitemap.parse import SitemapUrl
+from index_now.testing import IndexNowStandInServer
+
+AUTHENTICATION = IndexNowAuthentication(
+    host="example.com", api_key="a1b2c3d4", api_key_location="https://example.com/a1b2c3d4.txt"
+)
+
+ENDPOINT = "https://api.indexnow.org/indexnow"
+
+
+def generate_sitemap_content_with_lastmod(urls: dict[str, str]) -> bytes:
+    url_entries = "".join(f"<url><loc>{url}</loc><lastmod>{lastmod}</lastmod></url>" for url, lastmod in urls.items())
+    return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{url_entries}</urlset>'.encode()
+
+
+def test_get_new_or_modified_urls() -> None:
+    with SubmissionLedger(":memory:") as ledger:
+        urls = [SitemapUrl(loc=f"https://example.com/page{number}", lastmod="2025-01-01") for number in range(5)]
+        assert ledger.get_new_or_modified_urls(ENDPOINT, urls) == urls
+        ledger.record(ENDPOINT, urls[:3])
+        assert len(ledger) == 3
+        modified_url = SitemapUrl(loc=urls[1].loc, lastmod="2025-02-01")
+        assert ledger.get_new_or_modified_urls(ENDPOINT, [urls[0], modified_url, *urls[2:]]) == [
+            modified_url,
+            *urls[3:],
+        ]
+        assert ledger.get_new_or_modified_urls("https://www.bing.com/indexnow", urls) == urls
+
+
+def test_record_submission_only_records_successful_batches() -> None:
+    urls = [SitemapUrl(loc=f"https://example.com/page{number}") for number in range(5)]
+    result = SubmissionResult.from_batches(
+        ENDPOINT, [BatchResult(2, HTTPStatus.OK), BatchResult(2, HTTPStatus.TOO_MANY_REQUESTS), BatchResult(1, 202)]
+    )
+    with SubmissionLedger(":memory:") as ledger:
+        ledger.record_submission(urls, result)
+        assert ledger.get_new_or_modified_urls(ENDPOINT, urls) == urls[2:4]
+
+
+def test_get_new_or_modified_urls_scales_to_many_rows() -> None:
+    urls = [SitemapUrl(loc=f"https://example.com/page{number}", lastmod="2025-01-01") for number in range(200_000)]
+    with SubmissionLedger(":memory:") as ledger:
+        ledger.record(ENDPOINT, urls)
+        start = time.perf_counter()
+        assert ledger.get_new_or_modified_urls(ENDPOINT, [*urls, SitemapUrl(loc="https://example.com/new")]) == [
+            SitemapUrl(loc="https://example.com/new")
+        ]
+        assert time.perf_counter() - start < 10
+
+
+def test_submit_sitemap_incrementally(tmp_path: Path) -> None:
+    urls = {f"https://example.com/page{number}": "2025-01-01" for number in range(10)}
+    with (
+        IndexNowStandInServer(files={"/sitemap.xml": generate_sitemap_content_with_lastmod(urls)}) as server,
+        IndexNowClient() as client,
+        SubmissionLedger(tmp_path / "ledger.sqlite3") as ledger,
+    ):
+
+        def submit() -> int:
+            return submit_sitemap_to_index_now(
+                AUTHENTICATION,
+                f"{server.url}/sitemap.xml",
+                endpoint=server.endpoint,
+                client=client,
+                incremental=True,
+                ledger=ledger,
+            ).status_code
+
+        def get_submitted_urls() -> list[list[str]]:
+            return [json.loads(request.body)["urlList"] for request in server.requests if request.method == "POST"]
+
+        assert submit() == HTTPStatus.OK
+        assert get_submitted_urls() == [list(urls)]
+        assert submit() == HTTPStatus.NO_CONTENT
+        assert len(get_submitted_urls()) == 1
+
+        urls["https://example.com/page3"] = "2025-02-01"
+        urls["https://example.com/page10"] = "2025-02-01"
+        server.files["/sitemap.xml"] = generate_sitemap_content_with_lastmod(urls)
+        assert submit() == HTTPStatus.OK
+        assert get_submitted_urls()[-1] == ["https://example.com/page3", "https://example.com/page10"]
@@ -0,0 +1,64 @@
+import logging
+from collections.abc import Iterator
+
+import pytest
+from _mock_data.website import EXAMPLE_WEBSITE
+
+from index_now import IndexNowClient, configure_logging, submit_urls_to_index_now
+from index_now.testing import IndexNowStandInServer
+
+
+@pytest.fixture(autouse=True)
+def reset_logging() -> Iterator[None]:
+    configure_logging(print_to_stdout=False)  # Start from the state after import.
+    yield
+
+
+def submit(server: IndexNowStandInServer) -> None:
+    with IndexNowClient(max_retries=0) as client:
+        submit_urls_to_index_now(EXAMPLE_WEBSITE.authentication, ["https://example.com/page1"], server.endpoint, client)
+
+
+def test_nothing_is_printed_by_default(capfd: pytest.CaptureFixture[str], caplog: pytest.LogCaptureFixture) -> None:
+    with IndexNowStandInServer(failure_rate=1, failure_status_codes=[403]) as server:
+        submit(server)
+    assert capfd.readouterr() == ("", "")
+    assert [record.levelno for record in caplog.records] == [logging.WARNING]
+    package_logger = logging.getLogger("index_now")
+    assert package_logger.propagate
+    assert [type(handler) for handler in package_logger.handlers] == [logging.NullHandler]
+
+
+def test_messages_are_printed_to_stdout_once_configured(capfd: pytest.CaptureFixture[str]) -> None:
+    configure_logging()
+    with IndexNowStandInServer() as server:
+        submit(server)
+    terminal_output, _ = capfd.readouterr()
+    assert f"1 URL(s) were submitted successfully to this IndexNow API endpoint: {server.endpoint}" in terminal_output
+    assert logging.getLogger("index_now").propagate
+
+
+def test_quiet_mode(capfd: pytest.CaptureFixture[str], caplog: pytest.LogCaptureFixture) -> None:
+    configure_logging(quiet=True)
+    with IndexNowStandInServer(failure_rate=1, failure_status_codes=[403]) as server:
+        submit(server)
+    assert capfd.readouterr() == ("", "")
+    assert not caplog.records
+    assert not logging.getLogger("index_now").isEnabledFor(logging.CRITICAL)
+
+
+def test_messages_are_passed_on_to_logging_configuration(
+    capfd: pytest.CaptureFixture[str], caplog: pytest.LogCaptureFixture
+) -> None:
+    configure_logging(print_to_stdout=False)
+    with caplog.at_level(logging.INFO), IndexNowStandInServer(failure_rate=1, failure_status_codes=[403]) as server:
+        submit(server)
+    assert capfd.readouterr().out == ""
+    assert {(record.name, record.levelno) for record in caplog.records} == {("index_now", logging.WARNING)}
+    assert (
+        caplog.records[0]
+        .getMessage()
+        .startswith(
+            f"Failure. No URL(s) were submitted to this IndexNow API endpoint: {server.endpoint} (status code: 403"
+        )
+    )
@@ -0,0 +1,153 @@
+import json
+import time
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from _mock_data.website import EXAMPLE_WEBSITE
+
+from index_now import IndexNowClient, SubmissionQueue, SubmissionWorker
+from index_now.queue import is_permanent_failure
+from index_now.testing import IndexNowStandInServer
+
+URLS = [f"https://example.com/page{number}" for number in range(25)]
+
+
+def get_submitted_urls(server: IndexNowStandInServer) -> list[list[str]]:
+    return [json.loads(request.body)["urlList"] for request in server.requests if request.method == "POST"]
+
+
+def test_submission_queue_coalesces_duplicates() -> None:
+    with SubmissionQueue(":memory:") as queue:
+        queue.enqueue(URLS[:3])
+        queue.enqueue(URLS[1:4])
+        queue.enqueue(URLS[:2], endpoint="https://www.bing.com/indexnow")
+        assert len(queue) == 6
+        batch = queue.peek_batch()
+        assert batch is not None
+        endpoint, urls = batch
+        assert endpoint == "https://api.indexnow.org/indexnow"
+        assert [url for url, _ in urls] == URLS[:4]
+
+
+def test_submission_queue_keeps_urls_enqueued_again_during_submission() -> None:
+    with SubmissionQueue(":memory:") as queue:
+        queue.enqueue(URLS[:2])
+        batch = queue.peek_batch()
+        assert batch is not None
+        queue.enqueue(URLS[1:2])
+        queue.acknowledge(*batch)
+        assert len(queue) == 1
+
+
+def test_submission_queue_survives_restart(tmp_path: Path) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient(max_retries=0) as client:
+        with SubmissionQueue(tmp_path / "queue.sqlite3") as queue:
+            queue.enqueue(URLS, endpoint=server.endpoint)
+        with SubmissionQueue(tmp_path / "queue.sqlite3") as queue:
+            assert len(queue) == len(URLS)
+            SubmissionWorker(EXAMPLE_WEBSITE.authentication, queue, client, batch_size=10).drain()
+            assert len(queue) == 0
+    assert get_submitted_urls(server) == [URLS[:10], URLS[10:20], URLS[20:]]
+
+
+def test_submission_worker_drains_queue_in_background(tmp_path: Path) -> None:
+    with (
+        SubmissionQueue(tmp_path / "queue.sqlite3") as queue,
+        IndexNowStandInServer() as server,
+        IndexNowClient(max_retries=0) as client,
+    ):
+        with SubmissionWorker(EXAMPLE_WEBSITE.authentication, queue, client, batch_size=10, poll_interval=0.01):
+            queue.enqueue(URLS, endpoint=server.endpoint)
+            deadline = time.monotonic() + 10
+            while len(queue) and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert len(queue) == 0
+    assert sorted(url for urls in get_submitted_urls(server) for url in urls) == sorted(URLS)
+    assert all(len(urls) <= 10 for urls in get_submitted_urls(server))
+
+
+def test_submission_worker_keeps_temporarily_failed_batches(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    with (
+        SubmissionQueue(tmp_path / "queue.sqlite3") as queue,
+        IndexNowStandInServer(status_codes=[HTTPStatus.SERVICE_UNAVAILABLE]) as server,
+        IndexNowClient(max_retries=0) as client,
+    ):
+        queue.enqueue(URLS[:5], endpoint=server.endpoint)
+        worker = SubmissionWorker(EXAMPLE_WEBSITE.authentication, queue, client)
+        worker.drain()
+        assert len(queue) == 5
+        assert (
+            "Stopped draining the queue, as a batch failed with status code 503. It stays in the queue."
+            in caplog.messages
+        )
+        worker.drain()
+        assert len(queue) == 0
+        assert queue.get_dead_letters() == []
+    assert get_submitted_urls(server) == [URLS[:5], URLS[:5]]
+
+
+def test_submission_worker_logs_errors_and_keeps_running(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail_to_submit_next_batch(self: SubmissionWorker) -> None:
+        raise OSError("Network is unreachable")
+
+    monkeypatch.setattr(SubmissionWorker, "submit_next_batch", fail_to_submit_next_batch)
+    with SubmissionQueue(tmp_path / "queue.sqlite3") as queue:
+        worker = SubmissionWorker(EXAMPLE_WEBSITE.authentication, queue, retry_interval=0.01)
+        worker.start()
+        deadline = time.monotonic() + 5
+        while caplog.text.count("Failed to submit the next batch") < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        worker.stop(drain=False)
+    assert caplog.text.count("Failed to submit the next batch") >= 2
+    assert "OSError: Network is unreachable" in caplog.text
+
+
+def test_submission_worker_moves_rejected_batches_to_dead_letter(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    with (
+        SubmissionQueue(tmp_path / "queue.sqlite3") as queue,
+        IndexNowStandInServer(status_codes=[HTTPStatus.FORBIDDEN]) as server,
+        IndexNowClient(max_retries=0) as client,
+    ):
+        rejected_endpoint, other_endpoint = server.endpoint, f"{server.endpoint}?engine=other"
+        queue.enqueue(URLS[:5], endpoint=rejected_endpoint)
+        queue.enqueue(URLS[5:10], endpoint=other_endpoint)
+        SubmissionWorker(EXAMPLE_WEBSITE.authentication, queue, client).drain()
+        assert len(queue) == 0
+        assert queue.get_dead_letters() == [(rejected_endpoint, url, HTTPStatus.FORBIDDEN) for url in URLS[:5]]
+        queue.clear_dead_letters()
+        assert queue.get_dead_letters() == []
+    assert get_submitted_urls(server) == [URLS[:5], URLS[5:10]]
+    assert "Moved 5 URL(s) to the dead-letter table" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "status_code, expected",
+    [
+        (HTTPStatus.BAD_REQUEST, True),
+        (HTTPStatus.FORBIDDEN, True),
+        (HTTPStatus.UNPROCESSABLE_ENTITY, True),
+        (HTTPStatus.TOO_MANY_REQUESTS, False),
+        (HTTPStatus.SERVICE_UNAVAILABLE, False),
+        (HTTPStatus.OK, False),
+    ],
+)
+def test_is_permanent_failure(status_code: int, expected: bool) -> None:
+    assert is_permanent_failure(status_code) is expected
+
+
+def test_submission_queue_versions_are_monotonic_across_restarts(tmp_path: Path) -> None:
+    with SubmissionQueue(tmp_path / "queue.sqlite3") as queue:
+        queue.enqueue(URLS[:1])
+        batch = queue.peek_batch()
+    with SubmissionQueue(tmp_path / "queue.sqlite3") as queue:
+        queue.enqueue(URLS[:1])
+        queue.enqueue(URLS[1:2])
+        new_batch = queue.peek_batch()
+    assert batch is not None and new_batch is not None
+    (_, old_version), *_ = batch[1]
+    assert [version for _, version in new_batch[1]] == [old_version + 1, old_version + 2]
@@ -0,0 +1,22 @@
+import pytest
+
+from index_now import BatchResult, SubmissionResult
+
+
+@pytest.mark.parametrize(
+    "batches, expected_status_code, expected_submitted_url_count",
+    [
+        ([BatchResult(10, 200)], 200, 10),
+        ([BatchResult(10, 202), BatchResult(5, 200)], 202, 15),
+        ([BatchResult(10, 200), BatchResult(10, 429, "Too many requests"), BatchResult(5, 500)], 429, 10),
+        ([BatchResult(10, 403), BatchResult(5, 403)], 403, 0),
+    ],
+)
+def test_submission_result_from_batches(
+    batches: list[BatchResult], expected_status_code: int, expected_submitted_url_count: int
+) -> None:
+    result = SubmissionResult.from_batches("https://example.com/indexnow", batches)
+    assert result.status_code == expected_status_code
+    assert result.is_success is (expected_status_code in [200, 202])
+    assert result.url_count == sum(batch.url_count for batch in batches)
+    assert result.submitted_url_count == expected_submitted_url_count
@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from _helper.sitemap import generate_sitemap_content
+
+from index_now import IndexNowAuthentication, IndexNowClient, SitemapCache, submit_sitemap_to_index_now
+from index_now.sitemap.parse import ParsedSitemap, SitemapUrl, fetch_and_parse_sitemap_xml
+from index_now.testing import IndexNowStandInServer
+
+AUTHENTICATION = IndexNowAuthentication(
+    host="example.com", api_key="a1b2c3d4", api_key_location="https://example.com/a1b2c3d4.txt"
+)
+
+URLS = [f"https://example.com/page{number}" for number in range(20)]
+
+
+def count_sitemap_responses(server: IndexNowStandInServer) -> int:
+    return len([request for request in server.requests if request.method == "GET"])
+
+
+def test_fetch_and_parse_sitemap_xml_reuses_cache_when_not_modified(tmp_path: Path) -> None:
+    cache = SitemapCache(tmp_path)
+    with (
+        IndexNowStandInServer(files={"/sitemap.xml": generate_sitemap_content(URLS)}) as server,
+        IndexNowClient() as client,
+    ):
+        location = f"{server.url}/sitemap.xml"
+        response, parsed_sitemap = fetch_and_parse_sitemap_xml(location, client, cache)
+        assert response.status_code == HTTPStatus.OK
+        assert cache.get(location) is not None
+        response, cached_parsed_sitemap = fetch_and_parse_sitemap_xml(location, client, cache)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert cached_parsed_sitemap == parsed_sitemap
+
+        server.files["/sitemap.xml"] = generate_sitemap_content(URLS[:5])
+        response, changed_parsed_sitemap = fetch_and_parse_sitemap_xml(location, client, cache)
+        assert response.status_code == HTTPStatus.OK
+        assert changed_parsed_sitemap is not None
+        assert [url.loc for url in changed_parsed_sitemap.urls] == URLS[:5]
+
+
+def test_submit_sitemap_with_cache_of_nested_sitemaps(tmp_path: Path) -> None:
+    cache = SitemapCache(tmp_path)
+    files = {"/nested1.xml": generate_sitemap_content(URLS[1:10]), "/nested2.xml": generate_sitemap_content(URLS[10:])}
+    with IndexNowStandInServer(files=files) as server, IndexNowClient() as client:
+        server.files["/sitemap.xml"] = generate_sitemap_content(URLS[:1], [f"{server.url}{path}" for path in files])
+        location = f"{server.url}/sitemap.xml"
+        for _ in range(2):
+            status_code = submit_sitemap_to_index_now(
+                AUTHENTICATION, location, endpoint=server.endpoint, client=client, cache=cache
+            ).status_code
+            assert status_code == HTTPStatus.OK
+    assert count_sitemap_responses(server) == 6
+    assert len(list(tmp_path.glob("*.json"))) == 3
+
+
+def test_sitemap_cache_is_not_used_without_validators(tmp_path: Path) -> None:
+    cache = SitemapCache(tmp_path)
+    cache.put("https://example.com/sitemap.xml", None, None, ParsedSitemap(urls=[SitemapUrl(loc=URLS[0])]))
+    assert cache.get("https://example.com/sitemap.xml") is None
+
+
+def test_sitemap_cache_round_trip_and_clear(tmp_path: Path) -> None:
+    cache = SitemapCache(tmp_path)
+    parsed_sitemap = ParsedSitemap(
+        urls=[SitemapUrl(loc=URLS[0], lastmod="2025-01-01", changefreq="daily", priority=0.5)],
+        nested_sitemap_links=["https://example.com/nested.xml"],
+    )
+    cache.put("https://example.com/sitemap.xml", '"abc"', "Wed, 01 Jan 2025 00:00:00 GMT", parsed_sitemap)
+    cached_sitemap = cache.get("https://example.com/sitemap.xml")
+    assert cached_sitemap is not None
+    assert cached_sitemap.parsed_sitemap == parsed_sitemap
+    assert cached_sitemap.conditional_headers == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    cache.clear()
+    assert cache.get("https://example.com/sitemap.xml") is None
+
+
+def test_sitemap_cache_put_from_concurrent_threads(tmp_path: Path) -> None:
+    cache = SitemapCache(tmp_path)
+    parsed_sitemaps = [ParsedSitemap(urls=[SitemapUrl(loc=url) for url in URLS[:number]]) for number in range(1, 17)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for parsed_sitemap in parsed_sitemaps:
+            executor.submit(cache.put, "https://example.com/sitemap.xml", '"abc"', None, parsed_sitemap)
+    cached_sitemap = cache.get("https://example.com/sitemap.xml")
+    assert cached_sitemap is not None
+    assert cached_sitemap.parsed_sitemap in parsed_sitemaps
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_sitemap_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    parsed_sitemap = ParsedSitemap(urls=[SitemapUrl(loc=url) for url in URLS])
+    cache = SitemapCache(tmp_path, max_size=2**30)
+    cache.put("https://example.com/sitemap1.xml", '"1"', None, parsed_sitemap)
+    entry_size = cache.get_path("https://example.com/sitemap1.xml").stat().st_size
+    cache = SitemapCache(tmp_path, max_size=entry_size * 2)
+    cache.put("https://example.com/sitemap2.xml", '"2"', None, parsed_sitemap)
+    cache.get("https://example.com/sitemap1.xml")  # Now the most recently used.
+    cache.put("https://example.com/sitemap3.xml", '"3"', None, parsed_sitemap)
+    assert cache.get("https://example.com/sitemap2.xml") is None
+    assert cache.get("https://example.com/sitemap1.xml") is not None
+    assert cache.get("https://example.com/sitemap3.xml") is not None
+
+
+def test_sitemap_cache_validation_of_max_size() -> None:
+    with pytest.raises(ValueError):
+        SitemapCache(max_size=-1)
@@ -0,0 +1,180 @@
+import time
+from collections import Counter
+
+import pytest
+from _helper.sitemap import generate_sitemap_content
+
+from index_now import ExecutorStrategy, IndexNowClient, ParseExecutor, SitemapCrawler
+from index_now.constant import SITEMAP_PART_SIZE
+from index_now.sitemap.parse import controller_get_urls_from_parsed_sitemap, parse_sitemap_xml
+from index_now.testing import IndexNowStandInServer
+
+URLS = [f"https://example.com/section{i % 3}/page{i}" for i in range(40)]
+
+
+def serve_three_level_sitemaps(server: IndexNowStandInServer) -> str:
+    """Serve an index sitemap that links to two locale index sitemaps, which link to section sitemaps and back to other index sitemaps."""
+
+    index_location = f"{server.url}/sitemap_index.xml"
+    server.files["/sitemap_index.xml"] = generate_sitemap_content(
+        URLS[:2], [f"{server.url}/en/index.xml", f"{server.url}/da/index.xml"]
+    )
+    server.files["/en/index.xml"] = generate_sitemap_content(
+        URLS[2:5], [f"{server.url}/en/section1.xml", f"{server.url}/en/section2.xml", index_location]
+    )
+    server.files["/da/index.xml"] = generate_sitemap_content(
+        [], [f"{server.url}/da/section1.xml", f"{server.url}/en/index.xml"]
+    )
+    server.files["/en/section1.xml"] = generate_sitemap_content(URLS[5:15])
+    server.files["/en/section2.xml"] = generate_sitemap_content(URLS[15:30])
+    server.files["/da/section1.xml"] = generate_sitemap_content(URLS[30:])
+    return index_location
+
+
+def count_downloads(server: IndexNowStandInServer) -> Counter[str]:
+    return Counter(request.path for request in server.requests if request.method == "GET")
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_sitemap_crawler_expands_three_levels_and_downloads_each_sitemap_once(max_workers: int) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        index_location = serve_three_level_sitemaps(server)
+        urls = [url.loc for url in SitemapCrawler(client, max_workers=max_workers).crawl(index_location)]
+    assert sorted(urls) == sorted(URLS)
+    assert set(count_downloads(server).values()) == {1}
+    assert len(count_downloads(server)) == 6
+
+
+def test_sitemap_crawler_streams_urls_of_each_sitemap() -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        index_location = serve_three_level_sitemaps(server)
+        crawled_sitemaps = list(SitemapCrawler(client).crawl_sitemaps(index_location))
+    assert crawled_sitemaps[0].depth == 1
+    assert [url.loc for url in crawled_sitemaps[0].urls] == URLS[:2]
+    assert sorted(crawled_sitemap.depth for crawled_sitemap in crawled_sitemaps) == [1, 2, 2, 3, 3, 3]
+    crawled_sitemaps.sort(key=lambda crawled_sitemap: crawled_sitemap.position)
+    assert [url.loc for crawled_sitemap in crawled_sitemaps for url in crawled_sitemap.urls] == URLS
+
+
+def test_sitemap_crawler_only_downloads_next_sitemaps_once_consumed() -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        nested_sitemap_links = [f"{server.url}/section{number}.xml" for number in range(10)]
+        server.files["/sitemap_index.xml"] = generate_sitemap_content([], nested_sitemap_links)
+        for number in range(10):
+            server.files[f"/section{number}.xml"] = generate_sitemap_content(URLS[number * 4 : number * 4 + 4])
+        crawled_sitemaps = SitemapCrawler(client, max_workers=2).crawl_sitemaps(f"{server.url}/sitemap_index.xml")
+        download_counts = []
+        for _ in crawled_sitemaps:
+            time.sleep(0.05)  # Give the workers time to download more sitemaps than they should.
+            download_counts.append(server.statistics.request_count)
+    assert download_counts == [1, 3, 4, 5, 6, 7, 8, 9, 10, 11, 11]
+
+
+def test_sitemap_crawler_yields_large_sitemaps_in_parts() -> None:
+    urls = [f"https://example.com/page{number}" for number in range(2 * SITEMAP_PART_SIZE + 1)]
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        server.files["/sitemap_index.xml"] = generate_sitemap_content(URLS[:2], [f"{server.url}/sitemap1.xml"])
+        server.files["/sitemap1.xml"] = generate_sitemap_content(urls)
+        crawled_sitemaps = list(SitemapCrawler(client).crawl_sitemaps(f"{server.url}/sitemap_index.xml"))
+    assert [len(crawled_sitemap.urls) for crawled_sitemap in crawled_sitemaps] == [
+        2,
+        SITEMAP_PART_SIZE,
+        SITEMAP_PART_SIZE,
+        1,
+    ]
+    assert {crawled_sitemap.position for crawled_sitemap in crawled_sitemaps[1:]} == {(0,)}
+    assert [url.loc for crawled_sitemap in crawled_sitemaps[1:] for url in crawled_sitemap.urls] == urls
+
+
+def test_sitemap_crawler_keeps_urls_after_a_malformed_entry() -> None:
+    urls = [f"https://example.com/page{number}" for number in range(SITEMAP_PART_SIZE + 10)]
+    content = generate_sitemap_content(urls)
+    malformed_entry = f"<url><loc>{urls[SITEMAP_PART_SIZE + 5]}</loc></url>".encode()
+    content = content.replace(malformed_entry, malformed_entry.replace(b"</url>", b"<priority>high</priority></url>"))
+    content = content.replace(f"<loc>{urls[SITEMAP_PART_SIZE + 6]}</loc>".encode(), b"<loc></loc>")
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        server.files["/sitemap_index.xml"] = generate_sitemap_content([], [f"{server.url}/sitemap1.xml"])
+        server.files["/sitemap1.xml"] = content
+        crawled_urls = list(SitemapCrawler(client).crawl(f"{server.url}/sitemap_index.xml"))
+    assert [url.loc for url in crawled_urls] == urls[: SITEMAP_PART_SIZE + 6] + urls[SITEMAP_PART_SIZE + 7 :]
+    assert crawled_urls[SITEMAP_PART_SIZE + 5].priority is None
+
+
+def test_sitemap_crawler_with_max_depth(caplog: pytest.LogCaptureFixture) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        index_location = serve_three_level_sitemaps(server)
+        urls = [url.loc for url in SitemapCrawler(client, max_depth=2).crawl(index_location)]
+    assert urls == URLS[:5]
+    assert "/en/section1.xml" not in count_downloads(server)
+    assert "Skipped 2 nested sitemap(s) beyond the limit of 2 levels." in caplog.messages
+
+
+def test_sitemap_crawler_with_max_urls(caplog: pytest.LogCaptureFixture) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        index_location = serve_three_level_sitemaps(server)
+        urls = list(SitemapCrawler(client, max_workers=1, max_urls=4).crawl(index_location))
+    assert len(urls) == 4
+    assert "Stopped crawling sitemaps after the limit of 4 URLs was reached." in caplog.messages
+
+
+def test_sitemap_crawler_skips_sitemaps_that_cannot_be_retrieved(caplog: pytest.LogCaptureFixture) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        server.files["/sitemap.xml"] = generate_sitemap_content(URLS[:3], [f"{server.url}/missing.xml"])
+        urls = [url.loc for url in SitemapCrawler(client).crawl(f"{server.url}/sitemap.xml")]
+    assert urls == URLS[:3]
+    assert any(message.startswith("Skipped a sitemap that could not be retrieved") for message in caplog.messages)
+
+
+@pytest.mark.parametrize("max_workers, max_depth, max_urls", [(0, 1, None), (1, 0, None), (1, 1, -1)])
+def test_sitemap_crawler_with_invalid_limits(max_workers: int, max_depth: int, max_urls: int | None) -> None:
+    with pytest.raises(ValueError):
+        SitemapCrawler(max_workers=max_workers, max_depth=max_depth, max_urls=max_urls)
+
+
+@pytest.mark.parametrize(
+    "executor_strategy", [None, ExecutorStrategy(parse_executor=ParseExecutor.PROCESS, max_parse_workers=2)]
+)
+def test_controller_get_urls_from_parsed_sitemap_with_three_levels(executor_strategy: ExecutorStrategy | None) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        index_location = serve_three_level_sitemaps(server)
+        parsed_sitemap = parse_sitemap_xml(server.files["/sitemap_index.xml"])
+        url_elements = controller_get_urls_from_parsed_sitemap(
+            parsed_sitemap, client, executor_strategy, sitemap_location=index_location
+        )
+    assert [url.loc for url in url_elements] == URLS
+    assert set(count_downloads(server).values()) == {1}
+    assert "/sitemap_index.xml" not in count_downloads(server)
+
+
+@pytest.mark.parametrize(
+    "executor_strategy",
+    [
+        ExecutorStrategy(max_sitemap_depth=2, max_sitemap_urls=3),
+        ExecutorStrategy(max_sitemap_depth=2, max_sitemap_urls=3, parse_executor=ParseExecutor.PROCESS),
+    ],
+)
+def test_controller_get_urls_from_parsed_sitemap_with_limits(executor_strategy: ExecutorStrategy) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        index_location = serve_three_level_sitemaps(server)
+        parsed_sitemap = parse_sitemap_xml(server.files["/sitemap_index.xml"])
+        url_elements = controller_get_urls_from_parsed_sitemap(
+            parsed_sitemap, client, executor_strategy, sitemap_location=index_location
+        )
+    assert [url.loc for url in url_elements] == URLS[:3]
+    assert "/en/section1.xml" not in count_downloads(server)
+
+
+@pytest.mark.parametrize(
+    "executor_strategy", [None, ExecutorStrategy(parse_executor=ParseExecutor.PROCESS, max_parse_workers=2)]
+)
+def test_controller_get_urls_from_parsed_sitemap_removes_duplicate_urls(
+    executor_strategy: ExecutorStrategy | None,
+) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        server.files["/en.xml"] = generate_sitemap_content(URLS[:20])
+        server.files["/da.xml"] = generate_sitemap_content([*URLS[10:], URLS[0]])
+        parsed_sitemap = parse_sitemap_xml(
+            generate_sitemap_content(URLS[:3], [f"{server.url}/en.xml", f"{server.url}/da.xml"])
+        )
+        url_elements = controller_get_urls_from_parsed_sitemap(parsed_sitemap, client, executor_strategy)
+    assert [url.loc for url in url_elements] == URLS
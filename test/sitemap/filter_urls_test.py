@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from datetime import datetime
 
 import pytest
@@ -21,7 +22,7 @@ from index_now import (
     Today,
     Yesterday,
 )
-from index_now.sitemap.filter.sitemap import SitemapUrl, filter_sitemap_urls
+from index_now.sitemap.filter.sitemap import SitemapUrl, filter_sitemap_urls, filter_sitemap_urls_with_report
 from index_now.sitemap.parse import parse_sitemap_xml_and_get_urls_as_elements
 
 SITEMAP = parse_sitemap_xml_and_get_urls_as_elements(get_mock_sitemap_content())
@@ -307,3 +308,85 @@ def test_error_handling_of_filtering_sitemap_with_no_matches(
     filter_sitemap_urls(sitemap_urls, filter)
     terminal_output, _ = capfd.readouterr()
     assert expected_terminal_output in terminal_output
+
+
+@pytest.mark.parametrize(
+    "filter, expected_url_count, expected_removed_counts",
+    [
+        (SitemapFilter(), 9, {}),
+        (SitemapFilter(contains="section", take=3), 3, {"contains": 5, "take": 1}),
+        (SitemapFilter(excludes="section", skip=1), 4, {"excludes": 4, "skip": 1}),
+        (SitemapFilter(contains=NO_MATCHES_AT_ALL, take=2), 0, {"contains": 9, "take": 0}),
+        (SitemapFilter(take=2), 2, {"take": 7}),
+        (SitemapFilter(take=0), 0, {"take": 9}),
+    ],
+)
+def test_filter_sitemap_urls_with_report(
+    filter: SitemapFilter, expected_url_count: int, expected_removed_counts: dict[str, int]
+) -> None:
+    report = filter_sitemap_urls_with_report(SITEMAP, filter)
+    assert report.url_count_before == len(SITEMAP)
+    assert len(report.urls) == expected_url_count
+    assert report.urls == filter_sitemap_urls(SITEMAP, filter)
+    assert report.removed_counts == expected_removed_counts
+
+
+def test_compiled_sitemap_filter_is_reusable() -> None:
+    filter = SitemapFilter(date_range=DateRange(datetime(2025, 1, 1), datetime(2025, 1, 31)), excludes="section1")
+    compiled_filter = filter.compile()
+    for _ in range(3):
+        assert compiled_filter.filter(SITEMAP) == filter_sitemap_urls(SITEMAP, filter)
+        assert filter_sitemap_urls(SITEMAP, compiled_filter) == filter_sitemap_urls(SITEMAP, filter)
+
+
+def test_compiled_sitemap_filter_stops_when_take_is_reached() -> None:
+    class CountingDateRange(DateRange):
+        number_of_checks = 0
+
+        def is_within_range(self, date: datetime) -> bool:
+            CountingDateRange.number_of_checks += 1
+            return True
+
+    urls = [
+        SitemapUrl(f"https://example.com/page{number}", f"2025-01-{number % 28 + 1:02d}") for number in range(1_000)
+    ]
+    date_range = CountingDateRange(datetime.min, datetime.max)
+    report = filter_sitemap_urls_with_report(urls, SitemapFilter(date_range=date_range, skip=5, take=10))
+    assert report.urls == [url.loc for url in urls[5:15]]
+    assert report.removed_counts == {"date_range": 0, "skip": 5, "take": 985}
+    assert CountingDateRange.number_of_checks == 15
+
+
+@pytest.mark.parametrize("sitemap_urls", [SITEMAP, SITEMAP_INCONSISTENT])
+@pytest.mark.parametrize(
+    "filter",
+    [
+        SitemapFilter(),
+        SitemapFilter(change_frequency=ChangeFrequency.DAILY),
+        SitemapFilter(date_range=Between(datetime(2025, 1, 10), datetime(2025, 2, 20)), skip=1),
+        SitemapFilter(contains="section", excludes="page2", take=2),
+        SitemapFilter(skip=3, take=3),
+        SitemapFilter(take=0),
+    ],
+)
+def test_compiled_sitemap_filter_stream_matches_list(sitemap_urls: list[SitemapUrl], filter: SitemapFilter) -> None:
+    assert list(filter.compile().filter_stream(iter(sitemap_urls))) == filter_sitemap_urls(sitemap_urls, filter)
+
+
+def test_compiled_sitemap_filter_stream_stops_consuming_when_take_is_reached() -> None:
+    consumed_urls: list[SitemapUrl] = []
+
+    def generate_urls() -> Iterator[SitemapUrl]:
+        for number in range(1_000):
+            url = SitemapUrl(f"https://example.com/page{number}")
+            consumed_urls.append(url)
+            yield url
+
+    urls = list(SitemapFilter(contains="page1", take=3).compile().filter_stream(generate_urls()))
+    assert urls == ["https://example.com/page1", "https://example.com/page10", "https://example.com/page11"]
+    assert len(consumed_urls) == 12
+
+
+def test_sitemap_filter_rejects_negative_skip() -> None:
+    with pytest.raises(ValueError):
+        SitemapFilter(skip=-1)
@@ -0,0 +1,56 @@
+import pytest
+from _helper.sitemap import generate_sitemap_content
+
+from index_now import ExecutorStrategy, IndexNowClient, ParseExecutor
+from index_now.sitemap.get import get_multiple_sitemap_xml
+from index_now.sitemap.parse import SitemapUrl, controller_parse_sitemap_xml_and_get_urls
+from index_now.testing import IndexNowStandInServer
+
+URLS = [f"https://example.com/page{i}" for i in range(30)]
+
+NESTED_SITEMAP_FILES = {
+    "/sitemap1.xml": generate_sitemap_content(URLS[1:10]),
+    "/sitemap2.xml": generate_sitemap_content(URLS[10:20]),
+    "/sitemap3.xml": generate_sitemap_content(URLS[20:]),
+}
+
+
+@pytest.mark.parametrize(
+    "executor_strategy",
+    [
+        None,
+        ExecutorStrategy(max_fetch_workers=1),
+        ExecutorStrategy(max_fetch_workers=32),
+        ExecutorStrategy(parse_executor=ParseExecutor.PROCESS, max_parse_workers=2),
+    ],
+)
+@pytest.mark.parametrize("as_elements", [False, True])
+def test_controller_parse_sitemap_xml_and_get_urls_with_executor_strategy(
+    executor_strategy: ExecutorStrategy | None, as_elements: bool
+) -> None:
+    with IndexNowStandInServer(files=NESTED_SITEMAP_FILES) as server, IndexNowClient() as client:
+        nested_sitemap_locations = [f"{server.url}{path}" for path in NESTED_SITEMAP_FILES]
+        sitemap_content = generate_sitemap_content(URLS[:1], nested_sitemap_locations)
+        urls = controller_parse_sitemap_xml_and_get_urls(sitemap_content, as_elements, client, executor_strategy)
+    expected = [SitemapUrl(loc=url) for url in URLS] if as_elements else URLS
+    assert urls == expected
+
+
+def test_controller_parse_sitemap_xml_and_get_urls_with_single_nested_sitemap() -> None:
+    with IndexNowStandInServer(files=NESTED_SITEMAP_FILES) as server:
+        sitemap_content = generate_sitemap_content(URLS[:1], [f"{server.url}/sitemap1.xml"])
+        urls = controller_parse_sitemap_xml_and_get_urls(sitemap_content, as_elements=False)
+    assert urls == URLS[:10]
+
+
+def test_get_multiple_sitemap_xml_in_threads() -> None:
+    with IndexNowStandInServer(files=NESTED_SITEMAP_FILES) as server:
+        sitemap_locations = [f"{server.url}{path}" for path in NESTED_SITEMAP_FILES]
+        multiple_contents = get_multiple_sitemap_xml([*sitemap_locations, f"{server.url}/missing.xml"], max_workers=2)
+    assert multiple_contents == [*NESTED_SITEMAP_FILES.values(), ""]
+
+
+@pytest.mark.parametrize("max_fetch_workers, max_parse_workers", [(0, 1), (1, 0)])
+def test_executor_strategy_validation_of_arguments(max_fetch_workers: int, max_parse_workers: int) -> None:
+    with pytest.raises(ValueError):
+        ExecutorStrategy(max_fetch_workers=max_fetch_workers, max_parse_workers=max_parse_workers)
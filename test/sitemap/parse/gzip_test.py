@@ -0,0 +1,74 @@
+import gzip
+import json
+
+import pytest
+from _helper.sitemap import generate_sitemap_content, get_mock_sitemap_content
+
+from index_now import IndexNowAuthentication, IndexNowClient, submit_sitemap_to_index_now
+from index_now.sitemap.decompress import decompress_sitemap_chunks, is_gzip_compressed
+from index_now.sitemap.get import stream_sitemap_xml
+from index_now.sitemap.parse import (
+    iterparse_sitemap_xml_and_get_urls_as_elements,
+    parse_sitemap_xml,
+    parse_sitemap_xml_and_get_nested_sitemap_links,
+    parse_sitemap_xml_and_get_urls,
+    parse_sitemap_xml_and_get_urls_as_elements,
+)
+from index_now.testing import IndexNowStandInServer
+
+AUTHENTICATION = IndexNowAuthentication(
+    host="example.com", api_key="a1b2c3d4", api_key_location="https://example.com/a1b2c3d4.txt"
+)
+
+SITEMAP_CONTENT = get_mock_sitemap_content().encode()
+
+COMPRESSED_SITEMAP_CONTENT = gzip.compress(SITEMAP_CONTENT)
+
+
+@pytest.mark.parametrize(
+    "parser",
+    [
+        parse_sitemap_xml,
+        parse_sitemap_xml_and_get_urls,
+        parse_sitemap_xml_and_get_urls_as_elements,
+        parse_sitemap_xml_and_get_nested_sitemap_links,
+    ],
+)
+def test_parse_gzip_compressed_sitemap(parser: object) -> None:
+    assert callable(parser)
+    assert parser(COMPRESSED_SITEMAP_CONTENT) == parser(SITEMAP_CONTENT)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, len(COMPRESSED_SITEMAP_CONTENT)])
+def test_iterparse_gzip_compressed_sitemap(chunk_size: int) -> None:
+    chunks = [
+        COMPRESSED_SITEMAP_CONTENT[i : i + chunk_size] for i in range(0, len(COMPRESSED_SITEMAP_CONTENT), chunk_size)
+    ]
+    urls = list(iterparse_sitemap_xml_and_get_urls_as_elements(chunks))
+    assert urls == parse_sitemap_xml_and_get_urls_as_elements(SITEMAP_CONTENT)
+
+
+def test_decompress_sitemap_chunks() -> None:
+    content = generate_sitemap_content([f"https://example.com/page{number}" for number in range(10_000)])
+    compressed_content = gzip.compress(content[:1000]) + gzip.compress(content[1000:])
+    assert is_gzip_compressed(compressed_content)
+    assert not is_gzip_compressed(content)
+    decompressed_chunks = list(decompress_sitemap_chunks([compressed_content], chunk_size=1024))
+    assert b"".join(decompressed_chunks) == content
+    assert max(len(chunk) for chunk in decompressed_chunks) <= 1024
+    assert b"".join(decompress_sitemap_chunks([b"<", content[1:2], content[2:]])) == content
+    assert list(decompress_sitemap_chunks([])) == []
+
+
+def test_stream_and_submit_gzip_compressed_sitemap() -> None:
+    urls = [f"https://example.com/page{number}" for number in range(100)]
+    with IndexNowStandInServer(files={"/sitemap.xml.gz": gzip.compress(generate_sitemap_content(urls))}) as server:
+        with IndexNowClient() as client:
+            chunks = stream_sitemap_xml(f"{server.url}/sitemap.xml.gz", client=client)
+            assert [url.loc for url in iterparse_sitemap_xml_and_get_urls_as_elements(chunks)] == urls
+            status_code = submit_sitemap_to_index_now(
+                AUTHENTICATION, f"{server.url}/sitemap.xml.gz", endpoint=server.endpoint, client=client
+            ).status_code
+    assert status_code == 200
+    [submission] = [request for request in server.requests if request.method == "POST"]
+    assert json.loads(submission.body)["urlList"] == urls
@@ -0,0 +1,93 @@
+import json
+from collections import Counter
+
+import pytest
+from _helper.sitemap import generate_sitemap_content, get_mock_sitemap_content
+
+from index_now import IndexNowAuthentication, IndexNowClient, SitemapFilter, submit_sitemaps_to_index_now
+from index_now.sitemap.parse import (
+    SitemapUrl,
+    controller_parse_sitemap_xml_and_get_urls,
+    parse_sitemap_xml,
+    parse_sitemap_xml_and_get_nested_sitemap_links,
+    parse_sitemap_xml_and_get_urls_as_elements,
+)
+from index_now.testing import IndexNowStandInServer
+
+AUTHENTICATION = IndexNowAuthentication(
+    host="example.com", api_key="a1b2c3d4", api_key_location="https://example.com/a1b2c3d4.txt"
+)
+
+URLS = [f"https://example.com/section{i % 2 + 1}/page{i}" for i in range(20)]
+
+
+def test_parse_sitemap_xml_matches_separate_parsers() -> None:
+    sitemap_content = get_mock_sitemap_content()
+    parsed_sitemap = parse_sitemap_xml(sitemap_content)
+    assert parsed_sitemap.urls == parse_sitemap_xml_and_get_urls_as_elements(sitemap_content)
+    assert parsed_sitemap.nested_sitemap_links == parse_sitemap_xml_and_get_nested_sitemap_links(sitemap_content)
+
+
+def test_parse_sitemap_xml_with_invalid_xml() -> None:
+    parsed_sitemap = parse_sitemap_xml(b"not xml")
+    assert parsed_sitemap.urls == []
+    assert parsed_sitemap.nested_sitemap_links == []
+
+
+def test_parse_sitemap_xml_with_invalid_values_in_an_entry() -> None:
+    sitemap_content = (
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<url><loc>https://example.com/page1</loc><lastmod>yesterday</lastmod><changefreq>sometimes</changefreq>"
+        "<priority>high</priority></url>"
+        "<url><loc>https://example.com/page2</loc><lastmod>2025-01-01</lastmod><changefreq>Daily</changefreq>"
+        "<priority>0.5</priority></url>"
+        "<url><loc>https://example.com/page3</loc><priority>1.5</priority></url>"
+        "</urlset>"
+    )
+    assert parse_sitemap_xml(sitemap_content).urls == [
+        SitemapUrl(loc="https://example.com/page1"),
+        SitemapUrl(loc="https://example.com/page2", lastmod="2025-01-01", changefreq="Daily", priority=0.5),
+        SitemapUrl(loc="https://example.com/page3"),
+    ]
+    assert parse_sitemap_xml_and_get_urls_as_elements(sitemap_content) == parse_sitemap_xml(sitemap_content).urls
+    assert controller_parse_sitemap_xml_and_get_urls(sitemap_content, as_elements=False) == [
+        "https://example.com/page1",
+        "https://example.com/page2",
+        "https://example.com/page3",
+    ]
+
+
+def test_parse_sitemap_xml_skips_entries_without_location(caplog: pytest.LogCaptureFixture) -> None:
+    sitemap_content = (
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<url><loc>https://example.com/page1</loc></url>"
+        "<url><loc> </loc><priority>0.5</priority></url>"
+        "<url><lastmod>2025-01-01</lastmod></url>"
+        "<sitemap><loc></loc></sitemap>"
+        "<url><loc>https://example.com/page2</loc></url>"
+        "</urlset>"
+    )
+    parsed_sitemap = parse_sitemap_xml(sitemap_content)
+    assert [url.loc for url in parsed_sitemap.urls] == ["https://example.com/page1", "https://example.com/page2"]
+    assert parsed_sitemap.nested_sitemap_links == []
+    assert caplog.messages.count("Skipped a sitemap entry without a location.") == 3
+    assert "Invalid sitemap format" not in caplog.text
+
+
+@pytest.mark.parametrize("filter", [None, SitemapFilter(contains="section1")])
+def test_submit_sitemaps_downloads_each_sitemap_once(filter: SitemapFilter | None) -> None:
+    files = {"/nested1.xml": generate_sitemap_content(URLS[1:10]), "/nested2.xml": generate_sitemap_content(URLS[10:])}
+    with IndexNowStandInServer(files=files) as server, IndexNowClient() as client:
+        nested_sitemap_locations = [f"{server.url}{path}" for path in files]
+        server.files["/sitemap1.xml"] = generate_sitemap_content(URLS[:1], nested_sitemap_locations[:1])
+        server.files["/sitemap2.xml"] = generate_sitemap_content([], nested_sitemap_locations[1:])
+        sitemap_locations = [f"{server.url}/sitemap1.xml", f"{server.url}/sitemap2.xml"]
+        status_code = submit_sitemaps_to_index_now(
+            AUTHENTICATION, sitemap_locations, filter, endpoint=server.endpoint, client=client
+        ).status_code
+    assert status_code == 200
+    downloads = Counter(request.path for request in server.requests if request.method == "GET")
+    assert downloads == {"/sitemap1.xml": 1, "/sitemap2.xml": 1, "/nested1.xml": 1, "/nested2.xml": 1}
+    [submission] = [request for request in server.requests if request.method == "POST"]
+    expected_urls = [url for url in URLS if "section1" in url] if filter else URLS
+    assert json.loads(submission.body)["urlList"] == expected_urls
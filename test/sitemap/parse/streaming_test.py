@@ -0,0 +1,76 @@
+from collections.abc import Iterator
+
+import pytest
+from _helper.sitemap import generate_sitemap_content, get_mock_sitemap_content
+
+from index_now import IndexNowClient
+from index_now.sitemap.get import stream_sitemap_xml
+from index_now.sitemap.parse import (
+    SitemapEntryType,
+    iterparse_sitemap_xml,
+    iterparse_sitemap_xml_and_get_parsed_sitemap,
+    iterparse_sitemap_xml_and_get_urls_as_elements,
+    parse_sitemap_xml,
+    parse_sitemap_xml_and_get_nested_sitemap_links,
+    parse_sitemap_xml_and_get_urls_as_elements,
+)
+from index_now.testing import IndexNowStandInServer
+
+
+def split_into_chunks(content: bytes, chunk_size: int) -> list[bytes]:
+    return [content[i : i + chunk_size] for i in range(0, len(content), chunk_size)]
+
+
+def test_iterparse_sitemap_xml_matches_parse_sitemap_xml() -> None:
+    content = get_mock_sitemap_content()
+    for chunk_size in [1, 7, 1024, len(content)]:
+        entries = list(iterparse_sitemap_xml(split_into_chunks(content.encode(), chunk_size)))
+        urls = [url for entry_type, url in entries if entry_type is SitemapEntryType.URL]
+        nested_sitemap_links = [url.loc for entry_type, url in entries if entry_type is SitemapEntryType.SITEMAP]
+        assert urls == parse_sitemap_xml_and_get_urls_as_elements(content)
+        assert nested_sitemap_links == parse_sitemap_xml_and_get_nested_sitemap_links(content)
+
+
+def test_iterparse_sitemap_xml_and_get_parsed_sitemap_matches_parse_sitemap_xml() -> None:
+    content = generate_sitemap_content(
+        ["https://example.com/page1", "https://example.com/page2"], ["https://example.com/sitemap2.xml"]
+    )
+    assert iterparse_sitemap_xml_and_get_parsed_sitemap(split_into_chunks(content, 16)) == parse_sitemap_xml(content)
+    assert iterparse_sitemap_xml_and_get_parsed_sitemap([content[:-20]]) == parse_sitemap_xml(content[:-20])
+
+
+def test_iterparse_sitemap_xml_and_get_urls_as_elements_is_lazy() -> None:
+    urls = [f"https://example.com/page{number}" for number in range(10_000)]
+    chunks = split_into_chunks(generate_sitemap_content(urls), 4096)
+    consumed_chunks = []
+
+    def read_chunks() -> Iterator[bytes]:
+        for chunk in chunks:
+            consumed_chunks.append(chunk)
+            yield chunk
+
+    sitemap_urls = iterparse_sitemap_xml_and_get_urls_as_elements(read_chunks())
+    assert next(sitemap_urls).loc == urls[0]
+    assert len(consumed_chunks) == 1
+    assert [url.loc for url in sitemap_urls] == urls[1:]
+    assert len(consumed_chunks) == len(chunks)
+
+
+def test_iterparse_sitemap_xml_and_get_urls_as_elements_with_invalid_xml(caplog: pytest.LogCaptureFixture) -> None:
+    content = generate_sitemap_content(["https://example.com/page1", "https://example.com/page2"])
+    assert [url.loc for url in iterparse_sitemap_xml_and_get_urls_as_elements([content[:-20]])] == [
+        "https://example.com/page1"
+    ]
+    assert "Invalid sitemap format" in caplog.text
+    assert list(iterparse_sitemap_xml_and_get_urls_as_elements([b"not xml"])) == []
+
+
+def test_stream_sitemap_xml() -> None:
+    urls = [f"https://example.com/page{number}" for number in range(1_000)]
+    content = generate_sitemap_content(urls)
+    with IndexNowStandInServer(files={"/sitemap.xml": content}) as server, IndexNowClient() as client:
+        chunks = list(stream_sitemap_xml(f"{server.url}/sitemap.xml", client=client, chunk_size=1024))
+        assert len(chunks) > 1
+        assert b"".join(chunks) == content
+        assert list(stream_sitemap_xml(f"{server.url}/non-existing-sitemap.xml", client=client)) == []
+        assert list(stream_sitemap_xml("", client=client)) == []
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+from _helper.sitemap import generate_sitemap_content
+
+from index_now import (
+    ExecutorStrategy,
+    IndexNowAuthentication,
+    IndexNowClient,
+    SitemapFilter,
+    stream_sitemap_to_index_now,
+)
+from index_now.testing import IndexNowStandInServer
+
+AUTHENTICATION = IndexNowAuthentication(
+    host="example.com", api_key="a1b2c3d4", api_key_location="https://example.com/a1b2c3d4.txt"
+)
+
+URLS = [f"https://example.com/section{i % 2 + 1}/page{i}" for i in range(30)]
+
+
+def get_submitted_urls(server: IndexNowStandInServer) -> list[str]:
+    return [
+        url for request in server.requests if request.method == "POST" for url in json.loads(request.body)["urlList"]
+    ]
+
+
+@pytest.mark.parametrize(
+    "filter, expected_urls",
+    [(None, URLS), (SitemapFilter(contains="section1"), [url for url in URLS if "section1" in url])],
+)
+def test_stream_sitemap_to_index_now(filter: SitemapFilter | None, expected_urls: list[str]) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        server.files["/nested1.xml"] = generate_sitemap_content(URLS[2:10], [f"{server.url}/nested2.xml"])
+        server.files["/nested2.xml"] = generate_sitemap_content(URLS[10:])
+        server.files["/sitemap.xml"] = generate_sitemap_content(URLS[:2], [f"{server.url}/nested1.xml"])
+        result = stream_sitemap_to_index_now(
+            AUTHENTICATION, f"{server.url}/sitemap.xml", filter, endpoint=server.endpoint, client=client, batch_size=4
+        )
+    assert result.status_code == 200
+    assert result.url_count == len(expected_urls)
+    assert all(batch.url_count <= 4 for batch in result.batches)
+    assert sorted(get_submitted_urls(server)) == sorted(expected_urls)
+
+
+def test_stream_sitemap_to_index_now_stops_crawling_when_take_is_reached() -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        server.files["/nested.xml"] = generate_sitemap_content(URLS[10:])
+        server.files["/sitemap.xml"] = generate_sitemap_content(URLS[:10], [f"{server.url}/nested.xml"])
+        result = stream_sitemap_to_index_now(
+            AUTHENTICATION,
+            f"{server.url}/sitemap.xml",
+            SitemapFilter(take=5),
+            endpoint=server.endpoint,
+            client=client,
+            executor_strategy=ExecutorStrategy(max_fetch_workers=1),
+        )
+    assert get_submitted_urls(server) == URLS[:5]
+    assert result.url_count == 5
+
+
+@pytest.mark.parametrize(
+    "files, filter, expected_status_code",
+    [
+        ({}, None, 404),
+        ({"/sitemap.xml": generate_sitemap_content([])}, None, 422),
+        ({"/sitemap.xml": generate_sitemap_content(URLS)}, SitemapFilter(contains="no-matches-at-all"), 204),
+        ({"/sitemap.xml": generate_sitemap_content(URLS)}, SitemapFilter(take=0), 204),
+    ],
+)
+def test_stream_sitemap_to_index_now_without_urls_to_submit(
+    files: dict[str, bytes], filter: SitemapFilter | None, expected_status_code: int
+) -> None:
+    with IndexNowStandInServer(files=files) as server, IndexNowClient() as client:
+        result = stream_sitemap_to_index_now(
+            AUTHENTICATION, f"{server.url}/sitemap.xml", filter, endpoint=server.endpoint, client=client
+        )
+    assert result.status_code == expected_status_code
+    assert result.batches == []
+    assert get_submitted_urls(server) == []
+
+
+def test_stream_sitemap_to_index_now_submits_urls_of_overlapping_sitemaps_once() -> None:
+    with IndexNowStandInServer() as server:
+        server.files["/en.xml"] = generate_sitemap_content(URLS[:20])
+        server.files["/da.xml"] = generate_sitemap_content(URLS[10:])
+        server.files["/sitemap.xml"] = generate_sitemap_content(
+            URLS[:5], [f"{server.url}/en.xml", f"{server.url}/da.xml"]
+        )
+        result = stream_sitemap_to_index_now(AUTHENTICATION, f"{server.url}/sitemap.xml", endpoint=server.endpoint)
+    assert result.status_code == 200
+    assert sorted(get_submitted_urls(server)) == sorted(URLS)
@@ -1,10 +1,12 @@
+import json
+
 import pytest
 from _helper.endpoint import is_endpoint_up
-from _helper.sitemap import INVALID_SITEMAP_LOCATIONS, NON_EXISTING_SITEMAP_LOCATIONS
-from _mock_data.website import BROWSERIST, COLORIST_FOR_PYTHON, INDEX_NOW_FOR_PYTHON, TIMER_FOR_PYTHON
-from colorist import Color
+from _helper.sitemap import INVALID_SITEMAP_LOCATIONS, NON_EXISTING_SITEMAP_LOCATIONS, generate_sitemap_content
+from _mock_data.website import BROWSERIST, COLORIST_FOR_PYTHON, EXAMPLE_WEBSITE, INDEX_NOW_FOR_PYTHON, TIMER_FOR_PYTHON
 
-from index_now import SearchEngineEndpoint, SitemapFilter, submit_sitemaps_to_index_now
+from index_now import IndexNowClient, SearchEngineEndpoint, SitemapFilter, SitemapOutcome, submit_sitemaps_to_index_now
+from index_now.testing import IndexNowStandInServer
 
 SITEMAP_LOCATIONS = [
     TIMER_FOR_PYTHON.sitemap_location,
@@ -20,14 +22,11 @@ def test_submit_multiple_sitemaps_to_index_now(capfd: object) -> None:
         pytest.skip(f"Endpoint is not up: {endpoint}")  # pragma: no cover
     status_code = submit_sitemaps_to_index_now(
         INDEX_NOW_FOR_PYTHON.authentication, SITEMAP_LOCATIONS, endpoint=endpoint
-    )
+    ).status_code
     assert status_code in [200, 202]
     terminal_output, _ = capfd.readouterr()
-    assert f"URL(s) were submitted successfully to this IndexNow API endpoint:{Color.OFF} {endpoint}" in terminal_output
-    assert (
-        f"Status code: {Color.GREEN}200 OK{Color.OFF}"
-        or f"Status code: {Color.GREEN}202 Accepted{Color.OFF}" in terminal_output
-    )
+    assert f"URL(s) were submitted successfully to this IndexNow API endpoint: {endpoint}" in terminal_output
+    assert "status code: 200 OK" or "status code: 202 Accepted" in terminal_output
 
 
 def test_submit_multiple_sitemaps_error_handling_of_non_existing_sitemaps() -> None:
@@ -36,7 +35,7 @@ def test_submit_multiple_sitemaps_error_handling_of_non_existing_sitemaps() -> N
         pytest.skip(f"Endpoint is not up: {endpoint}")  # pragma: no cover
     status_code = submit_sitemaps_to_index_now(
         INDEX_NOW_FOR_PYTHON.authentication, NON_EXISTING_SITEMAP_LOCATIONS, endpoint=endpoint
-    )
+    ).status_code
     assert status_code == 404
 
 
@@ -47,7 +46,7 @@ def test_submit_multiple_sitemaps_error_handling_of_no_matches() -> None:
     sitemap_filter = SitemapFilter(contains="no-matches-at-all")
     status_code = submit_sitemaps_to_index_now(
         INDEX_NOW_FOR_PYTHON.authentication, SITEMAP_LOCATIONS, filter=sitemap_filter, endpoint=endpoint
-    )
+    ).status_code
     assert status_code == 204
 
 
@@ -57,5 +56,86 @@ def test_submit_multiple_sitemaps_error_handling_of_invalid_sitemaps() -> None:
         pytest.skip(f"Endpoint is not up: {endpoint}")  # pragma: no cover
     status_code = submit_sitemaps_to_index_now(
         INDEX_NOW_FOR_PYTHON.authentication, INVALID_SITEMAP_LOCATIONS, endpoint=endpoint
-    )
+    ).status_code
     assert status_code == 422
+
+
+URLS = [f"https://example.com/page{i}" for i in range(30)]
+
+
+def serve_healthy_and_failing_sitemaps(server: IndexNowStandInServer) -> list[str]:
+    server.files = {
+        "/sitemap1.xml": generate_sitemap_content(URLS[:10]),
+        "/empty.xml": generate_sitemap_content([]),
+        "/sitemap2.xml": generate_sitemap_content(URLS[10:20], [f"{server.url}/nested.xml"]),
+        "/nested.xml": generate_sitemap_content(URLS[20:]),
+    }
+    return [
+        f"{server.url}/sitemap1.xml",
+        f"{server.url}/missing.xml",
+        f"{server.url}/empty.xml",
+        "http://127.0.0.1:1/sitemap.xml",
+        f"{server.url}/sitemap2.xml",
+    ]
+
+
+def test_submit_multiple_sitemaps_isolates_failing_sitemaps(caplog: pytest.LogCaptureFixture) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient(max_retries=0) as client:
+        sitemap_locations = serve_healthy_and_failing_sitemaps(server)
+        result = submit_sitemaps_to_index_now(
+            EXAMPLE_WEBSITE.authentication, sitemap_locations, endpoint=server.endpoint, client=client
+        )
+    assert result.status_code == 200
+    assert json.loads(server.requests[-1].body)["urlList"] == URLS
+    assert [outcome.location for outcome in result.sitemap_outcomes] == sitemap_locations
+    assert [outcome.status_code for outcome in result.sitemap_outcomes] == [200, 404, 200, None, 200]
+    assert [outcome.url_count for outcome in result.sitemap_outcomes] == [10, 0, 0, 0, 20]
+    assert [outcome.is_success for outcome in result.sitemap_outcomes] == [True, False, False, False, True]
+    assert result.sitemap_outcomes[1] == SitemapOutcome(sitemap_locations[1], 404, error="Not found")
+    assert result.sitemap_outcomes[3].error
+    assert "Skipped 3 of 5 sitemaps. Submitting the URLs of the other sitemaps." in caplog.messages
+
+
+@pytest.mark.parametrize(
+    "paths, expected_status_code",
+    [(["/missing.xml", "/empty.xml"], 404), (["/empty.xml", "/missing.xml"], 404), (["/empty.xml"], 422)],
+)
+def test_submit_multiple_sitemaps_when_all_sitemaps_fail(paths: list[str], expected_status_code: int) -> None:
+    with IndexNowStandInServer() as server:
+        serve_healthy_and_failing_sitemaps(server)
+        result = submit_sitemaps_to_index_now(
+            EXAMPLE_WEBSITE.authentication, [f"{server.url}{path}" for path in paths], endpoint=server.endpoint
+        )
+    assert result.status_code == expected_status_code
+    assert not result.batches
+    assert len(result.sitemap_outcomes) == len(paths)
+    assert not any(request.method == "POST" for request in server.requests)
+
+
+def test_submit_multiple_sitemaps_reports_outcomes_when_filter_removes_all_urls() -> None:
+    with IndexNowStandInServer() as server:
+        sitemap_locations = serve_healthy_and_failing_sitemaps(server)[:2]
+        result = submit_sitemaps_to_index_now(
+            EXAMPLE_WEBSITE.authentication,
+            sitemap_locations,
+            SitemapFilter(contains="no-matches-at-all"),
+            endpoint=server.endpoint,
+        )
+    assert result.status_code == 204
+    assert [outcome.is_success for outcome in result.sitemap_outcomes] == [True, False]
+
+
+def test_submit_multiple_sitemaps_submits_urls_of_overlapping_sitemaps_once() -> None:
+    with IndexNowStandInServer() as server:
+        server.files = {
+            "/en.xml": generate_sitemap_content(URLS[:20]),
+            "/tags.xml": generate_sitemap_content(URLS[10:]),
+            "/category.xml": generate_sitemap_content(URLS[:5] + URLS[25:]),
+        }
+        sitemap_locations = [f"{server.url}/en.xml", f"{server.url}/tags.xml", f"{server.url}/category.xml"]
+        result = submit_sitemaps_to_index_now(
+            EXAMPLE_WEBSITE.authentication, sitemap_locations, endpoint=server.endpoint
+        )
+    assert result.status_code == 200
+    assert json.loads(server.requests[-1].body)["urlList"] == URLS
+    assert [outcome.url_count for outcome in result.sitemap_outcomes] == [20, 20, 10]
@@ -0,0 +1,196 @@
+from datetime import datetime
+
+import pytest
+from _helper.sitemap import get_mock_sitemap_content, get_mock_sitemap_inconsistent_content
+
+from index_now import Between, ChangeFrequency, DateRange, Day, EarlierThan, LaterThanAndIncluding, SitemapFilter
+from index_now.sitemap.filter.sitemap import filter_sitemap_urls_with_report
+from index_now.sitemap.parse import SitemapUrl, parse_sitemap_xml_and_get_urls_as_elements
+from index_now.sitemap.table import SitemapUrlTable, parse_lastmod_timestamp, parse_sitemap_xml_and_get_url_table
+
+SITEMAP = parse_sitemap_xml_and_get_urls_as_elements(get_mock_sitemap_content())
+
+SITEMAP_INCONSISTENT = parse_sitemap_xml_and_get_urls_as_elements(get_mock_sitemap_inconsistent_content())
+
+
+def test_sitemap_url_table_round_trip() -> None:
+    table = SitemapUrlTable(SITEMAP)
+    assert len(table) == len(SITEMAP)
+    for url, table_url in zip(SITEMAP, table):
+        assert table_url.loc == url.loc
+        assert table_url.lastmod is not None and url.lastmod is not None
+        assert table_url.lastmod.startswith(url.lastmod)
+        assert table_url.changefreq == url.changefreq
+        assert table_url.priority == pytest.approx(url.priority)
+    assert table[-1] == table[len(table) - 1]
+    with pytest.raises(IndexError):
+        table[len(table)]
+
+
+def test_sitemap_url_table_with_missing_and_invalid_values() -> None:
+    table = SitemapUrlTable(
+        [
+            SitemapUrl("https://example.com/æøå"),
+            SitemapUrl("https://example.com/page2", lastmod="not a date", changefreq="Sometimes", priority=0.5),
+        ]
+    )
+    assert list(table) == [SitemapUrl("https://example.com/æøå"), SitemapUrl("https://example.com/page2", priority=0.5)]
+
+
+def test_sitemap_url_table_extend() -> None:
+    table = SitemapUrlTable(SITEMAP[:4])
+    table.extend(SitemapUrlTable(SITEMAP[4:]))
+    assert table == SitemapUrlTable(SITEMAP)
+    assert table.get_locations() == [url.loc for url in SITEMAP]
+
+
+def test_sitemap_url_table_is_smaller_than_list_of_urls() -> None:
+    table = SitemapUrlTable(SITEMAP)
+    assert table.nbytes == sum(len(url.loc) + 8 + 8 + 1 + 4 for url in SITEMAP) + 8
+
+
+def test_parse_sitemap_xml_and_get_url_table() -> None:
+    assert parse_sitemap_xml_and_get_url_table(get_mock_sitemap_content()) == SitemapUrlTable(SITEMAP)
+    assert len(parse_sitemap_xml_and_get_url_table(b"<invalid")) == 0
+
+
+@pytest.mark.parametrize(
+    "lastmod, expected_timestamp",
+    [
+        ("2025-01-01", 1735689600),
+        ("2025-01-01T01:00:00+01:00", 1735693200),
+        ("2024-12-31T23:30:00-05:00", 1735687800),
+        ("2025-01-01T00:00:00.5Z", 1735689600),
+        (None, None),
+        ("", None),
+        ("yesterday", None),
+    ],
+)
+def test_parse_lastmod_timestamp(lastmod: str | None, expected_timestamp: int | None) -> None:
+    assert parse_lastmod_timestamp(lastmod) == expected_timestamp
+
+
+@pytest.mark.parametrize("urls", [SITEMAP, SITEMAP_INCONSISTENT])
+@pytest.mark.parametrize(
+    "filter",
+    [
+        SitemapFilter(),
+        SitemapFilter(change_frequency=ChangeFrequency.DAILY),
+        SitemapFilter(change_frequency="WEEKLY", take=1),
+        SitemapFilter(date_range=DateRange(datetime(2025, 1, 10), datetime(2025, 2, 20))),
+        SitemapFilter(date_range=Between(datetime(2025, 1, 10), datetime(2025, 2, 20)), skip=1),
+        SitemapFilter(date_range=LaterThanAndIncluding(datetime(2025, 3, 1)), contains="section"),
+        SitemapFilter(date_range=EarlierThan(datetime(2025, 3, 1)), excludes="page", take=2),
+        SitemapFilter(change_frequency=ChangeFrequency.NEVER, contains="no-matches-at-all"),
+        SitemapFilter(skip=3, take=3),
+        SitemapFilter(take=0),
+    ],
+)
+def test_filter_sitemap_url_table_matches_list(urls: list[SitemapUrl], filter: SitemapFilter) -> None:
+    assert filter_sitemap_urls_with_report(SitemapUrlTable(urls), filter) == filter_sitemap_urls_with_report(
+        urls, filter
+    )
+
+
+class Weekend(DateRange):
+    def __init__(self) -> None:
+        super().__init__(start=datetime.min, end=datetime.max)
+
+    def is_within_range(self, date: datetime) -> bool:
+        return date.weekday() >= 5
+
+
+URLS_WITH_TIME_ZONES = [
+    SitemapUrl(f"https://example.com/page{number}", lastmod=lastmod)
+    for number, lastmod in enumerate(
+        [
+            "2025-01-10T23:30:00-05:00",
+            "2025-01-11T00:30:00+02:00",
+            "2025-01-11T23:59:59Z",
+            "2025-01-12T00:00:00+14:00",
+            "2025-01-12T22:00:00-10:00",
+            "2025-01-13",
+            None,
+        ]
+    )
+]
+
+
+@pytest.mark.parametrize("use_lastmod_index", [False, True])
+@pytest.mark.parametrize(
+    "date_range",
+    [
+        Day(datetime(2025, 1, 11)),
+        Day(datetime(2025, 1, 12)),
+        Between(datetime(2025, 1, 10), datetime(2025, 1, 12)),
+        LaterThanAndIncluding(datetime(2025, 1, 12)),
+        EarlierThan(datetime(2025, 1, 11)),
+        Weekend(),
+    ],
+)
+def test_filter_sitemap_url_table_with_time_zones_matches_list(date_range: DateRange, use_lastmod_index: bool) -> None:
+    table = SitemapUrlTable(URLS_WITH_TIME_ZONES)
+    if use_lastmod_index:
+        table.create_lastmod_index()
+    filter = SitemapFilter(date_range=date_range)
+    assert filter_sitemap_urls_with_report(table, filter) == filter_sitemap_urls_with_report(
+        URLS_WITH_TIME_ZONES, filter
+    )
+
+
+def test_lastmod_index_with_date_range_without_ordinal_bounds() -> None:
+    lastmod_index = SitemapUrlTable(URLS_WITH_TIME_ZONES).create_lastmod_index()
+    assert lastmod_index.get_row_indices(Weekend()) == [1, 2, 3, 4]
+    assert lastmod_index.count(Weekend()) == 4
+    with pytest.raises(ValueError):
+        lastmod_index.get_position_bounds(Weekend())
+
+
+@pytest.mark.parametrize(
+    "filter",
+    [
+        SitemapFilter(date_range=Day(datetime(2025, 1, 15))),
+        SitemapFilter(date_range=Day(datetime(2025, 1, 15)), change_frequency=ChangeFrequency.DAILY, take=5),
+        SitemapFilter(date_range=DateRange(datetime(2025, 1, 1), datetime(2025, 1, 31))),
+        SitemapFilter(date_range=Between(datetime(2025, 1, 1), datetime(2025, 1, 2)), contains="page1"),
+    ],
+)
+def test_filter_sitemap_url_table_with_lastmod_index_matches_list(filter: SitemapFilter) -> None:
+    urls = [
+        SitemapUrl(
+            f"https://example.com/page{number}",
+            lastmod=f"2025-{number % 12 + 1:02d}-{number % 28 + 1:02d}" if number % 50 else None,
+            changefreq="daily" if number % 3 else "weekly",
+        )
+        for number in range(1_000)
+    ]
+    table = SitemapUrlTable(urls)
+    table.create_lastmod_index()
+    assert filter_sitemap_urls_with_report(table, filter) == filter_sitemap_urls_with_report(urls, filter)
+
+
+def test_lastmod_index() -> None:
+    table = SitemapUrlTable(SITEMAP_INCONSISTENT)
+    lastmod_index = table.create_lastmod_index()
+    assert table.lastmod_index is lastmod_index
+    assert len(lastmod_index) + len(lastmod_index.missing_row_indices) == len(table)
+    assert list(lastmod_index.lastmods) == sorted(lastmod_index.lastmods)
+    date_range = DateRange(datetime(2025, 1, 10), datetime(2025, 2, 20))
+    expected_row_indices = [
+        index
+        for index, url in enumerate(SITEMAP_INCONSISTENT)
+        if url.lastmod and date_range.is_within_range(datetime.fromisoformat(url.lastmod))
+    ]
+    assert lastmod_index.get_row_indices(date_range) == expected_row_indices
+    assert lastmod_index.count(date_range) == len(expected_row_indices)
+    assert lastmod_index.count(Between(datetime(2025, 1, 10), datetime(2025, 1, 11))) == 0
+
+
+def test_lastmod_index_is_dropped_when_rows_are_added() -> None:
+    table = SitemapUrlTable(SITEMAP)
+    table.create_lastmod_index()
+    table.append(SITEMAP[0])
+    assert table.lastmod_index is None
+    table.create_lastmod_index()
+    table.extend(SitemapUrlTable(SITEMAP))
+    assert table.lastmod_index is None
@@ -0,0 +1,184 @@
+import json
+import time
+from http import HTTPStatus
+
+import pytest
+import requests
+from _helper.sitemap import generate_sitemap_content
+from _mock_data.website import INDEX_NOW_FOR_PYTHON, INDEX_NOW_FOR_PYTHON_INVALID_API_KEY
+
+from index_now import IndexNowClient, submit_sitemap_to_index_now, submit_url_to_index_now, submit_urls_to_index_now
+from index_now.testing import IndexNowStandInServer, StandInServerStatistics
+
+AUTHENTICATION = INDEX_NOW_FOR_PYTHON.authentication
+
+URLS = [f"https://{AUTHENTICATION.host}/page{number}" for number in range(25)]
+
+
+def create_payload(urls: list[str], host: str = AUTHENTICATION.host, key: str = AUTHENTICATION.api_key) -> bytes:
+    return json.dumps({"host": host, "key": key, "urlList": urls}).encode()
+
+
+def test_stand_in_server_accepts_get_and_post_submissions() -> None:
+    with IndexNowStandInServer() as server, IndexNowClient(max_retries=0) as client:
+        single_result = submit_url_to_index_now(AUTHENTICATION, URLS[0], server.endpoint, client)
+        result = submit_urls_to_index_now(AUTHENTICATION, URLS, server.endpoint, client, batch_size=10)
+    assert single_result.status_code == HTTPStatus.OK
+    assert result.status_code == HTTPStatus.OK
+    assert [request.method for request in server.requests] == ["GET", "POST", "POST", "POST"]
+    assert server.statistics == StandInServerStatistics(
+        request_count=4,
+        submission_count=4,
+        accepted_url_count=26,
+        received_bytes=sum(len(request.body) for request in server.requests),
+        status_code_counts={HTTPStatus.OK: 4},
+    )
+
+
+def test_stand_in_server_serves_sitemap_fixtures() -> None:
+    sitemap_content = generate_sitemap_content(URLS)
+    with (
+        IndexNowStandInServer(files={"/sitemap.xml": sitemap_content}) as server,
+        IndexNowClient(max_retries=0) as client,
+    ):
+        result = submit_sitemap_to_index_now(
+            AUTHENTICATION, f"{server.url}/sitemap.xml", endpoint=server.endpoint, client=client
+        )
+        missing_response = client.get(f"{server.url}/missing.xml")
+    assert result.status_code == HTTPStatus.OK
+    assert result.batches[0].url_count == len(URLS)
+    assert missing_response.status_code == HTTPStatus.NOT_FOUND
+    assert server.statistics.submission_count == 1
+    assert server.statistics.status_code_counts == {HTTPStatus.OK: 2, HTTPStatus.NOT_FOUND: 1}
+
+
+@pytest.mark.parametrize(
+    "body, expected_status_code",
+    [
+        (b"not json", HTTPStatus.BAD_REQUEST),
+        (json.dumps({"host": AUTHENTICATION.host}).encode(), HTTPStatus.BAD_REQUEST),
+        (create_payload([]), HTTPStatus.BAD_REQUEST),
+        (create_payload(URLS, key="short"), HTTPStatus.FORBIDDEN),
+        (create_payload(URLS, key="not/a/valid/key"), HTTPStatus.FORBIDDEN),
+        (create_payload(URLS, key=INDEX_NOW_FOR_PYTHON_INVALID_API_KEY.authentication.api_key), HTTPStatus.OK),
+        (create_payload(URLS, host="example.com"), HTTPStatus.UNPROCESSABLE_ENTITY),
+        (create_payload([*URLS, "https://example.com/page"]), HTTPStatus.UNPROCESSABLE_ENTITY),
+    ],
+)
+def test_stand_in_server_validates_submissions(body: bytes, expected_status_code: int) -> None:
+    with IndexNowStandInServer() as server:
+        response = requests.post(server.endpoint, data=body, timeout=5)
+    assert response.status_code == expected_status_code
+    assert server.statistics.accepted_url_count == (len(URLS) if expected_status_code == HTTPStatus.OK else 0)
+
+
+def test_stand_in_server_validates_get_submissions() -> None:
+    with IndexNowStandInServer() as server:
+        missing_key_response = requests.get(server.endpoint, params={"url": URLS[0]}, timeout=5)
+        unknown_path_response = requests.post(f"{server.url}/unknown", data=create_payload(URLS), timeout=5)
+    assert missing_key_response.status_code == HTTPStatus.BAD_REQUEST
+    assert unknown_path_response.status_code == HTTPStatus.NOT_FOUND
+    assert server.statistics.submission_count == 1
+
+
+def test_stand_in_server_limits_payload_size_and_urls_per_request() -> None:
+    payload = create_payload(URLS)
+    with IndexNowStandInServer(max_payload_size=len(payload) - 1) as server:
+        too_large_response = requests.post(server.endpoint, data=payload, timeout=5)
+    with IndexNowStandInServer(max_urls_per_request=10) as server:
+        too_many_response = requests.post(server.endpoint, data=payload, timeout=5)
+        accepted_response = requests.post(server.endpoint, data=create_payload(URLS[:10]), timeout=5)
+    assert too_large_response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert too_many_response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert accepted_response.status_code == HTTPStatus.OK
+
+
+def test_stand_in_server_adds_latency() -> None:
+    with IndexNowStandInServer(latency=0.2, latency_jitter=0.1, seed=1) as server:
+        start = time.perf_counter()
+        response = requests.post(server.endpoint, data=create_payload(URLS), timeout=5)
+        elapsed_time = time.perf_counter() - start
+    assert response.status_code == HTTPStatus.OK
+    assert 0.2 <= elapsed_time < 1
+
+
+def test_stand_in_server_injects_scripted_failures_with_retry_after() -> None:
+    with (
+        IndexNowStandInServer(
+            status_codes=[HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.BAD_GATEWAY], retry_after=1
+        ) as server,
+        IndexNowClient(max_retries=2, backoff_factor=0) as client,
+    ):
+        start = time.perf_counter()
+        result = submit_urls_to_index_now(AUTHENTICATION, URLS, server.endpoint, client)
+        elapsed_time = time.perf_counter() - start
+    assert result.status_code == HTTPStatus.OK
+    assert elapsed_time >= 1
+    assert [request.status_code for request in server.requests] == [
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.OK,
+    ]
+
+
+def test_stand_in_server_with_scripted_and_custom_success_status_codes() -> None:
+    with IndexNowStandInServer(
+        status_codes=[HTTPStatus.NO_CONTENT, HTTPStatus.NO_CONTENT], success_status_code=HTTPStatus.ACCEPTED
+    ) as server:
+        status_codes = [
+            requests.post(server.endpoint, data=create_payload(urls), timeout=5).status_code
+            for urls in [URLS, [], URLS]
+        ]
+    assert status_codes == [HTTPStatus.NO_CONTENT, HTTPStatus.BAD_REQUEST, HTTPStatus.ACCEPTED]
+    assert server.statistics.accepted_url_count == 2 * len(URLS)
+    assert all(request.client_address[0] == "127.0.0.1" for request in server.requests)
+
+
+def test_stand_in_server_only_sends_retry_after_when_throttling() -> None:
+    with IndexNowStandInServer(
+        status_codes=[HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.INTERNAL_SERVER_ERROR], retry_after=5
+    ) as server:
+        throttled_response = requests.post(server.endpoint, data=create_payload(URLS), timeout=5)
+        failed_response = requests.post(server.endpoint, data=create_payload(URLS), timeout=5)
+    assert throttled_response.headers["Retry-After"] == "5"
+    assert "Retry-After" not in failed_response.headers
+
+
+def test_stand_in_server_injects_random_failures_reproducibly() -> None:
+    def count_status_codes(seed: int) -> dict[int, int]:
+        with IndexNowStandInServer(
+            failure_rate=0.5, failure_status_codes=[HTTPStatus.INTERNAL_SERVER_ERROR], seed=seed
+        ) as server:
+            for _ in range(40):
+                requests.post(server.endpoint, data=create_payload(URLS[:1]), timeout=5)
+            return server.statistics.status_code_counts
+
+    status_code_counts = count_status_codes(seed=7)
+    assert status_code_counts == count_status_codes(seed=7)
+    assert set(status_code_counts) == {HTTPStatus.OK, HTTPStatus.INTERNAL_SERVER_ERROR}
+    assert sum(status_code_counts.values()) == 40
+
+
+def test_stand_in_server_reset_statistics_and_without_recording() -> None:
+    with IndexNowStandInServer(record_requests=False) as server:
+        requests.post(server.endpoint, data=create_payload(URLS), timeout=5)
+        assert server.requests == []
+        assert server.statistics.accepted_url_count == len(URLS)
+        server.reset_statistics()
+        assert server.statistics == StandInServerStatistics()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"latency": -1}, {"latency_jitter": -1}, {"failure_rate": 1.5}, {"failure_rate": 0.5, "failure_status_codes": []}],
+)
+def test_stand_in_server_validation_of_arguments(kwargs: dict[str, object]) -> None:
+    with pytest.raises(ValueError):
+        IndexNowStandInServer(**kwargs)  # type: ignore[arg-type]
+
+
+def test_stand_in_server_cannot_be_started_twice() -> None:
+    with IndexNowStandInServer() as server:
+        assert repr(server).startswith(f"IndexNowStandInServer(url={server.url}")
+        with pytest.raises(RuntimeError):
+            server.start()
@@ -0,0 +1,132 @@
+import gc
+import json
+import time
+import weakref
+from http import HTTPStatus
+
+import pytest
+from _mock_data.website import EXAMPLE_WEBSITE
+
+from index_now import BufferedSubmitter, IndexNowClient
+from index_now.testing import IndexNowStandInServer
+from index_now.url.buffer import close_open_submitters
+
+
+def get_submitted_urls(server: IndexNowStandInServer) -> list[list[str]]:
+    return [json.loads(request.body)["urlList"] for request in server.requests]
+
+
+def test_buffered_submitter_flushes_when_max_size_is_reached() -> None:
+    with IndexNowStandInServer() as server, IndexNowClient(max_retries=0) as client:
+        with BufferedSubmitter(
+            EXAMPLE_WEBSITE.authentication, server.endpoint, client, max_size=3, max_delay=60
+        ) as submitter:
+            for i in range(3):
+                submitter.submit(f"https://example.com/page{i}")
+            deadline = time.monotonic() + 5
+            while not server.requests and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(submitter) == 0
+    assert get_submitted_urls(server) == [[f"https://example.com/page{i}" for i in range(3)]]
+
+
+def test_buffered_submitter_flushes_after_max_delay() -> None:
+    with IndexNowStandInServer() as server, IndexNowClient(max_retries=0) as client:
+        with BufferedSubmitter(EXAMPLE_WEBSITE.authentication, server.endpoint, client, max_delay=0.1) as submitter:
+            submitter.submit("https://example.com/page1")
+            submitter.submit("https://example.com/page2")
+            deadline = time.monotonic() + 5
+            while not server.requests and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert get_submitted_urls(server) == [["https://example.com/page1", "https://example.com/page2"]]
+    assert len(server.requests) == 1
+
+
+def test_buffered_submitter_deduplicates_urls_and_flushes_on_close() -> None:
+    with IndexNowStandInServer() as server, IndexNowClient(max_retries=0) as client:
+        submitter = BufferedSubmitter(EXAMPLE_WEBSITE.authentication, server.endpoint, client, max_delay=60)
+        for _ in range(100):
+            submitter.submit("https://example.com/page1")
+            submitter.submit("https://example.com/page2")
+        assert len(submitter) == 2
+        assert not server.requests
+        result = submitter.close()
+        assert result is not None and result.status_code == 200
+        assert get_submitted_urls(server) == [["https://example.com/page1", "https://example.com/page2"]]
+        assert submitter.close() is None
+        with pytest.raises(RuntimeError):
+            submitter.submit("https://example.com/page3")
+
+
+def test_buffered_submitter_flush_of_empty_buffer() -> None:
+    with BufferedSubmitter(EXAMPLE_WEBSITE.authentication) as submitter:
+        assert submitter.flush() is None
+
+
+@pytest.mark.parametrize("max_size, max_delay", [(0, 1.0), (10_001, 1.0), (10, 0.0)])
+def test_buffered_submitter_with_invalid_thresholds(max_size: int, max_delay: float) -> None:
+    with pytest.raises(ValueError):
+        BufferedSubmitter(EXAMPLE_WEBSITE.authentication, max_size=max_size, max_delay=max_delay)
+
+
+def test_buffered_submitter_puts_back_urls_of_failed_flush(caplog: pytest.LogCaptureFixture) -> None:
+    urls = [f"https://example.com/page{i}" for i in range(3)]
+    with IndexNowStandInServer() as server, IndexNowClient(max_retries=0) as client:
+        submitter = BufferedSubmitter(EXAMPLE_WEBSITE.authentication, "http://127.0.0.1:1", client, max_size=3)
+        for url in urls:
+            submitter.submit(url)
+        deadline = time.monotonic() + 5
+        while "Failed to submit 3 buffered URL(s)" not in caplog.text and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "Failed to submit 3 buffered URL(s)" in caplog.text
+        assert len(submitter) == 3
+        submitter.endpoint = server.endpoint
+        result = submitter.close()
+    assert result is not None and result.status_code == 200
+    assert get_submitted_urls(server) == [urls]
+
+
+@pytest.mark.parametrize("status_code", [HTTPStatus.INTERNAL_SERVER_ERROR, HTTPStatus.TOO_MANY_REQUESTS])
+def test_buffered_submitter_puts_back_urls_of_flush_that_failed_temporarily(
+    status_code: int, caplog: pytest.LogCaptureFixture
+) -> None:
+    urls = [f"https://example.com/page{i}" for i in range(3)]
+    message = f"Failed to submit 3 buffered URL(s) with status code {status_code}"
+    with IndexNowStandInServer(status_codes=[status_code]) as server, IndexNowClient(max_retries=0) as client:
+        submitter = BufferedSubmitter(EXAMPLE_WEBSITE.authentication, server.endpoint, client, max_size=3)
+        for url in urls:
+            submitter.submit(url)
+        deadline = time.monotonic() + 5
+        while message not in caplog.text and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert message in caplog.text
+        assert len(submitter) == 3
+        result = submitter.close()
+    assert result is not None and result.status_code == 200
+    assert server.statistics.accepted_url_count == 3
+    assert get_submitted_urls(server) == [urls, urls]
+
+
+def test_buffered_submitter_does_not_retry_urls_that_were_rejected() -> None:
+    urls = [f"https://example.com/page{i}" for i in range(3)]
+    with IndexNowStandInServer(status_codes=[HTTPStatus.FORBIDDEN]) as server, IndexNowClient(max_retries=0) as client:
+        submitter = BufferedSubmitter(EXAMPLE_WEBSITE.authentication, server.endpoint, client, max_size=3)
+        for url in urls:
+            submitter.submit(url)
+        deadline = time.monotonic() + 5
+        while not server.requests and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert submitter.close() is None
+    assert get_submitted_urls(server) == [urls]
+
+
+def test_buffered_submitter_is_closed_at_exit_and_not_kept_alive() -> None:
+    with IndexNowStandInServer() as server, IndexNowClient(max_retries=0) as client:
+        submitter = BufferedSubmitter(EXAMPLE_WEBSITE.authentication, server.endpoint, client, max_delay=60)
+        submitter.submit("https://example.com/page1")
+        close_open_submitters()
+    assert get_submitted_urls(server) == [["https://example.com/page1"]]
+    reference = weakref.ref(submitter)
+    del submitter
+    gc.collect()
+    assert reference() is None
@@ -0,0 +1,50 @@
+from operator import attrgetter
+
+import pytest
+
+from index_now.sitemap.parse import SitemapUrl
+from index_now.url.dedup import UrlDeduplicator
+
+URLS = [f"https://example.com/section{i % 3}/page{i}" for i in range(1_000)]
+
+
+def test_url_deduplicator_add_and_contains() -> None:
+    deduplicator = UrlDeduplicator()
+    assert deduplicator.add(URLS[0]) is True
+    assert deduplicator.add(URLS[0]) is False
+    assert URLS[0] in deduplicator
+    assert URLS[1] not in deduplicator
+    assert 42 not in deduplicator
+    assert len(deduplicator) == 1
+
+
+@pytest.mark.parametrize("expected_count", [0, 10, len(URLS)])
+def test_url_deduplicator_keeps_first_occurrence_in_order(expected_count: int) -> None:
+    urls_with_duplicates = [url for pair in zip(URLS, reversed(URLS)) for url in pair]
+    deduplicator = UrlDeduplicator(expected_count)
+    assert list(deduplicator.filter(urls_with_duplicates)) == urls_with_duplicates[: len(URLS)]
+    assert len(deduplicator) == len(URLS)
+    assert all(url in deduplicator for url in URLS)
+    assert deduplicator.nbytes <= len(URLS) * 32
+
+
+def test_url_deduplicator_resizes_with_add() -> None:
+    deduplicator = UrlDeduplicator()
+    assert all(deduplicator.add(url) for url in URLS)
+    assert not any(deduplicator.add(url) for url in URLS)
+    assert deduplicator.nbytes <= len(URLS) * 32
+
+
+def test_url_deduplicator_filter_with_key() -> None:
+    url_elements = [SitemapUrl(URLS[0], lastmod="2025-01-01"), SitemapUrl(URLS[1]), SitemapUrl(URLS[0])]
+    assert list(UrlDeduplicator().filter(url_elements, key=attrgetter("loc"))) == url_elements[:2]
+
+
+def test_url_deduplicator_filter_presized() -> None:
+    assert list(UrlDeduplicator(len(URLS)).filter([*URLS, *URLS[:100], *URLS[500:]])) == URLS
+    assert list(UrlDeduplicator().filter([])) == []
+
+
+def test_url_deduplicator_with_negative_expected_count() -> None:
+    with pytest.raises(ValueError):
+        UrlDeduplicator(-1)
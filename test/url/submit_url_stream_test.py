@@ -0,0 +1,55 @@
+import json
+from collections.abc import Iterator
+
+from index_now import IndexNowAuthentication, IndexNowClient, submit_url_stream_to_index_now
+from index_now.testing import IndexNowStandInServer
+from index_now.url.submit import iterate_batches
+
+AUTHENTICATION = IndexNowAuthentication(
+    host="example.com", api_key="a1b2c3d4", api_key_location="https://example.com/a1b2c3d4.txt"
+)
+
+URLS = [f"https://example.com/page{i}" for i in range(25)]
+
+
+def test_iterate_batches() -> None:
+    assert list(iterate_batches(iter(URLS), 10)) == [URLS[:10], URLS[10:20], URLS[20:]]
+    assert list(iterate_batches([], 10)) == []
+
+
+def test_submit_url_stream_to_index_now_submits_batches_before_the_stream_ends() -> None:
+    number_of_posts_when_stream_ended: list[int] = []
+
+    def generate_urls(server: IndexNowStandInServer) -> Iterator[str]:
+        yield from URLS
+        number_of_posts_when_stream_ended.append(len(server.requests))
+
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        result = submit_url_stream_to_index_now(
+            AUTHENTICATION, generate_urls(server), server.endpoint, client, batch_size=5, max_concurrent_batches=1
+        )
+    assert result.status_code == 200
+    assert [batch.url_count for batch in result.batches] == [5, 5, 5, 5, 5]
+    # The fourth batch is only submitted once the third batch has been submitted:
+    assert number_of_posts_when_stream_ended[0] >= 3
+    submitted_urls = [url for request in server.requests for url in json.loads(request.body)["urlList"]]
+    assert sorted(submitted_urls) == sorted(URLS)
+
+
+def test_submit_url_stream_to_index_now_keeps_the_order_of_the_batches() -> None:
+    with IndexNowStandInServer(status_codes=[200, 422, 200]) as server, IndexNowClient(max_retries=0) as client:
+        result = submit_url_stream_to_index_now(
+            AUTHENTICATION, iter(URLS), server.endpoint, client, batch_size=10, max_concurrent_batches=1
+        )
+    assert [batch.status_code for batch in result.batches] == [200, 422, 200]
+    assert [batch.url_count for batch in result.batches] == [10, 10, 5]
+    assert result.status_code == 422
+    assert result.submitted_url_count == 15
+
+
+def test_submit_url_stream_to_index_now_with_empty_stream() -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        result = submit_url_stream_to_index_now(AUTHENTICATION, iter([]), server.endpoint, client)
+    assert result.status_code == 204
+    assert result.batches == []
+    assert server.requests == []
@@ -1,7 +1,6 @@
 import pytest
 from _helper.endpoint import TEMPORARILY_SKIPPED_ENDPOINTS, is_endpoint_up
 from _mock_data.website import INDEX_NOW_FOR_PYTHON, INDEX_NOW_FOR_PYTHON_INVALID_API_KEY
-from colorist import Color
 
 from index_now import SearchEngineEndpoint, submit_url_to_index_now
 
@@ -14,17 +13,11 @@ def test_submit_url_to_various_search_engines(endpoint: SearchEngineEndpoint, ca
         pytest.skip(f"Endpoint is not up: {endpoint}")  # pragma: no cover
     status_code = submit_url_to_index_now(
         INDEX_NOW_FOR_PYTHON.authentication, "https://jakob-bagterp.github.io/index-now-for-python/", endpoint=endpoint
-    )
+    ).status_code
     assert status_code in [200, 202]
     terminal_output, _ = capfd.readouterr()
-    assert (
-        f"{Color.GREEN}1 URL was submitted successfully to this IndexNow API endpoint:{Color.OFF} {endpoint}"
-        in terminal_output
-    )
-    assert (
-        f"Status code: {Color.GREEN}200 OK{Color.OFF}"
-        or f"Status code: {Color.GREEN}202 Accepted{Color.OFF}" in terminal_output
-    )
+    assert f"1 URL was submitted successfully to this IndexNow API endpoint: {endpoint}" in terminal_output
+    assert "status code: 200 OK" or "status code: 202 Accepted" in terminal_output
 
 
 def test_submit_url_error_handling_of_invalid_api_key(capfd: object) -> None:
@@ -35,11 +28,8 @@ def test_submit_url_error_handling_of_invalid_api_key(capfd: object) -> None:
         INDEX_NOW_FOR_PYTHON_INVALID_API_KEY.authentication,
         "https://jakob-bagterp.github.io/invalid-url/",
         endpoint=endpoint,
-    )
+    ).status_code
     assert str(status_code).startswith("4")
     terminal_output, _ = capfd.readouterr()
-    assert (
-        f"{Color.YELLOW}Failure. No URL was submitted to this IndexNow API endpoint:{Color.OFF} {endpoint}"
-        in terminal_output
-    )
-    assert f"Status code: {Color.RED}4" in terminal_output
+    assert f"Failure. No URL was submitted to this IndexNow API endpoint: {endpoint}" in terminal_output
+    assert "(status code: 4" in terminal_output
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+from _mock_data.website import EXAMPLE_WEBSITE
+
+from index_now import IndexNowClient, submit_urls_to_index_now
+from index_now.testing import IndexNowStandInServer
+from index_now.url.submit import split_urls_into_batches
+
+URLS = [f"https://example.com/page{i}" for i in range(25)]
+
+
+@pytest.mark.parametrize(
+    "urls, batch_size, expected",
+    [
+        ([], 10, [[]]),
+        (URLS[:3], 10, [URLS[:3]]),
+        (URLS[:10], 10, [URLS[:10]]),
+        (URLS, 10, [URLS[:10], URLS[10:20], URLS[20:]]),
+        (URLS[:3], 1, [[URLS[0]], [URLS[1]], [URLS[2]]]),
+    ],
+)
+def test_split_urls_into_batches(urls: list[str], batch_size: int, expected: list[list[str]]) -> None:
+    assert split_urls_into_batches(urls, batch_size) == expected
+
+
+@pytest.mark.parametrize("max_concurrent_batches", [1, 2, 8])
+def test_submit_urls_to_index_now_in_batches(max_concurrent_batches: int, capfd: object) -> None:
+    with IndexNowStandInServer() as server, IndexNowClient() as client:
+        result = submit_urls_to_index_now(
+            EXAMPLE_WEBSITE.authentication,
+            URLS,
+            server.endpoint,
+            client,
+            batch_size=10,
+            max_concurrent_batches=max_concurrent_batches,
+        )
+    assert result.is_success
+    assert result.status_code == 200
+    assert result.endpoint == server.endpoint
+    assert [batch.url_count for batch in result.batches] == [10, 10, 5]
+    assert result.url_count == result.submitted_url_count == 25
+    submitted_urls = sorted(url for request in server.requests for url in json.loads(request.body)["urlList"])
+    assert submitted_urls == sorted(URLS)
+    terminal_output, _ = capfd.readouterr()
+    assert f"25 URL(s) were submitted successfully to this IndexNow API endpoint: {server.endpoint}" in terminal_output
+    assert "batches: 3)" in terminal_output
+
+
+def test_submit_urls_to_index_now_failure_of_all_batches(capfd: object) -> None:
+    with IndexNowStandInServer(failure_rate=1, failure_status_codes=[403]) as server, IndexNowClient() as client:
+        result = submit_urls_to_index_now(EXAMPLE_WEBSITE.authentication, URLS, server.endpoint, client, batch_size=10)
+    assert not result.is_success
+    assert result.status_code == 403
+    assert result.submitted_url_count == 0
+    terminal_output, _ = capfd.readouterr()
+    assert f"Failure. No URL(s) were submitted to this IndexNow API endpoint: {server.endpoint}" in terminal_output
+
+
+@pytest.mark.parametrize("batch_size, max_concurrent_batches", [(0, 1), (10_001, 1), (10, 0)])
+def test_submit_urls_to_index_now_validation_of_arguments(batch_size: int, max_concurrent_batches: int) -> None:
+    with pytest.raises(ValueError):
+        submit_urls_to_index_now(
+            EXAMPLE_WEBSITE.authentication, URLS, batch_size=batch_size, max_concurrent_batches=max_concurrent_batches
+        )
@@ -0,0 +1,45 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from _mock_data.website import EXAMPLE_WEBSITE
+
+from index_now import IndexNowClient, submit_urls_to_multiple_endpoints
+from index_now.testing import IndexNowStandInServer
+
+URLS = [f"https://example.com/page{i}" for i in range(25)]
+
+
+@pytest.mark.parametrize("max_concurrent_requests", [1, 4, 16])
+def test_submit_urls_to_multiple_endpoints(max_concurrent_requests: int) -> None:
+    with (
+        IndexNowStandInServer() as server1,
+        IndexNowStandInServer(success_status_code=HTTPStatus.ACCEPTED) as server2,
+        IndexNowStandInServer(failure_rate=1, failure_status_codes=[HTTPStatus.TOO_MANY_REQUESTS]) as server3,
+        IndexNowClient(max_retries=0) as client,
+    ):
+        endpoints = [server1.endpoint, server2.endpoint, server3.endpoint]
+        results = submit_urls_to_multiple_endpoints(
+            EXAMPLE_WEBSITE.authentication,
+            URLS,
+            endpoints,
+            client=client,
+            batch_size=10,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+    assert list(results) == endpoints
+    assert [result.status_code for result in results.values()] == [200, 202, 429]
+    assert [result.submitted_url_count for result in results.values()] == [25, 25, 0]
+    for server in [server1, server2, server3]:
+        bodies = sorted((request.body for request in server.requests), key=lambda body: json.loads(body)["urlList"])
+        assert [json.loads(body)["urlList"] for body in bodies] == [URLS[:10], URLS[10:20], URLS[20:]]
+    assert sorted(request.body for request in server1.requests) == sorted(request.body for request in server2.requests)
+
+
+def test_submit_urls_to_multiple_endpoints_without_endpoints() -> None:
+    assert submit_urls_to_multiple_endpoints(EXAMPLE_WEBSITE.authentication, URLS, []) == {}
+
+
+def test_submit_urls_to_multiple_endpoints_validation_of_arguments() -> None:
+    with pytest.raises(ValueError):
+        submit_urls_to_multiple_endpoints(EXAMPLE_WEBSITE.authentication, URLS, ["http://localhost"], batch_size=0)
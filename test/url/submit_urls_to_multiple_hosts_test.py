@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from index_now import AuthenticationRegistry, IndexNowAuthentication, submit_urls_to_multiple_hosts
+from index_now.testing import IndexNowStandInServer
+
+REGISTRY = AuthenticationRegistry(
+    IndexNowAuthentication(f"example{i}.com", f"a1b2c3d{i}", f"https://example{i}.com/a1b2c3d{i}.txt") for i in range(3)
+)
+
+URLS = [f"https://example{i % 3}.com/page{i}" for i in range(30)]
+
+
+@pytest.mark.parametrize("max_concurrent_requests", [1, 8])
+def test_submit_urls_to_multiple_hosts(max_concurrent_requests: int) -> None:
+    with IndexNowStandInServer() as server:
+        results = submit_urls_to_multiple_hosts(
+            REGISTRY, iter(URLS), server.endpoint, batch_size=4, max_concurrent_requests=max_concurrent_requests
+        )
+    assert list(results) == ["example0.com", "example1.com", "example2.com"]
+    assert all(result.status_code == 200 for result in results.values())
+    assert [len(result.batches) for result in results.values()] == [3, 3, 3]
+    assert [result.submitted_url_count for result in results.values()] == [10, 10, 10]
+    payloads = [json.loads(request.body) for request in server.requests]
+    assert len(payloads) == 9
+    for payload in payloads:
+        host = payload["host"]
+        assert payload["key"] == REGISTRY.authentications[host].api_key
+        assert all(url.startswith(f"https://{host}/") for url in payload["urlList"])
+    submitted_urls = {url for payload in payloads for url in payload["urlList"]}
+    assert submitted_urls == set(URLS)
+
+
+def test_submit_urls_to_multiple_hosts_skips_unregistered_hosts(caplog: pytest.LogCaptureFixture) -> None:
+    with IndexNowStandInServer() as server:
+        results = submit_urls_to_multiple_hosts(
+            REGISTRY, ["https://example0.com/page1", "https://example.net/page1"], server.endpoint
+        )
+    assert list(results) == ["example0.com"]
+    assert json.loads(server.requests[0].body)["urlList"] == ["https://example0.com/page1"]
+    assert any(message.startswith("Skipped 1 URL(s) of hosts without") for message in caplog.messages)
+
+
+def test_submit_urls_to_multiple_hosts_without_registered_urls() -> None:
+    assert submit_urls_to_multiple_hosts(REGISTRY, ["https://example.net/page1"]) == {}
+    assert submit_urls_to_multiple_hosts(REGISTRY, []) == {}
+
+
+def test_submit_urls_to_multiple_hosts_with_invalid_batch_size() -> None:
+    with pytest.raises(ValueError):
+        submit_urls_to_multiple_hosts(REGISTRY, URLS, batch_size=0)